@@ -0,0 +1,21 @@
+"""Shared setup for the examples
+
+Importing this module makes the in-repo standx_sdk package importable and
+loads variables from the project's .env (if python-dotenv is installed),
+replacing the prelude each example used to repeat.
+"""
+
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENV_FILE = os.path.join(PROJECT_ROOT, ".env")
+
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+# Load the project's .env directly rather than searching up from the working
+# directory; the SDK clients then see it as already loaded and skip their lookup
+from standx_sdk._bootstrap import load
+
+load(ENV_FILE)
@@ -0,0 +1,40 @@
+"""Numeric column helpers for the examples
+
+The SDK models keep numeric fields as API strings (or None). Rendering
+code that needs numbers converts each field of each row with
+`float(x) if x else 0`. column() converts one field for all rows in a
+single pass, into a float64 NumPy array when numpy is installed (so totals
+are a vectorized .sum()) or a plain list otherwise.
+
+Optional: pip install numpy
+"""
+
+from typing import Iterable, List, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def column(items: List, attr: str) -> Union["np.ndarray", List[float]]:
+    """
+    Convert one numeric attribute of every item to floats (missing values become 0.0)
+
+    Args:
+        items: Model objects (e.g. Position, Order, Trade)
+        attr: Attribute name holding a numeric string
+
+    Returns:
+        float64 array if numpy is installed, else a list of floats
+    """
+    # SDK models parse and cache the value once via num(); plain objects fall back to float()
+    values = (item.num(attr) if hasattr(item, "num") else float(getattr(item, attr) or 0) for item in items)
+    if np is not None:
+        return np.fromiter(values, dtype=np.float64, count=len(items))
+    return list(values)
+
+
+def total(values: Iterable[float]) -> float:
+    """Sum a column from column()"""
+    return float(values.sum()) if np is not None and isinstance(values, np.ndarray) else float(sum(values))
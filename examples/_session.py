@@ -0,0 +1,19 @@
+"""Shared HTTP session for the examples
+
+Creates one keep-alive requests.Session with a pooled adapter so that every
+API call made by an example reuses the same TCP+TLS connection instead of
+opening a new one per request.
+"""
+
+import requests
+from standx_sdk import create_session
+
+
+def make_session() -> requests.Session:
+    """
+    Create a pooled keep-alive session
+
+    Returns:
+        requests.Session from standx_sdk.create_session()
+    """
+    return create_session()
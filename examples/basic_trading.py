@@ -9,20 +9,14 @@ This example demonstrates basic trading operations:
 All credentials are loaded from .env file automatically.
 """
 
-import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _bootstrap  # noqa: F401 - puts the SDK on sys.path and loads .env
 
 from standx_sdk import StandXClient, StandXWalletClient, OrderSide, OrderType, TimeInForce
+from _session import make_session
 
-# Load environment variables
-# Option 1: Use python-dotenv (recommended)
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    # Option 2: Set environment variables manually or use system env
-    pass
+# One keep-alive session shared by every request below
+session = make_session()
 
 # Initialize client with credentials from environment
 # Prefer StandXWalletClient (auto-generates credentials from private key)
@@ -30,7 +24,9 @@ private_key = os.getenv("STANDX_PRIVATE_KEY")
 if private_key:
     client = StandXWalletClient(
         private_key=private_key,
-        chain=os.getenv("STANDX_CHAIN", "bsc")
+        chain=os.getenv("STANDX_CHAIN", "bsc"),
+        session=session,
+        cache_jwt=True  # Reuse JWT from ~/.standx/jwt_cache.json while still valid
     )
     print(f"Using StandXWalletClient with wallet: {client.wallet_address}")
 else:
@@ -39,7 +35,8 @@ else:
         jwt_token=os.getenv("STANDX_JWT_TOKEN"),
         api_key=os.getenv("STANDX_API_KEY"),
         api_secret=os.getenv("STANDX_API_SECRET"),
-        session_id=os.getenv("STANDX_SESSION_ID")  # Optional
+        session_id=os.getenv("STANDX_SESSION_ID"),  # Optional
+        session=session
     )
 
 # Query current price
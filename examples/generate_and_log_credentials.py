@@ -5,27 +5,32 @@ in a format that can be used in other examples. It demonstrates:
 - JWT token generation
 - Wallet address derivation
 - Credential logging and formatting
-- Credential validation
+- Credential validation (with --verify)
 
 Run this first to generate credentials, then use them in other examples.
 """
 
 import sys
 import os
-import json
+import traceback
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _bootstrap  # noqa: F401 - puts the SDK on sys.path and loads .env
 
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
+# This is a one-shot script with no prompts, so block-buffer stdout and let
+# the many print() calls reach the terminal in a few writes instead of one per line
+sys.stdout.reconfigure(line_buffering=False, write_through=False)
 
 from standx_sdk.wallet_auth import StandXWalletAuth
-from eth_account import Account
-from standx_sdk import StandXWalletClient
+from standx_sdk.jwt_cache import load_cached_jwt, save_cached_jwt
+from standx_sdk._json import dumps
+from standx_sdk import StandXClient
+
+parser = argparse.ArgumentParser(description="Generate and log StandX API credentials")
+parser.add_argument("--verify", action="store_true", help="Verify the credentials with live API calls")
+args = parser.parse_args()
 
 print("=" * 80)
 print("StandX API Credential Generator")
@@ -46,8 +51,7 @@ if not private_key:
 # Derive wallet address
 print("Step 1: Deriving wallet address...")
 if chain in ["bsc", "ethereum"]:
-    account = Account.from_key(private_key)
-    wallet_address = account.address
+    wallet_address = StandXWalletAuth.derive_wallet_address(private_key)
     print(f"  [OK] Wallet Address: {wallet_address}")
 elif chain == "solana":
     print(f"[ERROR] Solana address derivation not implemented yet")
@@ -63,49 +67,58 @@ print()
 # Generate JWT token
 print("Step 2: Generating JWT token...")
 try:
-    auth = StandXWalletAuth(chain=chain)
-    jwt_token = auth.get_jwt_token(
-        wallet_address=wallet_address,
-        private_key=private_key,
-        chain=chain,
-        expires_seconds=604800  # 7 days
-    )
-    
-    print(f"  [OK] JWT Token Generated")
+    # Reuse a still-valid token from a previous run if there is one
+    cached = load_cached_jwt(wallet_address, chain)
+    if cached:
+        jwt_token, ed25519_private_key_bytes = cached
+        print(f"  [OK] JWT Token Loaded from cache")
+    else:
+        auth = StandXWalletAuth(chain=chain)
+        jwt_token = auth.get_jwt_token(
+            wallet_address=wallet_address,
+            private_key=private_key,
+            chain=chain,
+            expires_seconds=604800  # 7 days
+        )
+        ed25519_private_key_bytes = auth._ed25519_private_key_bytes
+        save_cached_jwt(wallet_address, chain, jwt_token, ed25519_private_key_bytes, 604800)
+        print(f"  [OK] JWT Token Generated")
     print(f"  [OK] Token Length: {len(jwt_token)} characters")
     print(f"  [OK] Token Preview: {jwt_token[:50]}...{jwt_token[-20:]}")
     print()
     
-    # Get ed25519 keys info
-    ed25519_private_key_bytes = auth._ed25519_private_key_bytes
+    # ed25519 keys info
     if ed25519_private_key_bytes:
         print("Step 3: ed25519 Key Pair (for body signatures)...")
         print(f"  [OK] Private Key Bytes Length: {len(ed25519_private_key_bytes)}")
         print(f"  [OK] Private Key Hex: {ed25519_private_key_bytes.hex()[:50]}...")
         print()
     
-    # Initialize client to verify credentials work
-    print("Step 4: Verifying credentials...")
-    client = StandXWalletClient(
-        private_key=private_key,
-        chain=chain
-    )
-    
-    # Test public endpoint
-    try:
-        price = client.query_symbol_price("BTC-USD")
-        print(f"  [OK] Public API Access: OK")
-        print(f"  [OK] BTC Price: ${price.last_price}")
-    except Exception as e:
-        print(f"  [ERROR] Public API Access Failed: {e}")
-    
-    # Test authenticated endpoint
-    try:
-        positions = client.query_positions()
-        print(f"  [OK] Authenticated API Access: OK")
-        print(f"  [OK] Positions Count: {len(positions)}")
-    except Exception as e:
-        print(f"  [ERROR] Authenticated API Access Failed: {e}")
+    # Verifying makes live API calls, so it only runs when asked for
+    if args.verify:
+        print("Step 4: Verifying credentials...")
+        client = StandXClient(jwt_token=jwt_token, ed25519_private_key=ed25519_private_key_bytes)
+        
+        # Test public and authenticated endpoints concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            price_future = executor.submit(client.query_symbol_price, "BTC-USD")
+            positions_future = executor.submit(client.query_positions)
+        
+        try:
+            price = price_future.result()
+            print(f"  [OK] Public API Access: OK")
+            print(f"  [OK] BTC Price: ${price.last_price}")
+        except Exception as e:
+            print(f"  [ERROR] Public API Access Failed: {e}")
+        
+        try:
+            positions = positions_future.result()
+            print(f"  [OK] Authenticated API Access: OK")
+            print(f"  [OK] Positions Count: {len(positions)}")
+        except Exception as e:
+            print(f"  [ERROR] Authenticated API Access Failed: {e}")
+    else:
+        print("Step 4: Skipping verification (run with --verify to test the credentials)")
     
     print()
     
@@ -127,7 +140,8 @@ try:
     
     print("JSON Format (for programmatic use):")
     print("-" * 80)
-    print(json.dumps(credentials, indent=2))
+    credentials_json = dumps(credentials, indent=True)
+    print(credentials_json)
     print()
     
     print("Environment Variables Format (for .env file):")
@@ -160,7 +174,7 @@ try:
     examples_dir = os.path.dirname(os.path.abspath(__file__))
     output_file = os.path.join(examples_dir, "generated_credentials.json")
     with open(output_file, "w") as f:
-        json.dump(credentials, f, indent=2)
+        f.write(credentials_json)
     print(f"[OK] Credentials saved to: {output_file}")
     print()
     
@@ -183,7 +197,6 @@ try:
     
 except Exception as e:
     print(f"\n[ERROR] Failed to generate credentials: {e}")
-    import traceback
     traceback.print_exc()
     sys.exit(1)
 
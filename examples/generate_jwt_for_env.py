@@ -10,16 +10,16 @@ or use StandXClient directly.
 
 import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import traceback
+import _bootstrap  # noqa: F401 - puts the SDK on sys.path and loads .env
 
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
+# This is a one-shot script with no prompts, so block-buffer stdout and let
+# the many print() calls reach the terminal in a few writes instead of one per line
+sys.stdout.reconfigure(line_buffering=False, write_through=False)
 
+from standx_sdk import StandXClient
 from standx_sdk.wallet_auth import StandXWalletAuth
-from eth_account import Account
+from standx_sdk.jwt_cache import load_cached_jwt, save_cached_jwt
 
 print("=" * 70)
 print("Generate JWT Token for .env File")
@@ -37,8 +37,7 @@ if not private_key:
 
 # Derive wallet address
 if chain in ["bsc", "ethereum"]:
-    account = Account.from_key(private_key)
-    wallet_address = account.address
+    wallet_address = StandXWalletAuth.derive_wallet_address(private_key)
 else:
     print(f"[ERROR] Chain {chain} not supported for address derivation")
     sys.exit(1)
@@ -53,15 +52,21 @@ print("Generating JWT Token...")
 print("=" * 70)
 
 try:
-    auth = StandXWalletAuth(chain=chain)
-    jwt_token = auth.get_jwt_token(
-        wallet_address=wallet_address,
-        private_key=private_key,
-        chain=chain,
-        expires_seconds=604800  # 7 days
-    )
-    
-    print("\n[SUCCESS] JWT token generated!")
+    # Reuse a still-valid token from a previous run if there is one
+    cached = load_cached_jwt(wallet_address, chain)
+    if cached:
+        jwt_token = cached[0]
+        print("\n[SUCCESS] JWT token loaded from cache!")
+    else:
+        auth = StandXWalletAuth(chain=chain)
+        jwt_token = auth.get_jwt_token(
+            wallet_address=wallet_address,
+            private_key=private_key,
+            chain=chain,
+            expires_seconds=604800  # 7 days
+        )
+        save_cached_jwt(wallet_address, chain, jwt_token, auth._ed25519_private_key_bytes, 604800)
+        print("\n[SUCCESS] JWT token generated!")
     print(f"\nToken Length: {len(jwt_token)} characters")
     print(f"Token Preview: {jwt_token[:50]}...{jwt_token[-20:]}")
     
@@ -89,7 +94,6 @@ try:
     print("Verifying token...")
     print("=" * 70)
     
-    from standx_sdk import StandXClient
     test_client = StandXClient(jwt_token=jwt_token)
     try:
         price = test_client.query_symbol_price("BTC-USD")
@@ -101,7 +105,6 @@ try:
     
 except Exception as e:
     print(f"\n[ERROR] Failed to generate JWT token: {e}")
-    import traceback
     traceback.print_exc()
     sys.exit(1)
 
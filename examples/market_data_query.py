@@ -14,17 +14,23 @@ Run examples/generate_and_log_credentials.py first to generate credentials.
 
 import sys
 import os
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _bootstrap  # noqa: F401 - puts the SDK on sys.path and loads .env
 
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
+from standx_sdk.client_factory import get_default_client
+from standx_sdk.types import Resolution
+from standx_sdk.http2 import http2_available
+from _session import make_session
+from _klines import klines_to_frame, pandas_available
 
-from standx_sdk import StandXWalletClient
+# Per-symbol output goes through logging so it can be silenced for large
+# symbol lists or headless runs: STANDX_LOG_LEVEL=WARNING python market_data_query.py
+logging.basicConfig(level=os.getenv("STANDX_LOG_LEVEL", "INFO").upper(), format="%(message)s")
+log = logging.getLogger("standx.market")
 
 print("=" * 80)
 print("Market Data Query Example")
@@ -38,9 +44,14 @@ if not private_key:
     print("Please run: python examples/generate_and_log_credentials.py")
     sys.exit(1)
 
-client = StandXWalletClient(
+# One multiplexed HTTP/2 connection (httpx) for the query burst below,
+# or a keep-alive requests session when httpx[http2] is not installed
+client = get_default_client(
     private_key=private_key,
-    chain=os.getenv("STANDX_CHAIN", "bsc")
+    chain=os.getenv("STANDX_CHAIN", "bsc"),
+    session=None if http2_available() else make_session(),
+    http2=True,
+    cache_jwt=True  # Reuse JWT from ~/.standx/jwt_cache.json while still valid
 )
 
 print(f"Connected with wallet: {client.wallet_address}")
@@ -50,106 +61,125 @@ print()
 symbols = ["BTC-USD"]  # Add more symbols as needed
 
 for symbol in symbols:
-    print("=" * 80)
-    print(f"Market Data for {symbol}")
-    print("=" * 80)
-    print()
+    # The queries below are independent, so issue them concurrently and
+    # print the results in order as they are collected below
+    now = datetime.now()
+    end_time = int(now.timestamp() * 1000)
+    start_time = int((now - timedelta(hours=5)).timestamp() * 1000)
+    
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        futures = {
+            "info": executor.submit(client.query_symbol_info, symbol),
+            "price": executor.submit(client.query_symbol_price, symbol),
+            "depth": executor.submit(client.query_depth_book, symbol, limit=5),
+            "trades": executor.submit(client.query_recent_trades, symbol, limit=5),
+            "klines": executor.submit(
+                client.get_kline_history,
+                symbol=symbol,
+                resolution=Resolution.HOUR_1,
+                from_time=start_time,
+                to_time=end_time,
+                limit=5
+            ),
+        }
+    
+    log.info("=" * 80)
+    log.info("Market Data for %s", symbol)
+    log.info("=" * 80)
+    log.info("")
     
     # 1. Symbol Information
-    print("1. Symbol Information:")
-    print("-" * 80)
+    log.info("1. Symbol Information:")
+    log.info("-" * 80)
     try:
-        symbol_info = client.query_symbol_info(symbol)
-        print(f"   Symbol: {symbol_info.symbol}")
-        print(f"   Base: {symbol_info.base}")
-        print(f"   Quote: {symbol_info.quote}")
-        print(f"   Min Qty: {symbol_info.min_qty}")
-        print(f"   Max Qty: {symbol_info.max_qty}")
-        print(f"   Tick Size: {symbol_info.tick_size}")
-        print(f"   Step Size: {symbol_info.step_size}")
-        print(f"   Status: {symbol_info.status}")
+        symbol_info = futures["info"].result()
+        log.info("   Symbol: %s", symbol_info.symbol)
+        log.info("   Base: %s", symbol_info.base)
+        log.info("   Quote: %s", symbol_info.quote)
+        log.info("   Min Qty: %s", symbol_info.min_qty)
+        log.info("   Max Qty: %s", symbol_info.max_qty)
+        log.info("   Tick Size: %s", symbol_info.tick_size)
+        log.info("   Step Size: %s", symbol_info.step_size)
+        log.info("   Status: %s", symbol_info.status)
     except Exception as e:
-        print(f"   Error: {e}")
-    print()
+        log.error("   Error: %s", e)
+    log.info("")
     
     # 2. Current Price
-    print("2. Current Price:")
-    print("-" * 80)
+    log.info("2. Current Price:")
+    log.info("-" * 80)
     try:
-        price = client.query_symbol_price(symbol)
-        print(f"   Last Price: ${price.last_price}")
-        print(f"   Index Price: ${price.index_price}")
-        print(f"   Mark Price: ${price.mark_price}")
-        print(f"   Mid Price: ${price.mid_price}")
-        print(f"   Base: {price.base}")
-        print(f"   Quote: {price.quote}")
+        price = futures["price"].result()
+        log.info("   Last Price: $%s", price.last_price)
+        log.info("   Index Price: $%s", price.index_price)
+        log.info("   Mark Price: $%s", price.mark_price)
+        log.info("   Mid Price: $%s", price.mid_price)
+        log.info("   Base: %s", price.base)
+        log.info("   Quote: %s", price.quote)
     except Exception as e:
-        print(f"   Error: {e}")
-    print()
+        log.error("   Error: %s", e)
+    log.info("")
     
     # 3. Order Book Depth
-    print("3. Order Book Depth (Top 5 levels):")
-    print("-" * 80)
+    log.info("3. Order Book Depth (Top 5 levels):")
+    log.info("-" * 80)
     try:
-        depth = client.query_depth_book(symbol, limit=5)
-        print("   Bids (Buy Orders):")
+        depth = futures["depth"].result()
+        log.info("   Bids (Buy Orders):")
         if depth.bids:
             for i, bid in enumerate(depth.bids[:5], 1):
-                print(f"     {i}. Price: ${bid[0]}, Size: {bid[1]}")
-        print("   Asks (Sell Orders):")
+                log.info("     %d. Price: $%s, Size: %s", i, bid[0], bid[1])
+        log.info("   Asks (Sell Orders):")
         if depth.asks:
             for i, ask in enumerate(depth.asks[:5], 1):
-                print(f"     {i}. Price: ${ask[0]}, Size: {ask[1]}")
+                log.info("     %d. Price: $%s, Size: %s", i, ask[0], ask[1])
     except Exception as e:
-        print(f"   Error: {e}")
-    print()
+        log.error("   Error: %s", e)
+    log.info("")
     
     # 4. Recent Trades
-    print("4. Recent Trades (Last 5):")
-    print("-" * 80)
+    log.info("4. Recent Trades (Last 5):")
+    log.info("-" * 80)
     try:
-        trades = client.query_recent_trades(symbol, limit=5)
-        for i, trade in enumerate(trades, 1):
-            time_str = datetime.fromtimestamp(trade.timestamp / 1000).strftime('%Y-%m-%d %H:%M:%S') if trade.timestamp else 'N/A'
-            print(f"   {i}. Price: ${trade.price}, Size: {trade.qty}, Side: {trade.side}, Time: {time_str}")
+        trades = futures["trades"].result()
+        # Skip the per-trade time formatting entirely when INFO is filtered out
+        if log.isEnabledFor(logging.INFO):
+            for i, trade in enumerate(trades, 1):
+                time_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(trade.timestamp / 1000)) if trade.timestamp else 'N/A'
+                log.info("   %d. Price: $%s, Size: %s, Side: %s, Time: %s",
+                         i, trade.price, trade.qty, trade.side, time_str)
     except Exception as e:
-        print(f"   Error: {e}")
-    print()
+        log.error("   Error: %s", e)
+    log.info("")
     
     # 5. Funding Rates
-    print("5. Funding Rates:")
-    print("-" * 80)
-    try:
-        # Note: Funding rates endpoint may require start_time parameter
-        # For now, we'll skip this or handle the error gracefully
-        print("   Note: Funding rates query may require additional parameters")
-        print("   Skipping for now to avoid API errors")
-    except Exception as e:
-        print(f"   Error: {e}")
-    print()
+    log.info("5. Funding Rates:")
+    log.info("-" * 80)
+    # Note: Funding rates endpoint may require start_time parameter
+    # For now, we'll skip this or handle the error gracefully
+    log.info("   Note: Funding rates query may require additional parameters")
+    log.info("   Skipping for now to avoid API errors")
+    log.info("")
     
     # 6. Kline/Candlestick Data
-    print("6. Kline Data (Last 5 candles, 1 hour):")
-    print("-" * 80)
+    log.info("6. Kline Data (Last 5 candles, 1 hour):")
+    log.info("-" * 80)
     try:
-        from standx_sdk.types import Resolution
-        end_time = int(datetime.now().timestamp() * 1000)
-        start_time = int((datetime.now() - timedelta(hours=5)).timestamp() * 1000)
-        
-        klines = client.get_kline_history(
-            symbol=symbol,
-            resolution=Resolution.HOUR_1,
-            from_time=start_time,
-            to_time=end_time,
-            limit=5
-        )
-        for i, kline in enumerate(klines, 1):
-            print(f"   {i}. Time: {datetime.fromtimestamp(kline.time / 1000)}, "
-                  f"Open: ${kline.open}, High: ${kline.high}, "
-                  f"Low: ${kline.low}, Close: ${kline.close}, Volume: {kline.volume}")
+        klines = futures["klines"].result()
+        if log.isEnabledFor(logging.INFO):
+            if pandas_available():
+                # Column-wise conversion; pays off when the limit is raised to thousands
+                times = klines_to_frame(klines)["time"]
+            else:
+                times = (datetime.fromtimestamp(k.time / 1000) for k in klines)
+            # Prices are shown as the API's strings, not the frame's floats
+            rows = ((kline_time, k.open, k.high, k.low, k.close, k.volume) for kline_time, k in zip(times, klines))
+            for i, (kline_time, open_, high, low, close, volume) in enumerate(rows, 1):
+                log.info("   %d. Time: %s, Open: $%s, High: $%s, Low: $%s, Close: $%s, Volume: %s",
+                         i, kline_time, open_, high, low, close, volume)
     except Exception as e:
-        print(f"   Error: {e}")
-    print()
+        log.error("   Error: %s", e)
+    log.info("")
 
 print("=" * 80)
 print("Market Data Query Complete!")
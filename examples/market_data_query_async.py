@@ -0,0 +1,150 @@
+"""Market Data Query Example (async)
+
+Async variant of market_data_query.py. All independent queries for every
+symbol are issued together with asyncio.gather() over a single aiohttp
+connection pool, so the whole run takes roughly one round-trip.
+
+Requires aiohttp: pip install aiohttp
+Optional: pip install uvloop for a faster event loop
+
+Run examples/generate_and_log_credentials.py first to generate credentials.
+"""
+
+import sys
+import os
+import time
+import asyncio
+
+# Use uvloop's libuv event loop when installed (faster socket handling);
+# the coroutines below run unchanged on the default loop otherwise
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+from datetime import datetime, timedelta
+
+import _bootstrap  # noqa: F401 - puts the SDK on sys.path and loads .env
+
+from standx_sdk import AsyncStandXWalletClient
+from standx_sdk.types import Resolution
+
+
+async def fetch_all(client, symbol, start_time, end_time):
+    """Fetch all market data for one symbol concurrently"""
+    return await asyncio.gather(
+        client.query_symbol_info(symbol),
+        client.query_symbol_price(symbol),
+        client.query_depth_book(symbol, limit=5),
+        client.query_recent_trades(symbol, limit=5),
+        client.get_kline_history(
+            symbol=symbol,
+            resolution=Resolution.HOUR_1,
+            from_time=start_time,
+            to_time=end_time,
+            limit=5
+        ),
+        return_exceptions=True
+    )
+
+
+def print_result(title, result, render):
+    """Print one section, or the error if that query failed"""
+    print(title)
+    print("-" * 80)
+    if isinstance(result, Exception):
+        print(f"   Error: {result}")
+    else:
+        render(result)
+    print()
+
+
+def render_info(symbol_info):
+    print(f"   Symbol: {symbol_info.symbol}")
+    print(f"   Base: {symbol_info.base}")
+    print(f"   Quote: {symbol_info.quote}")
+    print(f"   Min Qty: {symbol_info.min_qty}")
+    print(f"   Max Qty: {symbol_info.max_qty}")
+    print(f"   Tick Size: {symbol_info.tick_size}")
+    print(f"   Step Size: {symbol_info.step_size}")
+    print(f"   Status: {symbol_info.status}")
+
+
+def render_price(price):
+    print(f"   Last Price: ${price.last_price}")
+    print(f"   Index Price: ${price.index_price}")
+    print(f"   Mark Price: ${price.mark_price}")
+    print(f"   Mid Price: ${price.mid_price}")
+
+
+def render_depth(depth):
+    print("   Bids (Buy Orders):")
+    for i, bid in enumerate((depth.bids or [])[:5], 1):
+        print(f"     {i}. Price: ${bid[0]}, Size: {bid[1]}")
+    print("   Asks (Sell Orders):")
+    for i, ask in enumerate((depth.asks or [])[:5], 1):
+        print(f"     {i}. Price: ${ask[0]}, Size: {ask[1]}")
+
+
+def render_trades(trades):
+    for i, trade in enumerate(trades, 1):
+        time_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(trade.timestamp / 1000)) if trade.timestamp else 'N/A'
+        print(f"   {i}. Price: ${trade.price}, Size: {trade.qty}, Side: {trade.side}, Time: {time_str}")
+
+
+def render_klines(klines):
+    for i, kline in enumerate(klines, 1):
+        print(f"   {i}. Time: {datetime.fromtimestamp(kline.time / 1000)}, "
+              f"Open: ${kline.open}, High: ${kline.high}, "
+              f"Low: ${kline.low}, Close: ${kline.close}, Volume: {kline.volume}")
+
+
+async def main():
+    private_key = os.getenv("STANDX_PRIVATE_KEY")
+    if not private_key:
+        print("[ERROR] STANDX_PRIVATE_KEY not found in .env file")
+        print("Please run: python examples/generate_and_log_credentials.py")
+        sys.exit(1)
+
+    # Example symbols to query
+    symbols = ["BTC-USD"]  # Add more symbols as needed
+
+    now = datetime.now()
+    end_time = int(now.timestamp() * 1000)
+    start_time = int((now - timedelta(hours=5)).timestamp() * 1000)
+
+    async with AsyncStandXWalletClient(
+        private_key=private_key,
+        chain=os.getenv("STANDX_CHAIN", "bsc"),
+        cache_jwt=True  # Reuse JWT from ~/.standx/jwt_cache.json while still valid
+    ) as client:
+        print(f"Connected with wallet: {client.wallet_address}")
+        print()
+
+        results = await asyncio.gather(
+            *[fetch_all(client, symbol, start_time, end_time) for symbol in symbols]
+        )
+
+    for symbol, (info, price, depth, trades, klines) in zip(symbols, results):
+        print("=" * 80)
+        print(f"Market Data for {symbol}")
+        print("=" * 80)
+        print()
+        print_result("1. Symbol Information:", info, render_info)
+        print_result("2. Current Price:", price, render_price)
+        print_result("3. Order Book Depth (Top 5 levels):", depth, render_depth)
+        print_result("4. Recent Trades (Last 5):", trades, render_trades)
+        print_result("5. Kline Data (Last 5 candles, 1 hour):", klines, render_klines)
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("Market Data Query Example (async)")
+    print("=" * 80)
+    print()
+
+    asyncio.run(main())
+
+    print("=" * 80)
+    print("Market Data Query Complete!")
+    print("=" * 80)
@@ -0,0 +1,84 @@
+"""Market Data Stream Example
+
+Streaming alternative to polling market_data_query.py in a loop:
+- Subscribe once to price and order book updates over WebSocket
+- Keep the latest message per (channel, symbol) in a local dict
+- Read prices from that dict instead of making an HTTPS call per poll
+
+All credentials are loaded from .env file automatically.
+"""
+
+import os
+import time
+import threading
+import _bootstrap  # noqa: F401 - puts the SDK on sys.path and loads .env
+
+from standx_sdk import StandXWebSocket
+
+symbols = ["BTC-USD"]  # Add more symbols as needed
+
+# Latest message per (channel, symbol), filled by the WebSocket thread
+latest = {}
+latest_lock = threading.Lock()
+market_stream_ready = threading.Event()
+
+
+def on_message(data, stream_type):
+    """Store the newest update for each channel/symbol"""
+    if not isinstance(data, dict) or "channel" not in data:
+        return
+    with latest_lock:
+        latest[(data["channel"], data.get("symbol"))] = data
+
+
+def on_error(error):
+    """Handle WebSocket errors"""
+    print(f"Error: {error}")
+
+
+def on_open(stream_type):
+    """Signal that the market stream is connected"""
+    market_stream_ready.set()
+
+
+def get_latest(channel, symbol):
+    """Read the newest update for a channel/symbol (no network call)"""
+    with latest_lock:
+        return latest.get((channel, symbol))
+
+
+ws = StandXWebSocket(
+    jwt_token=os.getenv("STANDX_JWT_TOKEN"),
+    on_message=on_message,
+    on_error=on_error,
+    on_open=on_open
+)
+
+print("Connecting to market stream...")
+ws.connect_market_stream()
+
+# Wait for the connection instead of sleeping a fixed amount
+if not market_stream_ready.wait(timeout=10):
+    raise SystemExit("Could not connect to market stream")
+
+# One burst for every channel/symbol pair
+ws.subscribe_many([(channel, symbol) for symbol in symbols for channel in ("price", "depth_book")])
+
+# Monitoring loop: every read is a dict lookup, updates arrive by push
+print("Listening for updates (press Ctrl+C to stop)...")
+try:
+    while True:
+        for symbol in symbols:
+            price = get_latest("price", symbol)
+            depth = get_latest("depth_book", symbol)
+            if price:
+                print(f"{symbol} price: {price.get('data')}")
+            if depth:
+                book = depth.get("data") or {}
+                bids, asks = book.get("bids") or [], book.get("asks") or []
+                if bids and asks:
+                    print(f"{symbol} best bid/ask: {bids[0][0]} / {asks[0][0]}")
+        time.sleep(1)
+except KeyboardInterrupt:
+    print("\nDisconnecting...")
+    ws.disconnect_market()
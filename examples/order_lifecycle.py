@@ -14,17 +14,18 @@ Run examples/generate_and_log_credentials.py first to generate credentials.
 
 import sys
 import os
+import traceback
 import time
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _bootstrap  # noqa: F401 - puts the SDK on sys.path and loads .env
 
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
+# This is a one-shot script with no prompts, so block-buffer stdout and let
+# the many print() calls reach the terminal in a few writes instead of one per line
+sys.stdout.reconfigure(line_buffering=False, write_through=False)
 
-from standx_sdk import StandXWalletClient, OrderSide, OrderType, TimeInForce
+from standx_sdk import NewOrderRequest, OrderSide, OrderType, TimeInForce
+from standx_sdk.client_factory import get_default_client
+from _session import make_session
 
 print("=" * 80)
 print("Order Lifecycle Example")
@@ -38,9 +39,12 @@ if not private_key:
     print("Please run: python examples/generate_and_log_credentials.py")
     sys.exit(1)
 
-client = StandXWalletClient(
+# One keep-alive session shared by every request below
+client = get_default_client(
     private_key=private_key,
-    chain=os.getenv("STANDX_CHAIN", "bsc")
+    chain=os.getenv("STANDX_CHAIN", "bsc"),
+    session=make_session(),
+    cache_jwt=True  # Reuse JWT from ~/.standx/jwt_cache.json while still valid
 )
 
 print(f"Connected with wallet: {client.wallet_address}")
@@ -74,6 +78,7 @@ print("2. Querying Open Orders (Before)")
 print("=" * 80)
 print()
 
+open_orders_before = None
 try:
     open_orders_before = client.query_open_orders(symbol)
     print(f"Open orders count: {len(open_orders_before)}")
@@ -94,6 +99,10 @@ print("NOTE: Order creation is commented out for safety.")
 print("Uncomment the code below to place a real order.")
 print()
 
+# Set from order_result below when an order is actually placed
+order_id = None
+cl_ord_id = None
+
 # Uncomment below to place a real order:
 """
 try:
@@ -124,12 +133,28 @@ try:
         print(f"  Client Order ID: {cl_ord_id}")
     print()
     
+    # Several orders (e.g. a grid) can be submitted in one call; they are
+    # sent concurrently, so this takes about one round-trip in total
+    grid_results = client.create_orders([
+        NewOrderRequest(
+            symbol=symbol,
+            side="buy",
+            order_type="limit",
+            qty="0.001",
+            price=f"{order_price * (1 - 0.01 * i):.2f}",
+            time_in_force="gtc"
+        )
+        for i in range(1, 4)
+    ])
+    for result in grid_results:
+        print(f"  Grid order: {result.order_id or result.message}")
+    print()
+    
     # Wait a moment for order to be processed
     time.sleep(2)
     
 except Exception as e:
     print(f"Error creating order: {e}")
-    import traceback
     traceback.print_exc()
     print()
 """
@@ -142,9 +167,6 @@ print()
 
 # Note: Order status query requires order_id or cl_ord_id from order creation
 # Uncomment the order creation section above to test this
-order_id = None  # Would be set from order_result.order_id
-cl_ord_id = None  # Would be set from order_result.cl_ord_id
-
 if order_id or cl_ord_id:
     try:
         if order_id:
@@ -176,7 +198,13 @@ print("=" * 80)
 print()
 
 try:
-    open_orders_after = client.query_open_orders(symbol)
+    # Without a new order the open orders cannot have changed, so reuse the
+    # result from section 2 instead of querying again
+    if order_id or cl_ord_id or open_orders_before is None:
+        open_orders_after = client.query_open_orders(symbol)
+    else:
+        open_orders_after = open_orders_before
+        print("(unchanged - no order placed)")
     print(f"Open orders count: {len(open_orders_after)}")
     if open_orders_after:
         for order in open_orders_after:
@@ -201,12 +229,13 @@ print()
 # Uncomment below to cancel an order:
 """
 if open_orders_after:
-    order_to_cancel = open_orders_after[0]
+    # Cancel all open orders with a single batch request
+    order_ids = [order.id for order in open_orders_after]
     try:
-        print(f"Canceling order ID: {order_to_cancel.id}")
-        cancel_result = client.cancel_order(order_id=order_to_cancel.id)
-        print(f"Cancel Result: {cancel_result.message}")
-        print(f"Request ID: {cancel_result.request_id}")
+        print(f"Canceling order IDs: {order_ids}")
+        cancel_results = client.cancel_orders(order_id_list=order_ids)
+        for cancel_result in cancel_results:
+            print(f"Cancel Result: {cancel_result.message} (Request ID: {cancel_result.request_id})")
         print()
         
         # Wait a moment
@@ -214,12 +243,12 @@ if open_orders_after:
         
         # Verify cancellation
         try:
-            canceled_order = client.query_order(symbol=symbol, order_id=order_to_cancel.id)
-            print(f"Order Status After Cancellation: {canceled_order.status}")
+            remaining = client.query_open_orders(symbol)
+            print(f"Open Orders After Cancellation: {len(remaining)}")
         except Exception as e:
-            print(f"Order may have been canceled: {e}")
+            print(f"Orders may have been canceled: {e}")
     except Exception as e:
-        print(f"Error canceling order: {e}")
+        print(f"Error canceling orders: {e}")
         print()
 else:
     print("No open orders to cancel")
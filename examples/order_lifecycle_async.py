@@ -0,0 +1,135 @@
+"""Order Lifecycle Example (async)
+
+Async variant of order_lifecycle.py. The read-only queries (price, open
+orders, order history, trade history) do not depend on each other, so they
+are issued together with asyncio.gather() over a single aiohttp connection
+pool.
+
+Requires aiohttp: pip install aiohttp
+Optional: pip install uvloop for a faster event loop
+
+Run examples/generate_and_log_credentials.py first to generate credentials.
+"""
+
+import sys
+import os
+import asyncio
+
+# Use uvloop's libuv event loop when installed (faster socket handling);
+# the coroutines below run unchanged on the default loop otherwise
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+import _bootstrap  # noqa: F401 - puts the SDK on sys.path and loads .env
+
+from standx_sdk import AsyncStandXWalletClient
+
+
+async def main():
+    private_key = os.getenv("STANDX_PRIVATE_KEY")
+    if not private_key:
+        print("[ERROR] STANDX_PRIVATE_KEY not found in .env file")
+        print("Please run: python examples/generate_and_log_credentials.py")
+        sys.exit(1)
+
+    symbol = "BTC-USD"
+
+    async with AsyncStandXWalletClient(
+        private_key=private_key,
+        chain=os.getenv("STANDX_CHAIN", "bsc"),
+        cache_jwt=True  # Reuse JWT from ~/.standx/jwt_cache.json while still valid
+    ) as client:
+        print(f"Connected with wallet: {client.wallet_address}")
+        print()
+
+        price_data, open_orders, orders, trades = await asyncio.gather(
+            client.query_symbol_price(symbol),
+            client.query_open_orders(symbol),
+            client.query_orders(symbol=symbol, limit=10),
+            client.query_trades(symbol=symbol, limit=10),
+            return_exceptions=True
+        )
+
+        # 1. Current Price
+        print("=" * 80)
+        print("1. Current Price")
+        print("=" * 80)
+        if isinstance(price_data, Exception):
+            print(f"Error querying price: {price_data}")
+            sys.exit(1)
+        current_price = float(price_data.last_price)
+        order_price = current_price * 0.95
+        print(f"Current {symbol} Price: ${current_price}")
+        print(f"Order Price (5% below market): ${order_price:.2f}")
+        print()
+
+        # 2. Open Orders
+        print("=" * 80)
+        print("2. Open Orders")
+        print("=" * 80)
+        if isinstance(open_orders, Exception):
+            print(f"Error querying open orders: {open_orders}")
+        else:
+            print(f"Open orders count: {len(open_orders)}")
+            for order in open_orders:
+                print(f"  Order ID: {order.id}, Side: {order.side}, Qty: {order.qty}, Price: ${order.price}, Status: {order.status}")
+        print()
+
+        # 3. Create Limit Order (commented out - uncomment to place real order)
+        print("=" * 80)
+        print("3. Create Limit Order Example")
+        print("=" * 80)
+        print("NOTE: Order creation is commented out for safety.")
+        print()
+        # from standx_sdk import OrderSide, OrderType, TimeInForce
+        # order_result = await client.create_order(
+        #     symbol=symbol,
+        #     side=OrderSide.BUY,
+        #     order_type=OrderType.LIMIT,
+        #     qty="0.001",
+        #     price=f"{order_price:.2f}",
+        #     time_in_force=TimeInForce.GTC
+        # )
+        # print(f"Order Created! Request ID: {order_result.request_id}")
+
+        # 4. Order History
+        print("=" * 80)
+        print("4. Order History")
+        print("=" * 80)
+        if isinstance(orders, Exception):
+            print(f"Error querying order history: {orders}")
+        else:
+            print(f"Recent orders (last 10): {len(orders)}")
+            for i, order in enumerate(orders[:5], 1):
+                print(f"  {i}. Order ID: {order.id}, Side: {order.side}, "
+                      f"Qty: {order.qty}, Price: ${order.price}, Status: {order.status}")
+        print()
+
+        # 5. Trade History
+        print("=" * 80)
+        print("5. Trade History")
+        print("=" * 80)
+        if isinstance(trades, Exception):
+            print(f"Error querying trades: {trades}")
+        else:
+            print(f"Recent trades (last 10): {len(trades)}")
+            for i, trade in enumerate(trades[:5], 1):
+                print(f"  {i}. Trade ID: {trade.id}, Side: {trade.side}, "
+                      f"Qty: {trade.qty}, Price: ${trade.price}")
+        print()
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("Order Lifecycle Example (async)")
+    print("=" * 80)
+    print()
+
+    asyncio.run(main())
+
+    print("=" * 80)
+    print("Order Lifecycle Example Complete!")
+    print("=" * 80)
@@ -10,22 +10,20 @@ All credentials are loaded from .env file automatically.
 
 import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _bootstrap  # noqa: F401 - puts the SDK on sys.path and loads .env
 
-import time
 import uuid
+import threading
+from concurrent.futures import Future
 from standx_sdk import StandXClient, StandXWalletClient, StandXWebSocket, OrderSide, OrderType, TimeInForce
-
-# Load environment variables
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
+from _session import make_session
 
 # Use session ID from environment or generate new one
 session_id = os.getenv("STANDX_SESSION_ID") or str(uuid.uuid4())
 
+# One keep-alive session shared by every request below
+session = make_session()
+
 # Initialize HTTP client with credentials from environment
 # Prefer StandXWalletClient (auto-generates credentials from private key)
 private_key = os.getenv("STANDX_PRIVATE_KEY")
@@ -33,7 +31,9 @@ if private_key:
     client = StandXWalletClient(
         private_key=private_key,
         chain=os.getenv("STANDX_CHAIN", "bsc"),
-        session_id=session_id
+        session_id=session_id,
+        session=session,
+        cache_jwt=True  # Reuse JWT from ~/.standx/jwt_cache.json while still valid
     )
     jwt_token = client.jwt_token
     print(f"Using StandXWalletClient with wallet: {client.wallet_address}")
@@ -43,33 +43,56 @@ else:
         jwt_token=os.getenv("STANDX_JWT_TOKEN"),
         api_key=os.getenv("STANDX_API_KEY"),
         api_secret=os.getenv("STANDX_API_SECRET"),
-        session_id=session_id
+        session_id=session_id,
+        session=session
     )
     jwt_token = os.getenv("STANDX_JWT_TOKEN")
 
 # Initialize WebSocket for order responses
+# Each pending request_id maps to a Future resolved by the WebSocket thread
 order_responses = {}
+order_responses_lock = threading.Lock()
+order_stream_ready = threading.Event()
+
+
+def response_future(request_id):
+    """Get (or create) the Future that resolves with the response for request_id"""
+    with order_responses_lock:
+        return order_responses.setdefault(request_id, Future())
+
 
 def on_order_response(data, stream_type):
     """Handle order response from WebSocket"""
     request_id = data.get("request_id")
     if request_id:
-        order_responses[request_id] = data
+        future = response_future(request_id)
+        if not future.done():
+            future.set_result(data)
         if data.get("code") == 0:
             print(f"[SUCCESS] Order {request_id} successful")
         else:
             print(f"[ERROR] Order {request_id} rejected: {data.get('message')}")
 
+
+def on_open(stream_type):
+    """Signal that the order stream is connected and authenticated"""
+    order_stream_ready.set()
+
+
 ws = StandXWebSocket(
     jwt_token=jwt_token,
     session_id=session_id,
-    on_message=on_order_response
+    ed25519_private_key=client.auth.ed25519_private_key,  # Key bound to the JWT, signs ws orders
+    on_message=on_order_response,
+    on_open=on_open
 )
 
-# Connect to order response stream
+# Connect to order response stream and wait for the handshake instead of a fixed sleep
 print("Connecting to order response stream...")
 ws.connect_order_stream()
-time.sleep(2)
+if not order_stream_ready.wait(timeout=10):
+    print("[ERROR] Order response stream did not connect within 10 seconds")
+    sys.exit(1)
 
 # Create order via HTTP (will get response via WebSocket) - commented out for safety
 print("\nOrder creation example (commented out for safety):")
@@ -84,8 +107,12 @@ print("#     time_in_force=TimeInForce.GTC")
 print("# )")
 print("# request_id = result.request_id")
 print("# print(f'Order submitted, request_id: {request_id}')")
-print("# # Wait for WebSocket response...")
-print("# # Cancel order if needed...")
+print("# # Wait for the WebSocket response (no fixed sleep)")
+print("# response = response_future(request_id).result(timeout=10)")
+print("# # Cancel order if needed, then wait on its request_id the same way")
+print("#")
+print("# # Or send it over the already open order stream and wait for the reply:")
+print("# response = ws.place_order('BTC-USD', 'buy', 'limit', '0.01', 'gtc', price='40000')")
 
 # Query order status (real API call)
 orders = client.query_open_orders("BTC-USD")
@@ -10,15 +10,11 @@ This example demonstrates placing a real order using credentials from .env:
 
 import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import traceback
+import _bootstrap  # noqa: F401 - puts the SDK on sys.path and loads .env
 
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
-
-from standx_sdk import StandXWalletClient, OrderSide, OrderType, TimeInForce
+from standx_sdk import OrderSide, OrderType, TimeInForce
+from standx_sdk.client_factory import get_default_client
 
 print("=" * 70)
 print("Order Creation Using Credentials from .env")
@@ -38,9 +34,11 @@ print(f"  Chain: {chain}")
 print(f"  Private Key: {'*' * 20}...{private_key[-8:]}")
 
 # Initialize client - JWT will be auto-generated from private key
-client = StandXWalletClient(
+client = get_default_client(
     private_key=private_key,
-    chain=chain
+    chain=chain,
+    cache_jwt=True,  # Reuse JWT from ~/.standx/jwt_cache.json while still valid
+    cache_market_data=True  # Repeated price/symbol lookups within the TTL skip the network
 )
 
 print(f"\n[OK] Client initialized")
@@ -84,6 +82,10 @@ print("\n" + "=" * 70)
 print("Step 4: Place Real Order")
 print("=" * 70)
 
+# Drop the cached price so the order is priced off a fresh quote
+client.invalidate_cache(symbol="BTC-USD")
+current_price = float(client.query_symbol_price("BTC-USD").last_price)
+
 # Calculate order price (5% below current price for buy order)
 order_price = current_price * 0.95
 order_qty = "0.001"  # Small quantity for testing
@@ -102,7 +104,7 @@ try:
         side=OrderSide.BUY,
         order_type=OrderType.LIMIT,
         qty=order_qty,
-        price=f"{order_price:.2f}",
+        price=client.format_price("BTC-USD", order_price),  # Rounded to the symbol's tick size
         time_in_force=TimeInForce.GTC
     )
     
@@ -133,7 +135,6 @@ try:
     
 except Exception as e:
     print(f"\n[ERROR] Failed to place order: {e}")
-    import traceback
     traceback.print_exc()
     sys.exit(1)
 
@@ -15,15 +15,10 @@ import sys
 import os
 from datetime import datetime
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _bootstrap  # noqa: F401 - puts the SDK on sys.path and loads .env
 
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
-
-from standx_sdk import StandXWalletClient
+from standx_sdk.client_factory import get_default_client
+from _columns import column, total
 
 print("=" * 80)
 print("Portfolio Overview")
@@ -37,9 +32,10 @@ if not private_key:
     print("Please run: python examples/generate_and_log_credentials.py")
     sys.exit(1)
 
-client = StandXWalletClient(
+client = get_default_client(
     private_key=private_key,
-    chain=os.getenv("STANDX_CHAIN", "bsc")
+    chain=os.getenv("STANDX_CHAIN", "bsc"),
+    cache_jwt=True  # Reuse JWT from ~/.standx/jwt_cache.json while still valid
 )
 
 print(f"Wallet Address: {client.wallet_address}")
@@ -47,6 +43,11 @@ print(f"Chain: {client.chain}")
 print(f"Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 print()
 
+# Results from sections 1-3, reused by the summary; None means the query failed
+balances = None
+positions = None
+orders = None
+
 # 1. Account Balances
 print("=" * 80)
 print("1. Account Balances")
@@ -56,17 +57,15 @@ print()
 try:
     balances = client.query_balances()
     if balances:
-        total_balance = 0
+        # Convert each numeric field for all rows in one pass
+        free, locked = column(balances, "free"), column(balances, "locked")
+        totals = [bal.total_value for bal in balances]
         print(f"{'Token':<15} {'Free':<20} {'Locked':<20} {'Total':<20}")
         print("-" * 80)
-        for bal in balances:
-            free = float(bal.free) if bal.free else 0
-            locked = float(bal.locked) if bal.locked else 0
-            total_val = float(bal.total) if bal.total else (free + locked)
-            total_balance += total_val
-            print(f"{bal.token or 'N/A':<15} {free:<20.8f} {locked:<20.8f} {total_val:<20.8f}")
+        for bal, f, l, t in zip(balances, free, locked, totals):
+            print(f"{bal.token or 'N/A':<15} {f:<20.8f} {l:<20.8f} {t:<20.8f}")
         print("-" * 80)
-        print(f"{'TOTAL':<15} {'':<20} {'':<20} {total_balance:<20.8f}")
+        print(f"{'TOTAL':<15} {'':<20} {'':<20} {total(totals):<20.8f}")
     else:
         print("No balances found")
     print()
@@ -83,16 +82,17 @@ print()
 try:
     positions = client.query_positions()
     if positions:
-        total_unrealized_pnl = 0
+        # Convert each numeric field for all rows in one pass
+        qtys = column(positions, "qty")
+        entry_prices = column(positions, "entry_price")
+        entry_values = column(positions, "entry_value")
+        realized_pnls = column(positions, "realized_pnl")
+        total_unrealized_pnl = total(realized_pnls)
         print(f"{'Symbol':<15} {'Qty':<15} {'Entry':<15} {'Entry Value':<15} {'PnL':<20} {'Leverage':<10} {'Status':<10}")
         print("-" * 80)
-        for pos in positions:
-            qty = float(pos.qty) if pos.qty else 0
-            entry_price = float(pos.entry_price) if pos.entry_price else 0
-            entry_value = float(pos.entry_value) if pos.entry_value else 0
-            realized_pnl = float(pos.realized_pnl) if pos.realized_pnl else 0
-            total_unrealized_pnl += realized_pnl
-            
+        for pos, qty, entry_price, entry_value, realized_pnl in zip(
+            positions, qtys, entry_prices, entry_values, realized_pnls
+        ):
             pnl_str = f"${realized_pnl:.2f}"
             if realized_pnl > 0:
                 pnl_str = f"+{pnl_str}"
@@ -122,9 +122,7 @@ try:
     if orders:
         print(f"{'Order ID':<15} {'Symbol':<15} {'Side':<8} {'Type':<10} {'Qty':<15} {'Price':<15} {'Status':<15}")
         print("-" * 80)
-        for order in orders:
-            qty = float(order.qty) if order.qty else 0
-            price = float(order.price) if order.price else 0
+        for order, qty, price in zip(orders, column(orders, "qty"), column(orders, "price")):
             print(f"{order.id:<15} {order.symbol:<15} {order.side:<8} {order.order_type:<10} {qty:<15.8f} ${price:<14.2f} {order.status:<15}")
         print(f"\nTotal Open Orders: {len(orders)}")
     else:
@@ -143,15 +141,10 @@ print()
 try:
     trades = client.query_trades(limit=10)
     if trades:
-        total_trade_value = 0
+        qtys, prices = column(trades, "qty"), column(trades, "price")
         print(f"{'Trade ID':<15} {'Symbol':<15} {'Side':<8} {'Qty':<15} {'Price':<15} {'Time':<20}")
         print("-" * 80)
-        for trade in trades:
-            qty = float(trade.qty) if trade.qty else 0
-            price = float(trade.price) if trade.price else 0
-            trade_value = qty * price
-            total_trade_value += trade_value
-            
+        for trade, qty, price in zip(trades, qtys, prices):
             trade_time = datetime.fromtimestamp(trade.timestamp / 1000).strftime('%Y-%m-%d %H:%M:%S') if trade.timestamp else 'N/A'
             print(f"{trade.id:<15} {trade.symbol:<15} {trade.side:<8} {qty:<15.8f} ${price:<14.2f} {trade_time:<20}")
         print(f"\nTotal Trades Shown: {len(trades)}")
@@ -169,33 +162,21 @@ print("=" * 80)
 print()
 
 try:
-    # Calculate summary statistics
-    positions = client.query_positions()
-    orders = client.query_open_orders()
-    balances = client.query_balances()
+    # Calculate summary statistics from the data fetched above (no re-query)
+    total_realized_pnl = total(column(positions, "realized_pnl")) if positions else 0
     
-    total_positions = len(positions) if positions else 0
-    total_open_orders = len(orders) if orders else 0
-    
-    total_realized_pnl = sum(
-        float(pos.realized_pnl) if pos.realized_pnl else 0 
-        for pos in positions
-    ) if positions else 0
+    print(f"Total Positions: {len(positions) if positions is not None else 'unavailable'}")
+    print(f"Total Open Orders: {len(orders) if orders is not None else 'unavailable'}")
+    if positions is not None:
+        print(f"Total Realized PnL: ${total_realized_pnl:.2f}")
+    else:
+        print("Total Realized PnL: unavailable")
     
-    total_balance = sum(
-        float(bal.total) if bal.total else (
-            (float(bal.free) if bal.free else 0) + 
-            (float(bal.locked) if bal.locked else 0)
-        )
-        for bal in balances
-    ) if balances else 0
+    total_balance = sum(bal.total_value for bal in balances) if balances else 0
     
-    print(f"Total Positions: {total_positions}")
-    print(f"Total Open Orders: {total_open_orders}")
-    print(f"Total Realized PnL: ${total_realized_pnl:.2f}")
     if total_balance > 0:
         print(f"Total Account Balance: ${total_balance:.2f}")
-        if total_balance > 0:
+        if positions is not None:
             pnl_percentage = (total_realized_pnl / total_balance) * 100
             print(f"PnL Percentage: {pnl_percentage:.2f}%")
     else:
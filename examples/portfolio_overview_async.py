@@ -0,0 +1,165 @@
+"""Portfolio Overview Example (async)
+
+Async variant of portfolio_overview.py. Balances, positions, open orders and
+recent trades do not depend on each other, so they are fetched together with
+asyncio.gather() over a single aiohttp connection pool. The portfolio summary
+is computed from those same results instead of querying again.
+
+Requires aiohttp: pip install aiohttp
+Optional: pip install uvloop for a faster event loop
+
+Run examples/generate_and_log_credentials.py first to generate credentials.
+"""
+
+import sys
+import os
+import asyncio
+from datetime import datetime
+
+# Use uvloop's libuv event loop when installed (faster socket handling);
+# the coroutines below run unchanged on the default loop otherwise
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+import _bootstrap  # noqa: F401 - puts the SDK on sys.path and loads .env
+
+from standx_sdk import AsyncStandXWalletClient
+
+
+def print_section(title, result, render):
+    """Print one section, or the error if that query failed"""
+    print("=" * 80)
+    print(title)
+    print("=" * 80)
+    print()
+    if isinstance(result, Exception):
+        print(f"Error: {result}")
+    else:
+        render(result)
+    print()
+
+
+def render_balances(balances):
+    if not balances:
+        print("No balances found")
+        return
+    print(f"{'Token':<15} {'Free':<20} {'Locked':<20} {'Total':<20}")
+    print("-" * 80)
+    for bal in balances:
+        print(f"{bal.token or 'N/A':<15} {bal.num('free'):<20.8f} {bal.num('locked'):<20.8f} {bal.total_value:<20.8f}")
+    print("-" * 80)
+    print(f"{'TOTAL':<15} {'':<20} {'':<20} {sum(b.total_value for b in balances):<20.8f}")
+
+
+def render_positions(positions):
+    if not positions:
+        print("No open positions")
+        return
+    print(f"{'Symbol':<15} {'Qty':<15} {'Entry':<15} {'Entry Value':<15} {'PnL':<20} {'Leverage':<10} {'Status':<10}")
+    print("-" * 80)
+    for pos in positions:
+        qty, entry_price = pos.num("qty"), pos.num("entry_price")
+        entry_value, realized_pnl = pos.num("entry_value"), pos.num("realized_pnl")
+        pnl_str = f"+${realized_pnl:.2f}" if realized_pnl > 0 else f"${realized_pnl:.2f}"
+        print(f"{pos.symbol:<15} {qty:<15.8f} ${entry_price:<14.2f} ${entry_value:<14.2f} {pnl_str:<20} {pos.leverage or 'N/A'}x {pos.status or 'N/A':<10}")
+    print(f"\nTotal Positions: {len(positions)}")
+
+
+def render_orders(orders):
+    if not orders:
+        print("No open orders")
+        return
+    print(f"{'Order ID':<15} {'Symbol':<15} {'Side':<8} {'Type':<10} {'Qty':<15} {'Price':<15} {'Status':<15}")
+    print("-" * 80)
+    for order in orders:
+        qty, price = order.num("qty"), order.num("price")
+        print(f"{order.id:<15} {order.symbol:<15} {order.side:<8} {order.order_type:<10} {qty:<15.8f} ${price:<14.2f} {order.status:<15}")
+    print(f"\nTotal Open Orders: {len(orders)}")
+
+
+def render_trades(trades):
+    if not trades:
+        print("No recent trades")
+        return
+    print(f"{'Trade ID':<15} {'Symbol':<15} {'Side':<8} {'Qty':<15} {'Price':<15} {'Time':<20}")
+    print("-" * 80)
+    for trade in trades:
+        qty, price = trade.num("qty"), trade.num("price")
+        trade_time = datetime.fromtimestamp(trade.timestamp / 1000).strftime('%Y-%m-%d %H:%M:%S') if trade.timestamp else 'N/A'
+        print(f"{trade.id:<15} {trade.symbol:<15} {trade.side:<8} {qty:<15.8f} ${price:<14.2f} {trade_time:<20}")
+    print(f"\nTotal Trades Shown: {len(trades)}")
+
+
+def print_summary(balances, positions, orders):
+    """Summarize the already-fetched results; failed queries show as unavailable"""
+    print("=" * 80)
+    print("5. Portfolio Summary")
+    print("=" * 80)
+    print()
+    positions_ok = not isinstance(positions, Exception)
+    balances_ok = not isinstance(balances, Exception)
+
+    print(f"Total Positions: {len(positions) if positions_ok else 'unavailable'}")
+    print(f"Total Open Orders: {len(orders) if not isinstance(orders, Exception) else 'unavailable'}")
+    if positions_ok:
+        total_realized_pnl = sum(pos.num("realized_pnl") for pos in positions)
+        print(f"Total Realized PnL: ${total_realized_pnl:.2f}")
+    else:
+        print("Total Realized PnL: unavailable")
+
+    total_balance = sum(bal.total_value for bal in balances) if balances_ok else 0
+    if total_balance > 0:
+        print(f"Total Account Balance: ${total_balance:.2f}")
+        if positions_ok:
+            print(f"PnL Percentage: {(total_realized_pnl / total_balance) * 100:.2f}%")
+    else:
+        print("Total Account Balance: Unable to calculate (balances endpoint may not be available)")
+    print()
+
+
+async def main():
+    private_key = os.getenv("STANDX_PRIVATE_KEY")
+    if not private_key:
+        print("[ERROR] STANDX_PRIVATE_KEY not found in .env file")
+        print("Please run: python examples/generate_and_log_credentials.py")
+        sys.exit(1)
+
+    async with AsyncStandXWalletClient(
+        private_key=private_key,
+        chain=os.getenv("STANDX_CHAIN", "bsc"),
+        cache_jwt=True  # Reuse JWT from ~/.standx/jwt_cache.json while still valid
+    ) as client:
+        print(f"Wallet Address: {client.wallet_address}")
+        print(f"Chain: {client.chain}")
+        print(f"Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print()
+
+        balances, positions, orders, trades = await asyncio.gather(
+            client.query_balances(),
+            client.query_positions(),
+            client.query_open_orders(),
+            client.query_trades(limit=10),
+            return_exceptions=True
+        )
+
+    print_section("1. Account Balances", balances, render_balances)
+    print_section("2. Open Positions", positions, render_positions)
+    print_section("3. Open Orders", orders, render_orders)
+    print_section("4. Recent Trades (Last 10)", trades, render_trades)
+    print_summary(balances, positions, orders)
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("Portfolio Overview (async)")
+    print("=" * 80)
+    print()
+
+    asyncio.run(main())
+
+    print("=" * 80)
+    print("Portfolio Overview Complete!")
+    print("=" * 80)
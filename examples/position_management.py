@@ -14,15 +14,9 @@ Run examples/generate_and_log_credentials.py first to generate credentials.
 import sys
 import os
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _bootstrap  # noqa: F401 - puts the SDK on sys.path and loads .env
 
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
-
-from standx_sdk import StandXWalletClient
+from standx_sdk.client_factory import get_default_client
 from standx_sdk.types import MarginMode
 
 print("=" * 80)
@@ -37,9 +31,10 @@ if not private_key:
     print("Please run: python examples/generate_and_log_credentials.py")
     sys.exit(1)
 
-client = StandXWalletClient(
+client = get_default_client(
     private_key=private_key,
-    chain=os.getenv("STANDX_CHAIN", "bsc")
+    chain=os.getenv("STANDX_CHAIN", "bsc"),
+    cache_jwt=True  # Reuse JWT from ~/.standx/jwt_cache.json while still valid
 )
 
 print(f"Connected with wallet: {client.wallet_address}")
@@ -8,18 +8,11 @@ This example shows the quickest way to start trading with StandX SDK:
 Perfect for getting started quickly!
 """
 
-import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _bootstrap  # noqa: F401 - puts the SDK on sys.path and loads .env
 
-from standx_sdk import StandXWalletClient, OrderSide, OrderType, TimeInForce
-
-# Load environment variables
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
+from standx_sdk import OrderSide, OrderType, TimeInForce
+from standx_sdk.client_factory import get_default_client
 
 # Verify private key is set
 private_key = os.getenv("STANDX_PRIVATE_KEY")
@@ -33,9 +26,10 @@ if not private_key:
 # Initialize client with your onboarded wallet's private key
 # JWT token and ed25519 keys will be automatically generated from private key
 # No API key/secret needed - everything is generated from private key
-client = StandXWalletClient(
+client = get_default_client(
     private_key=private_key,  # Your wallet private key (wallet must be onboarded)
-    chain=os.getenv("STANDX_CHAIN", "bsc")  # bsc, ethereum, or solana
+    chain=os.getenv("STANDX_CHAIN", "bsc"),  # bsc, ethereum, or solana
+    cache_jwt=True  # Reuse JWT from ~/.standx/jwt_cache.json while still valid
 )
 
 print(f"[OK] Connected with wallet: {client.wallet_address}")
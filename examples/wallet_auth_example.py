@@ -8,19 +8,11 @@ This example demonstrates using StandX SDK with just your private key:
 ⚠️ WARNING: This example places REAL orders when run!
 """
 
-import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _bootstrap  # noqa: F401 - puts the SDK on sys.path and loads .env
 
 from standx_sdk import StandXWalletClient, OrderSide, OrderType, TimeInForce
 
-# Load environment variables
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
-
 # Initialize client with private key (JWT and ed25519 keys auto-generated)
 # If STANDX_JWT_TOKEN is in .env, it will be used instead of generating new one
 private_key = os.getenv("STANDX_PRIVATE_KEY")
@@ -30,7 +22,10 @@ if not private_key:
 client = StandXWalletClient(
     private_key=private_key,  # Your wallet private key (wallet must be onboarded)
     chain=os.getenv("STANDX_CHAIN", "bsc"),  # bsc, ethereum, or solana
-    jwt_token=os.getenv("STANDX_JWT_TOKEN")  # Optional: use existing JWT from .env
+    jwt_token=os.getenv("STANDX_JWT_TOKEN"),  # Optional: use existing JWT from .env
+    cache_jwt=True,  # Reuse JWT from ~/.standx/jwt_cache.json while still valid
+    warmup=["BTC-USD"],  # Open connections and prefetch the BTC price in the background
+    cache_market_data=True
 )
 
 print(f"Wallet address: {client.wallet_address}")
@@ -66,6 +61,13 @@ print(f"  Request ID: {result.request_id}")
 if result.order_id:
     print(f"  Order ID: {result.order_id}")
 
-
-
-
+# Several orders (e.g. a small grid) go out together with create_orders():
+# they are signed and submitted concurrently, so the batch takes about one
+# round-trip instead of one per order. Uncomment to place them:
+# results = client.create_orders([
+#     {"symbol": "BTC-USD", "side": "buy", "order_type": "limit", "qty": "0.001",
+#      "price": f"{current_price * (0.95 - 0.01 * i):.2f}", "time_in_force": "gtc"}
+#     for i in range(1, 4)
+# ])
+# for r in results:
+#     print(f"  Grid order: {r.order_id or r.message}")
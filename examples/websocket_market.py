@@ -10,17 +10,11 @@ All credentials are loaded from .env file automatically.
 
 import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _bootstrap  # noqa: F401 - puts the SDK on sys.path and loads .env
 
 import time
-from standx_sdk import StandXWebSocket
-
-# Load environment variables
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
+import threading
+from standx_sdk import StandXWalletClient, StandXWebSocket
 
 def on_message(data, stream_type):
     """Handle incoming WebSocket messages"""
@@ -34,6 +28,12 @@ def on_close(stream_type, code, msg):
     """Handle WebSocket close"""
     print(f"Connection closed: {stream_type} - {code} - {msg}")
 
+market_stream_ready = threading.Event()
+
+def on_open(stream_type):
+    """Signal that the stream is connected and authenticated"""
+    market_stream_ready.set()
+
 # Initialize WebSocket client with credentials from environment
 # Get JWT token - prefer from StandXWalletClient if private key available
 jwt_token = os.getenv("STANDX_JWT_TOKEN")
@@ -41,8 +41,7 @@ if not jwt_token:
     # Try to generate from private key
     private_key = os.getenv("STANDX_PRIVATE_KEY")
     if private_key:
-        from standx_sdk import StandXWalletClient
-        client = StandXWalletClient(private_key=private_key, chain=os.getenv("STANDX_CHAIN", "bsc"))
+        client = StandXWalletClient(private_key=private_key, chain=os.getenv("STANDX_CHAIN", "bsc"), cache_jwt=True)
         jwt_token = client.jwt_token
         print(f"Generated JWT from private key for wallet: {client.wallet_address}")
 
@@ -50,15 +49,20 @@ ws = StandXWebSocket(
     jwt_token=jwt_token,
     on_message=on_message,
     on_error=on_error,
-    on_close=on_close
+    on_close=on_close,
+    on_open=on_open,
+    threaded_dispatch=True,  # Run on_message off the receive thread; bursts of depth updates are conflated
+    track_books=True  # Keep the latest BTC-USD book in memory for ws.get_book()
 )
 
 # Connect to market stream
 print("Connecting to market stream...")
 ws.connect_market_stream()
 
-# Wait for connection
-time.sleep(2)
+# Wait for the handshake rather than a fixed delay
+if not market_stream_ready.wait(timeout=10):
+    print("Could not connect to market stream")
+    sys.exit(1)
 
 # Subscribe to price updates
 print("Subscribing to BTC-USD price...")
@@ -84,6 +88,10 @@ print("\nListening for updates (press Ctrl+C to stop)...")
 try:
     while True:
         time.sleep(1)
+        # Top of book from the locally kept copy, no REST round-trip
+        book = ws.get_book("BTC-USD", depth=1)
+        if book and book[0] and book[1]:
+            print(f"BTC-USD top of book: {book[0][0][0]} / {book[1][0][0]}")
 except KeyboardInterrupt:
     print("\nDisconnecting...")
     ws.disconnect_market()
@@ -4,10 +4,13 @@ StandX API Python SDK
 A comprehensive Python SDK for interacting with the StandX Perpetual Futures API.
 """
 
+import importlib
+
 from .client import StandXClient
 from .wallet_client import StandXWalletClient
 from .wallet_auth import StandXWalletAuth
-from .websocket import StandXWebSocket
+from .websocket import StandXWebSocket, extract_channel
+from .session import create_session
 from .exceptions import (
     StandXAPIError,
     StandXAuthenticationError,
@@ -23,6 +26,7 @@ from .types import (
     Resolution,
 )
 from .models import (
+    NewOrderRequest,
     OrderResponse,
     StandardResponse,
     Order,
@@ -41,12 +45,34 @@ from .models import (
     Health,
 )
 
+# The async clients pull in aiohttp/httpx, so they are imported on first access
+_LAZY_IMPORTS = {
+    "AsyncStandXClient": ".async_client",
+    "AsyncStandXWalletClient": ".async_wallet_client",
+    "AsyncStandXWebSocket": ".async_websocket",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
 __version__ = "1.0.0"
 __all__ = [
     "StandXClient",
     "StandXWalletClient",
     "StandXWalletAuth",
     "StandXWebSocket",
+    "extract_channel",
+    "AsyncStandXClient",
+    "AsyncStandXWalletClient",
+    "AsyncStandXWebSocket",
+    "create_session",
     "StandXAPIError",
     "StandXAuthenticationError",
     "StandXRequestError",
@@ -57,6 +83,7 @@ __all__ = [
     "TimeInForce",
     "MarginMode",
     "Resolution",
+    "NewOrderRequest",
     "OrderResponse",
     "StandardResponse",
     "Order",
@@ -0,0 +1,36 @@
+"""One-time environment setup shared by the clients and the examples"""
+
+import os
+from typing import Optional
+
+_done = False
+
+
+def load(dotenv_path: Optional[str] = None):
+    """
+    Load variables from a .env file into os.environ, once per process
+
+    python-dotenv is imported only here, on the first call, so code that
+    never needs .env does not pay for the import. Later calls are no-ops.
+    Set STANDX_SKIP_DOTENV=1 when the environment is already populated
+    (CI, containers) to skip the .env lookup entirely.
+
+    Args:
+        dotenv_path: Path of the .env file (default: search up from the
+            working directory)
+    """
+    global _done
+    if _done:
+        return
+    _done = True
+
+    if os.getenv("STANDX_SKIP_DOTENV", "").lower() in ("1", "true", "yes"):
+        return
+    if dotenv_path is not None and not os.path.isfile(dotenv_path):
+        return
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        # Fall back to variables already set in the environment
+        return
+    load_dotenv(dotenv_path)
@@ -0,0 +1,75 @@
+"""Small in-process TTL cache for public market data"""
+
+import time
+import threading
+import functools
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Thread-safe mapping of key -> value that expires each entry after its own TTL"""
+
+    def __init__(self):
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_set(self, key: Hashable, ttl: float, fn: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, calling fn() to refresh it once expired
+
+        Args:
+            key: Cache key
+            ttl: Seconds the value stays valid
+            fn: Zero-argument callable producing the value
+
+        Returns:
+            Cached or freshly computed value
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+        # Fetch outside the lock so one slow request does not block other keys
+        value = fn()
+        with self._lock:
+            self._data[key] = (now + ttl, value)
+        return value
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None):
+        """
+        Drop cached entries
+
+        Args:
+            predicate: Only drop keys for which predicate(key) is true (all keys if None)
+        """
+        with self._lock:
+            if predicate is None:
+                self._data.clear()
+            else:
+                for key in [k for k in self._data if predicate(k)]:
+                    del self._data[key]
+
+
+def ttl_cached(seconds: float):
+    """
+    Cache a client method's result for a number of seconds
+
+    The cache lives on the instance as ``self._cache``; when that is None
+    (caching disabled) the method is called directly. Keys are the method
+    name plus its arguments.
+
+    Args:
+        seconds: Time to live for each cached result
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cache = getattr(self, "_cache", None)
+            if cache is None:
+                return method(self, *args, **kwargs)
+            key = (method.__name__,) + args + tuple(sorted(kwargs.items()))
+            return cache.get_or_set(key, seconds, lambda: method(self, *args, **kwargs))
+        return wrapper
+    return decorator
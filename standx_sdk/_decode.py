@@ -0,0 +1,138 @@
+"""Typed response decoding with msgspec when it is installed
+
+msgspec can decode a JSON body straight into the SDK's model dataclasses in
+one pass, which is several times faster than json.loads() followed by
+Model.from_dict() per record. It is an optional dependency; without it (or
+when a payload does not match the model types) callers fall back to the
+regular parsing path.
+"""
+
+from dataclasses import field, fields, make_dataclass
+from typing import Any, Dict, List, Optional, Union
+from .models import OrderResponse
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+_decoders: Dict[type, Any] = {}
+_object_decoders: Dict[type, Any] = {}
+_order_response_decoder = None
+
+
+def _get_decoder(model: type):
+    """Build (once) a decoder for a bare list of model or a {"data": [...]} envelope"""
+    decoder = _decoders.get(model)
+    if decoder is None:
+        envelope = make_dataclass(f"{model.__name__}ListEnvelope", [
+            ("data", List[model], field(default_factory=list)),
+            ("code", Optional[int], None),
+        ])
+        decoder = msgspec.json.Decoder(Union[List[model], envelope], strict=False)
+        _decoders[model] = decoder
+    return decoder
+
+
+def decode_model_list(content: Union[bytes, str], model: type) -> Optional[List[Any]]:
+    """
+    Decode a JSON list response into model instances
+
+    Args:
+        content: Raw response body
+        model: Model dataclass for each list item (e.g. Order, Trade)
+
+    Returns:
+        List of model instances, or None if the caller should fall back to
+        the regular parsing path (msgspec missing, unexpected payload shape
+        or types, or an API error code in the envelope)
+    """
+    if msgspec is None:
+        return None
+    try:
+        result = _get_decoder(model).decode(content)
+    except (msgspec.ValidationError, msgspec.DecodeError):
+        # Only this response falls back; the next one of the model is tried again
+        return None
+
+    if isinstance(result, list):
+        return result
+    if result.code:
+        return None
+    return result.data
+
+
+def _get_object_decoder(model: type):
+    """Build (once) a decoder for a bare model object or a {"data": {...}} envelope
+
+    msgspec cannot tell two object types apart in a Union, so both shapes are
+    decoded into one type carrying the model's fields plus data and code.
+    """
+    decoder = _object_decoders.get(model)
+    if decoder is None:
+        model_fields = [(f.name, f.type, None) for f in fields(model)]
+        if any(name in ("data", "code") for name, _, _ in model_fields):
+            decoder = False  # Envelope keys would clash with the model's own fields
+        else:
+            response = make_dataclass(f"{model.__name__}Response", model_fields + [
+                ("data", Optional[model], None),
+                ("code", Optional[int], None),
+            ])
+            decoder = msgspec.json.Decoder(response, strict=False)
+        _object_decoders[model] = decoder
+    return decoder
+
+
+def decode_model(content: Union[bytes, str], model: type) -> Optional[Any]:
+    """
+    Decode a JSON object response into a model instance
+
+    Args:
+        content: Raw response body
+        model: Model dataclass (e.g. SymbolPrice)
+
+    Returns:
+        Model instance, or None if the caller should fall back to the
+        regular parsing path
+    """
+    if msgspec is None:
+        return None
+    decoder = _get_object_decoder(model)
+    if decoder is False:
+        return None
+    try:
+        result = decoder.decode(content)
+    except (msgspec.ValidationError, msgspec.DecodeError):
+        # Only this response falls back (e.g. a list where one object was
+        # expected); well-formed responses of the model keep the fast path
+        return None
+
+    if result.code:
+        return None
+    if result.data is not None:
+        return result.data
+    return model(**{f.name: getattr(result, f.name) for f in fields(model)})
+
+
+def decode_order_response(content: Union[bytes, str]) -> Optional[OrderResponse]:
+    """
+    Decode an order stream response frame into an OrderResponse
+
+    The order stream also carries frames of other shapes, which simply fall back.
+
+    Args:
+        content: Raw frame payload
+
+    Returns:
+        OrderResponse, or None if the caller should fall back to the regular
+        parsing path (msgspec missing, or the frame has no code/message)
+    """
+    global _order_response_decoder
+    if msgspec is None:
+        return None
+    if _order_response_decoder is None:
+        _order_response_decoder = msgspec.json.Decoder(OrderResponse, strict=False)
+    try:
+        return _order_response_decoder.decode(content)
+    except (msgspec.ValidationError, msgspec.DecodeError):
+        return None
@@ -0,0 +1,61 @@
+"""JSON helpers that use orjson when it is installed
+
+orjson is an optional dependency; without it these fall back to the
+standard library json module with the same call signatures.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so this catches both
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj, indent: bool = False) -> str:
+    """
+    Serialize obj to a JSON string
+    
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation
+        
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def dumps_bytes(obj) -> bytes:
+    """
+    Serialize obj to compact UTF-8 encoded JSON, e.g. for a request body
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def loads(data):
+    """
+    Deserialize a JSON document
+    
+    Args:
+        data: JSON as str or bytes
+        
+    Returns:
+        Deserialized object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
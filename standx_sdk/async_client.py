@@ -0,0 +1,834 @@
+"""Async StandX API client built on aiohttp"""
+
+import asyncio
+from typing import Optional, Dict, Any, List, Union, AsyncIterator, Tuple
+from .auth import StandXAuth
+from .http2 import http2_available
+from ._decode import decode_model, decode_model_list
+from . import _json
+from .exceptions import StandXAPIError, StandXRequestError, error_from_response
+from .types import (
+    OrderSide,
+    OrderType,
+    TimeInForce,
+    MarginMode,
+    Resolution,
+)
+from .models import (
+    NewOrderRequest,
+    OrderResponse,
+    StandardResponse,
+    Order,
+    Trade,
+    Position,
+    PositionConfig,
+    Balance,
+    SymbolInfo,
+    SymbolMarket,
+    SymbolPrice,
+    DepthBook,
+    RecentTrade,
+    FundingRates,
+    ServerTime,
+    Kline,
+    Health,
+)
+
+try:
+    import aiohttp
+except ImportError:  # Optional dependency, only needed for the async client
+    aiohttp = None
+
+try:
+    import httpx
+except ImportError:  # Optional dependency, only needed for http2=True
+    httpx = None
+
+
+# Shared, never mutated: aiohttp and httpx copy headers before sending
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+class AsyncStandXClient:
+    """Async client for interacting with StandX API
+    
+    Mirrors StandXClient, but every endpoint is a coroutine so independent
+    queries can run concurrently with asyncio.gather() over one connection pool.
+    """
+    
+    BASE_URL = "https://perps.standx.com"
+    
+    def __init__(
+        self,
+        jwt_token: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session_id: Optional[str] = None,
+        ed25519_private_key: Optional[bytes] = None,
+        session: Optional["aiohttp.ClientSession"] = None,
+        http2: bool = False
+    ):
+        """
+        Initialize async StandX client
+        
+        Args:
+            jwt_token: JWT access token for authenticated requests
+            base_url: Custom base URL (defaults to production)
+            session_id: Session ID for order tracking via WebSocket
+            ed25519_private_key: ed25519 private key bytes for body signature (auto-generated if None)
+            session: Shared aiohttp.ClientSession (created lazily if None)
+            http2: If True and no session is given, send requests through an
+                httpx.AsyncClient over HTTP/2, multiplexing concurrent calls on one
+                connection. Falls back to aiohttp when httpx[http2] is not installed
+        """
+        # HTTP/2 transport (httpx), used instead of aiohttp when requested and available
+        self._http2 = http2 and session is None and http2_available()
+        self._h2_client: Optional["httpx.AsyncClient"] = None
+        
+        if aiohttp is None and not self._http2:
+            raise ImportError("aiohttp is required for AsyncStandXClient. Install it with: pip install aiohttp")
+        
+        self.jwt_token = jwt_token
+        self.base_url = base_url or self.BASE_URL
+        self.session_id = session_id
+        self.auth = StandXAuth(ed25519_private_key=ed25519_private_key)
+        self.session = session
+        self._owns_session = session is None
+    
+    @property
+    def base_url(self) -> str:
+        """API base URL"""
+        return self._base_url
+    
+    @base_url.setter
+    def base_url(self, url: str):
+        self._base_url = url
+        # endpoint -> full URL, joined on first use
+        self._urls: Dict[str, str] = {}
+    
+    @property
+    def jwt_token(self) -> Optional[str]:
+        """JWT access token sent with authenticated requests"""
+        return self._jwt_token
+    
+    @jwt_token.setter
+    def jwt_token(self, token: Optional[str]):
+        # Build the request headers once per token instead of once per request
+        self._jwt_token = token
+        self._jwt_headers = (
+            {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+            if token else _JSON_HEADERS
+        )
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Get the shared session, creating it on first use (must run inside the event loop)"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=50, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=30, sock_connect=5)
+            )
+            self._owns_session = True
+        return self.session
+    
+    def _get_http2_client(self) -> "httpx.AsyncClient":
+        """Get the HTTP/2 client, creating it on first use"""
+        if self._h2_client is None or self._h2_client.is_closed:
+            self._h2_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60),
+                timeout=httpx.Timeout(30, connect=5)
+            )
+        return self._h2_client
+    
+    async def close(self):
+        """Close the underlying session if it was created by this client"""
+        if self._h2_client is not None:
+            await self._h2_client.aclose()
+        if self.session is not None and self._owns_session and not self.session.closed:
+            await self.session.close()
+    
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        body: Optional[bytes],
+        headers: Dict[str, str]
+    ) -> Tuple[int, bytes]:
+        """
+        Send one request over the configured transport
+        
+        Returns:
+            Tuple of (HTTP status, raw response body)
+            
+        Raises:
+            StandXRequestError: On network errors and timeouts
+        """
+        if self._http2:
+            try:
+                response = await self._get_http2_client().request(
+                    method,
+                    url,
+                    params=params,
+                    content=body,
+                    headers=headers
+                )
+            except httpx.TimeoutException as e:
+                raise StandXRequestError(f"Request failed: timeout {str(e)}")
+            except httpx.HTTPError as e:
+                raise StandXRequestError(f"Request failed: {str(e)}")
+            return response.status_code, response.content
+        
+        try:
+            async with self._get_session().request(
+                method,
+                url,
+                params=params,
+                data=body,
+                headers=headers
+            ) as response:
+                return response.status, await response.read()
+        except aiohttp.ClientError as e:
+            raise StandXRequestError(f"Request failed: {str(e)}")
+        except asyncio.TimeoutError as e:
+            raise StandXRequestError(f"Request failed: timeout {str(e)}")
+    
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+        signed: bool = False,
+        use_jwt: bool = True,
+        model: Optional[type] = None,
+        single: bool = False
+    ) -> Any:
+        """
+        Make HTTP request to API
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            params: Query parameters
+            data: Request body data
+            signed: Whether to sign the request
+            use_jwt: Whether to use JWT authentication
+            model: If set, the response is a list and is returned as a list of this model
+            single: With model, the response is one object returned as a model instance
+            
+        Returns:
+            API response data (model instance(s) when model is given)
+            
+        Raises:
+            StandXAPIError: If request fails
+        """
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = self._base_url + endpoint
+        body = _json.dumps_bytes(data) if data else None
+        
+        # Add authentication
+        if signed and self.auth:
+            headers = self.auth.generate_signature_headers(body or b"{}", self.session_id)
+            if use_jwt and self._jwt_token:
+                headers["Authorization"] = self._jwt_headers["Authorization"]
+        else:
+            headers = self._jwt_headers if use_jwt else _JSON_HEADERS
+        
+        # Make request
+        status, raw = await self._send(method, url, params, body, headers)
+        
+        # Handle error responses (the body is parsed once, in error_from_response)
+        if status >= 400:
+            raise error_from_response(status, raw)
+        
+        # Fast path: decode straight into model instances when msgspec is available
+        if model is not None:
+            items = decode_model(raw, model) if single else decode_model_list(raw, model)
+            if items is not None:
+                return items
+        
+        try:
+            result = _json.loads(raw)
+        except _json.JSONDecodeError:
+            raise StandXRequestError("Invalid JSON response")
+        
+        # Check API-level errors (only if code field exists and is not 0)
+        if isinstance(result, dict) and result.get("code") is not None and result.get("code") != 0:
+            code = result.get("code")
+            message = result.get("message", "Unknown error")
+            request_id = result.get("request_id")
+            raise StandXAPIError(message, code, request_id)
+        
+        # Handle response - can be dict with data field, or direct list/dict
+        data = result.get("data", result) if isinstance(result, dict) else result
+        if model is not None and single:
+            return model.from_dict(data) if isinstance(data, dict) else model()
+        if model is not None:
+            return list(map(model.from_dict, data)) if isinstance(data, list) else []
+        return data
+    
+    # Trade Endpoints
+    
+    async def create_order(
+        self,
+        symbol: str,
+        side: Union[OrderSide, str],
+        order_type: Union[OrderType, str],
+        qty: str,
+        time_in_force: Union[TimeInForce, str],
+        price: Optional[str] = None,
+        reduce_only: Optional[bool] = None,
+        cl_ord_id: Optional[str] = None,
+        margin_mode: Optional[Union[MarginMode, str]] = None,
+        leverage: Optional[int] = None
+    ) -> OrderResponse:
+        """
+        Create a new order
+        
+        Args:
+            symbol: Trading pair (e.g., "BTC-USD")
+            side: Order side (OrderSide or its string value, buy/sell)
+            order_type: Order type (OrderType or its string value, limit/market)
+            qty: Order quantity (as string)
+            time_in_force: Time in force (TimeInForce or its string value, gtc/ioc/alo)
+            price: Order price (required for limit orders, as string)
+            reduce_only: Only reduce position if true
+            cl_ord_id: Client order ID (auto-generated if omitted)
+            margin_mode: Margin mode (must match position)
+            leverage: Leverage value (must match position)
+            
+        Returns:
+            Order creation response
+        """
+        # The enums subclass str and serialize as their values, so no .value lookups
+        data = {
+            "symbol": symbol,
+            "side": side,
+            "order_type": order_type,
+            "qty": qty,
+            "time_in_force": time_in_force,
+            "reduce_only": reduce_only if reduce_only is not None else False,  # Required field
+        }
+        
+        if price:
+            data["price"] = price
+        if cl_ord_id:
+            data["cl_ord_id"] = cl_ord_id
+        if margin_mode:
+            data["margin_mode"] = margin_mode
+        if leverage:
+            data["leverage"] = leverage
+        
+        result = await self._request("POST", "/api/new_order", data=data, signed=True)
+        if isinstance(result, dict):
+            return OrderResponse(
+                code=result.get("code", 0),
+                message=result.get("message", "success"),
+                request_id=result.get("request_id"),
+                order_id=result.get("order_id"),
+                cl_ord_id=result.get("cl_ord_id")
+            )
+        return OrderResponse(code=0, message="success")
+    
+    async def create_orders(
+        self,
+        orders: List[Union[NewOrderRequest, Dict[str, Any]]],
+        max_workers: int = 10
+    ) -> List[OrderResponse]:
+        """
+        Create multiple orders
+        
+        The API has no batch order endpoint, so the orders are submitted
+        concurrently with asyncio.gather().
+        
+        Args:
+            orders: List of order requests (NewOrderRequest or dicts with the same fields)
+            max_workers: Maximum number of orders in flight at once (same as StandXClient)
+            
+        Returns:
+            List of order creation responses, in the same order as `orders`.
+            A rejected order yields a response carrying the error code and message.
+        """
+        in_flight = asyncio.Semaphore(max_workers)
+        
+        async def submit(order: NewOrderRequest) -> OrderResponse:
+            if isinstance(order, dict):
+                order = NewOrderRequest(**order)
+            try:
+                async with in_flight:
+                    return await self.create_order(
+                        symbol=order.symbol,
+                        side=order.side,
+                        order_type=order.order_type,
+                        qty=order.qty,
+                        time_in_force=order.time_in_force,
+                        price=order.price,
+                        reduce_only=order.reduce_only,
+                        cl_ord_id=order.cl_ord_id,
+                        margin_mode=order.margin_mode,
+                        leverage=order.leverage
+                    )
+            except StandXAPIError as e:
+                return OrderResponse(code=e.code or -1, message=e.message, request_id=e.request_id)
+        
+        return list(await asyncio.gather(*[submit(order) for order in orders]))
+    
+    async def cancel_order(
+        self,
+        order_id: Optional[int] = None,
+        cl_ord_id: Optional[str] = None
+    ) -> OrderResponse:
+        """
+        Cancel an order
+        
+        Args:
+            order_id: Order ID to cancel
+            cl_ord_id: Client order ID to cancel
+            
+        Returns:
+            Cancellation response
+        """
+        if not order_id and not cl_ord_id:
+            raise ValueError("Either order_id or cl_ord_id must be provided")
+        
+        data = {}
+        if order_id:
+            data["order_id"] = order_id
+        if cl_ord_id:
+            data["cl_ord_id"] = cl_ord_id
+        
+        result = await self._request("POST", "/api/cancel_order", data=data, signed=True)
+        if isinstance(result, dict):
+            return OrderResponse(
+                code=result.get("code", 0),
+                message=result.get("message", "success"),
+                request_id=result.get("request_id")
+            )
+        return OrderResponse(code=0, message="success")
+    
+    async def cancel_orders(
+        self,
+        order_id_list: Optional[List[int]] = None,
+        cl_ord_id_list: Optional[List[str]] = None
+    ) -> List[OrderResponse]:
+        """
+        Cancel multiple orders
+        
+        Args:
+            order_id_list: List of order IDs to cancel
+            cl_ord_id_list: List of client order IDs to cancel
+            
+        Returns:
+            List of cancellation results
+        """
+        if not order_id_list and not cl_ord_id_list:
+            raise ValueError("Either order_id_list or cl_ord_id_list must be provided")
+        
+        data = {}
+        if order_id_list:
+            data["order_id_list"] = order_id_list
+        if cl_ord_id_list:
+            data["cl_ord_id_list"] = cl_ord_id_list
+        
+        result = await self._request("POST", "/api/cancel_orders", data=data, signed=True)
+        if isinstance(result, list):
+            return [
+                OrderResponse(
+                    code=item.get("code", 0) if isinstance(item, dict) else 0,
+                    message=item.get("message", "success") if isinstance(item, dict) else "success",
+                    request_id=item.get("request_id") if isinstance(item, dict) else None
+                )
+                for item in result
+            ]
+        return []
+    
+    async def change_leverage(self, symbol: str, leverage: int) -> StandardResponse:
+        """
+        Change position leverage
+        
+        Args:
+            symbol: Trading pair
+            leverage: New leverage value
+            
+        Returns:
+            Response data
+        """
+        data = {"symbol": symbol, "leverage": leverage}
+        result = await self._request("POST", "/api/change_leverage", data=data, signed=True)
+        if isinstance(result, dict):
+            return StandardResponse(
+                code=result.get("code", 0),
+                message=result.get("message", "success"),
+                request_id=result.get("request_id")
+            )
+        return StandardResponse(code=0, message="success")
+    
+    async def change_margin_mode(
+        self,
+        symbol: str,
+        margin_mode: Union[MarginMode, str]
+    ) -> StandardResponse:
+        """
+        Change margin mode
+        
+        Args:
+            symbol: Trading pair
+            margin_mode: New margin mode (cross/isolated)
+            
+        Returns:
+            Response data
+        """
+        data = {"symbol": symbol, "margin_mode": margin_mode}
+        result = await self._request("POST", "/api/change_margin_mode", data=data, signed=True)
+        if isinstance(result, dict):
+            return StandardResponse(
+                code=result.get("code", 0),
+                message=result.get("message", "success"),
+                request_id=result.get("request_id")
+            )
+        return StandardResponse(code=0, message="success")
+    
+    async def transfer_margin(
+        self,
+        symbol: str,
+        amount_in: str,
+        direction: str = "add"
+    ) -> StandardResponse:
+        """
+        Transfer margin to/from position
+        
+        Args:
+            symbol: Trading pair
+            amount_in: Amount to transfer (as string)
+            direction: "add" or "remove"
+            
+        Returns:
+            Response data
+        """
+        data = {
+            "symbol": symbol,
+            "amount_in": amount_in,
+            "direction": direction
+        }
+        result = await self._request("POST", "/api/transfer_margin", data=data, signed=True)
+        if isinstance(result, dict):
+            return StandardResponse(
+                code=result.get("code", 0),
+                message=result.get("message", "success"),
+                request_id=result.get("request_id")
+            )
+        return StandardResponse(code=0, message="success")
+    
+    # User Query Endpoints
+    
+    async def query_order(
+        self,
+        symbol: str,
+        order_id: Optional[int] = None,
+        cl_ord_id: Optional[str] = None
+    ) -> Order:
+        """
+        Query order details
+        
+        Args:
+            symbol: Trading pair
+            order_id: Order ID
+            cl_ord_id: Client order ID
+            
+        Returns:
+            Order object
+        """
+        params = {k: v for k, v in (("symbol", symbol), ("order_id", order_id), ("cl_ord_id", cl_ord_id)) if v is not None}
+        
+        return await self._request("GET", "/api/query_order", params=params, model=Order, single=True)
+    
+    async def query_orders(
+        self,
+        symbol: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[Order]:
+        """
+        Query user orders
+        
+        Args:
+            symbol: Trading pair (optional)
+            status: Order status (optional)
+            limit: Number of results (optional)
+            offset: Offset for pagination (optional)
+            
+        Returns:
+            List of Order objects
+        """
+        params = {k: v for k, v in (("symbol", symbol), ("status", status), ("limit", limit), ("offset", offset)) if v is not None}
+        
+        return await self._request("GET", "/api/query_orders", params=params, model=Order)
+    
+    async def query_open_orders(self, symbol: Optional[str] = None) -> List[Order]:
+        """
+        Query all open orders
+        
+        Args:
+            symbol: Trading pair (optional)
+            
+        Returns:
+            List of open Order objects
+        """
+        params = {"symbol": symbol} if symbol is not None else {}
+        
+        return await self._request("GET", "/api/query_open_orders", params=params, model=Order)
+    
+    async def query_trades(
+        self,
+        symbol: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[Trade]:
+        """
+        Query user trades
+        
+        Args:
+            symbol: Trading pair (optional)
+            limit: Number of results (optional)
+            offset: Offset for pagination (optional)
+            
+        Returns:
+            List of trade data
+        """
+        params = {k: v for k, v in (("symbol", symbol), ("limit", limit), ("offset", offset)) if v is not None}
+        
+        return await self._request("GET", "/api/query_trades", params=params, model=Trade)
+    
+    async def iter_trades(
+        self,
+        symbol: Optional[str] = None,
+        page_size: int = 200
+    ) -> AsyncIterator[Trade]:
+        """
+        Iterate over the full trade history one page at a time
+        
+        Use with ``async for``; the next page is only requested once the
+        current one has been consumed.
+        
+        Args:
+            symbol: Trading pair (optional)
+            page_size: Trades requested per page (the server may return fewer)
+            
+        Yields:
+            Trade objects
+        """
+        offset = 0
+        previous_ids = frozenset()
+        while True:
+            page = await self.query_trades(symbol=symbol, limit=page_size, offset=offset)
+            # Stop only on an empty page: the server may cap limit below
+            # page_size, so a short page does not mean the history has ended
+            if not page:
+                break
+            # A server that ignores or clamps offset keeps returning the same
+            # trades; stop once a page brings no trade id beyond the previous one's
+            ids = frozenset(trade.id for trade in page if trade.id is not None)
+            if ids and ids <= previous_ids:
+                break
+            previous_ids = ids
+            for trade in page:
+                yield trade
+            offset += len(page)
+    
+    async def query_position_config(self, symbol: str) -> PositionConfig:
+        """
+        Query position configuration
+        
+        Args:
+            symbol: Trading pair
+            
+        Returns:
+            Position configuration data
+        """
+        return await self._request("GET", "/api/query_position_config", params={"symbol": symbol}, model=PositionConfig, single=True)
+    
+    async def query_positions(self, symbol: Optional[str] = None) -> List[Position]:
+        """
+        Query user positions
+        
+        Args:
+            symbol: Trading pair (optional)
+            
+        Returns:
+            List of Position objects
+        """
+        params = {"symbol": symbol} if symbol is not None else {}
+        
+        return await self._request("GET", "/api/query_positions", params=params, model=Position)
+    
+    async def query_balances(self) -> List[Balance]:
+        """
+        Query user balances
+        
+        Returns:
+            List of Balance objects
+        """
+        return await self._request("GET", "/api/query_user_balances", model=Balance)
+    
+    # Public Endpoints
+    
+    async def query_symbol_info(self, symbol: Optional[str] = None) -> SymbolInfo:
+        """
+        Query symbol information
+        
+        Args:
+            symbol: Trading pair (optional, returns all if omitted)
+            
+        Returns:
+            Symbol information
+        """
+        params = {"symbol": symbol} if symbol is not None else {}
+        
+        return await self._request("GET", "/api/query_symbol_info", params=params, use_jwt=False, model=SymbolInfo, single=True)
+    
+    async def query_symbol_market(self, symbol: str) -> SymbolMarket:
+        """
+        Query symbol market data
+        
+        Args:
+            symbol: Trading pair
+            
+        Returns:
+            Market data
+        """
+        return await self._request("GET", "/api/query_symbol_market", params={"symbol": symbol}, use_jwt=False, model=SymbolMarket, single=True)
+    
+    async def query_symbol_price(self, symbol: str) -> SymbolPrice:
+        """
+        Query symbol price
+        
+        Args:
+            symbol: Trading pair
+            
+        Returns:
+            Price data
+        """
+        return await self._request("GET", "/api/query_symbol_price", params={"symbol": symbol}, use_jwt=False, model=SymbolPrice, single=True)
+    
+    async def query_depth_book(
+        self,
+        symbol: str,
+        limit: Optional[int] = None
+    ) -> DepthBook:
+        """
+        Query order book depth
+        
+        Args:
+            symbol: Trading pair
+            limit: Number of levels (optional, default: 100)
+            
+        Returns:
+            Order book data
+        """
+        params = {"symbol": symbol, "limit": limit} if limit is not None else {"symbol": symbol}
+        
+        return await self._request("GET", "/api/query_depth_book", params=params, use_jwt=False, model=DepthBook, single=True)
+    
+    async def query_recent_trades(
+        self,
+        symbol: str,
+        limit: Optional[int] = None
+    ) -> List[RecentTrade]:
+        """
+        Query recent trades
+        
+        Args:
+            symbol: Trading pair
+            limit: Number of results (optional, default: 100)
+            
+        Returns:
+            List of recent trades
+        """
+        params = {"symbol": symbol, "limit": limit} if limit is not None else {"symbol": symbol}
+        
+        return await self._request("GET", "/api/query_recent_trades", params=params, use_jwt=False, model=RecentTrade)
+    
+    async def query_funding_rates(self, symbol: Optional[str] = None) -> FundingRates:
+        """
+        Query funding rates
+        
+        Args:
+            symbol: Trading pair (optional)
+            
+        Returns:
+            Funding rate data
+        """
+        params = {"symbol": symbol} if symbol is not None else {}
+        
+        return await self._request("GET", "/api/query_funding_rates", params=params, use_jwt=False, model=FundingRates, single=True)
+    
+    # Kline Endpoints
+    
+    async def get_server_time(self) -> ServerTime:
+        """
+        Get server time
+        
+        Returns:
+            Server time data
+        """
+        return await self._request("GET", "/api/kline/time", use_jwt=False, model=ServerTime, single=True)
+    
+    async def get_kline_history(
+        self,
+        symbol: str,
+        resolution: Resolution,
+        from_time: Optional[int] = None,
+        to_time: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> List[Kline]:
+        """
+        Get kline/candlestick history
+        
+        Args:
+            symbol: Trading pair
+            resolution: Kline resolution
+            from_time: Start timestamp (optional)
+            to_time: End timestamp (optional)
+            limit: Number of results (optional, default: 500)
+            
+        Returns:
+            List of kline data
+        """
+        params = {
+            "symbol": symbol,
+            # Query strings use str(), which for a str-mixin Enum is "Resolution.X"
+            "resolution": resolution.value
+        }
+        params.update((k, v) for k, v in (("from", from_time), ("to", to_time), ("limit", limit)) if v is not None)
+        
+        return await self._request("GET", "/api/kline/history", params=params, use_jwt=False, model=Kline)
+    
+    # Health Check
+    
+    async def health(self) -> Health:
+        """
+        Health check endpoint
+        
+        Returns:
+            Health status
+        """
+        return await self._request("GET", "/api/health", use_jwt=False, model=Health, single=True)
+    
+    # Misc Endpoints
+    
+    async def get_region_and_server_time(self) -> Dict[str, Any]:
+        """
+        Get region and server time
+        
+        Returns:
+            Region and server time data
+        """
+        return await self._request("GET", "/api/region_and_server_time", use_jwt=False)
+
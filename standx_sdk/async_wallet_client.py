@@ -0,0 +1,113 @@
+"""Async convenience client that generates credentials from wallet private key"""
+
+import asyncio
+from typing import Optional, Tuple
+from .async_client import AsyncStandXClient
+from .wallet_client import StandXWalletClient
+
+
+class AsyncStandXWalletClient(AsyncStandXClient):
+    """
+    Async StandX client that automatically generates JWT token from wallet private key
+    
+    Credential generation happens once, synchronously, at construction time;
+    all API calls afterwards are coroutines. Inside a running event loop, prefer
+    ``await AsyncStandXWalletClient.create(...)``, which signs in on a worker thread.
+    """
+    
+    def __init__(
+        self,
+        private_key: Optional[str] = None,
+        wallet_address: Optional[str] = None,
+        chain: str = "bsc",
+        base_url: Optional[str] = None,
+        session_id: Optional[str] = None,
+        expires_seconds: int = 604800,
+        session: Optional["aiohttp.ClientSession"] = None,
+        cache_jwt: Optional[bool] = None,
+        http2: bool = False
+    ):
+        """
+        Initialize async StandX client with wallet private key
+        
+        Args:
+            private_key: Wallet private key (hex string). If None, will try to use from .env
+            wallet_address: Wallet address (optional, will derive if not provided)
+            chain: Blockchain network ("bsc" or "solana")
+            base_url: Custom base URL
+            session_id: Session ID for order tracking
+            expires_seconds: JWT token expiration time (default: 7 days)
+            session: Shared aiohttp.ClientSession (created lazily if None)
+            cache_jwt: If True, reuse a still-valid JWT from ~/.standx/jwt_cache.json across runs.
+                If None, enabled when STANDX_CACHE_JWT is set to 1/true/yes
+            http2: If True and no session is given, use an HTTP/2 (httpx) transport
+        """
+        credentials = StandXWalletClient._resolve_credentials(
+            private_key=private_key,
+            wallet_address=wallet_address,
+            chain=chain,
+            expires_seconds=expires_seconds,
+            cache_jwt=cache_jwt
+        )
+        self._init_client(credentials, base_url, session_id, session, http2)
+    
+    @classmethod
+    async def create(
+        cls,
+        private_key: Optional[str] = None,
+        wallet_address: Optional[str] = None,
+        chain: str = "bsc",
+        base_url: Optional[str] = None,
+        session_id: Optional[str] = None,
+        expires_seconds: int = 604800,
+        session: Optional["aiohttp.ClientSession"] = None,
+        cache_jwt: Optional[bool] = None,
+        http2: bool = False
+    ) -> "AsyncStandXWalletClient":
+        """
+        Create the client without blocking the event loop during wallet sign-in
+        
+        The sign-in round-trips (prepare-signin, wallet signature, login) run on a
+        worker thread, so other coroutines, e.g. public market data requests or a
+        WebSocket connect, make progress while the JWT is being issued.
+        
+        Args:
+            Same as AsyncStandXWalletClient()
+            
+        Returns:
+            Initialized AsyncStandXWalletClient
+        """
+        credentials = await asyncio.to_thread(
+            StandXWalletClient._resolve_credentials,
+            private_key=private_key,
+            wallet_address=wallet_address,
+            chain=chain,
+            expires_seconds=expires_seconds,
+            cache_jwt=cache_jwt
+        )
+        client = cls.__new__(cls)
+        client._init_client(credentials, base_url, session_id, session, http2)
+        return client
+    
+    def _init_client(
+        self,
+        credentials: Tuple[str, bytes, str, str],
+        base_url: Optional[str],
+        session_id: Optional[str],
+        session: Optional["aiohttp.ClientSession"],
+        http2: bool
+    ):
+        """Initialize the underlying client from resolved wallet credentials"""
+        jwt_token, ed25519_private_key_bytes, wallet_address, chain = credentials
+        
+        super().__init__(
+            jwt_token=jwt_token,
+            base_url=base_url,
+            session_id=session_id,
+            ed25519_private_key=ed25519_private_key_bytes,
+            session=session,
+            http2=http2
+        )
+        
+        self.wallet_address = wallet_address
+        self.chain = chain
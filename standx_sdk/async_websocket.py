@@ -0,0 +1,462 @@
+"""Asyncio WebSocket client for StandX API"""
+
+import asyncio
+import inspect
+import uuid
+from typing import Optional, Dict, Any, Callable, List, Tuple
+from .auth import StandXAuth
+from . import _json
+from .exceptions import StandXWebSocketError
+from .websocket import (
+    StandXWebSocket,
+    _MAX_PING_LEN,
+    _PING_FRAMES,
+    _frame_text,
+    _signed_order_frame,
+    _subscribe_frame,
+)
+
+try:
+    import aiohttp
+except ImportError:  # Optional dependency, only needed for the async clients
+    aiohttp = None
+
+
+async def _send_text(ws: "aiohttp.ClientWebSocketResponse", frame: bytes):
+    """Send a serialized frame with the text opcode"""
+    # send_frame() (aiohttp 3.11+) writes the UTF-8 bytes as they are;
+    # older releases only accept str for text frames
+    send_frame = getattr(ws, "send_frame", None)
+    if send_frame is not None:
+        await send_frame(frame, aiohttp.WSMsgType.TEXT)
+    else:
+        await ws.send_str(frame.decode('utf-8'))
+
+
+class AsyncStandXWebSocket:
+    """
+    Asyncio WebSocket client for real-time data streams
+    
+    Mirrors StandXWebSocket, but each stream is a task on the running event
+    loop instead of a thread blocked in run_forever(), so both streams (and
+    any number of clients) share one thread. Callbacks may be plain functions
+    or coroutine functions; they run on the event loop. Start the loop with
+    uvloop.run(main()) where uvloop is installed for faster frame handling.
+    """
+    
+    MARKET_STREAM_URL = StandXWebSocket.MARKET_STREAM_URL
+    ORDER_RESPONSE_URL = StandXWebSocket.ORDER_RESPONSE_URL
+    
+    def __init__(
+        self,
+        jwt_token: Optional[str] = None,
+        session_id: Optional[str] = None,
+        on_message: Optional[Callable] = None,
+        on_error: Optional[Callable] = None,
+        on_close: Optional[Callable] = None,
+        on_open: Optional[Callable] = None,
+        ed25519_private_key: Optional[bytes] = None,
+        session: Optional["aiohttp.ClientSession"] = None
+    ):
+        """
+        Initialize async WebSocket client
+        
+        Args:
+            jwt_token: JWT token for authentication
+            session_id: Session ID (must match HTTP client session_id)
+            on_message: Callback for received messages, called with (data, stream_type)
+            on_error: Callback for errors
+            on_close: Callback for connection close
+            on_open: Callback for connection open, called with the stream type
+                ("market" or "order") once the stream is connected and authenticated
+            ed25519_private_key: ed25519 private key bytes bound to the JWT, used to sign
+                orders sent over the order stream (e.g. client.auth.ed25519_private_key)
+            session: Shared aiohttp.ClientSession (created lazily if None)
+        """
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for AsyncStandXWebSocket. Install it with: pip install aiohttp")
+        
+        self.jwt_token = jwt_token
+        self.session_id = session_id or str(uuid.uuid4())
+        # Same ed25519 body signature as the REST client
+        self.auth = StandXAuth(ed25519_private_key=ed25519_private_key) if ed25519_private_key else None
+        
+        self.on_message_callback = on_message
+        self.on_error_callback = on_error
+        self.on_close_callback = on_close
+        self.on_open_callback = on_open
+        
+        self.session = session
+        self._owns_session = session is None
+        
+        self.ws_market: Optional["aiohttp.ClientWebSocketResponse"] = None
+        self.ws_order: Optional["aiohttp.ClientWebSocketResponse"] = None
+        self.connected_market = False
+        self.connected_order = False
+        
+        # Protocol-level ping interval; the connection is dropped when a pong
+        # does not arrive within half of it
+        self._ping_interval = 10  # seconds
+        
+        # stream_type -> reader task
+        self._tasks: Dict[str, asyncio.Task] = {}
+        
+        # request_id -> Future for order stream requests awaiting their response
+        self._pending: Dict[str, asyncio.Future] = {}
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Get the shared session, creating it on first use (must run inside the event loop)"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession()
+            self._owns_session = True
+        return self.session
+    
+    async def _call(self, callback: Callable, *args):
+        """Run a callback, awaiting it if it is a coroutine function"""
+        result = callback(*args)
+        if inspect.isawaitable(result):
+            await result
+    
+    async def _report(self, error: str):
+        """Hand an error message to on_error"""
+        if self.on_error_callback:
+            await self._call(self.on_error_callback, error)
+    
+    async def _open(self, url: str) -> "aiohttp.ClientWebSocketResponse":
+        """Open a WebSocket connection with keepalive pings"""
+        return await self._get_session().ws_connect(url, heartbeat=self._ping_interval, max_msg_size=0)
+    
+    async def _read_loop(self, ws: "aiohttp.ClientWebSocketResponse", stream_type: str, handler: Callable):
+        """Hand every frame of a stream to its handler until the stream closes"""
+        try:
+            async for msg in ws:
+                if msg.type == aiohttp.WSMsgType.TEXT or msg.type == aiohttp.WSMsgType.BINARY:
+                    try:
+                        await handler(ws, msg.data)
+                    except Exception as e:
+                        await self._report(f"{stream_type.capitalize()} stream error: {e}")
+                elif msg.type == aiohttp.WSMsgType.ERROR:
+                    await self._report(f"{stream_type.capitalize()} stream error: {ws.exception()}")
+        finally:
+            await self._on_close(stream_type, ws.close_code)
+    
+    async def _on_message_market(self, ws: "aiohttp.ClientWebSocketResponse", message):
+        """Handle market stream messages"""
+        # Answer heartbeats before any parsing
+        if len(message) <= _MAX_PING_LEN and message in _PING_FRAMES:
+            await _send_text(ws, b"pong")
+            return
+        
+        try:
+            data = _json.loads(message)
+        except _json.JSONDecodeError:
+            await self._report(f"Invalid JSON: {_frame_text(message)}")
+            return
+        
+        if self.on_message_callback:
+            await self._call(self.on_message_callback, data, "market")
+    
+    async def _on_message_order(self, ws: "aiohttp.ClientWebSocketResponse", message):
+        """Handle order response stream messages"""
+        try:
+            data = _json.loads(message)
+        except _json.JSONDecodeError:
+            await self._report(f"Invalid JSON: {_frame_text(message)}")
+            return
+        
+        # Complete the Future of a place_order() call waiting on this response
+        if self._pending and isinstance(data, dict):
+            future = self._pending.pop(data.get("request_id"), None)
+            if future is not None and not future.done():
+                future.set_result(data)
+        
+        if self.on_message_callback:
+            await self._call(self.on_message_callback, data, "order")
+    
+    async def _on_close(self, stream_type: str, close_status_code: Optional[int]):
+        """Handle stream close"""
+        if stream_type == "market":
+            self.connected_market = False
+        else:
+            self.connected_order = False
+            # Fail requests that can no longer be answered
+            pending, self._pending = self._pending, {}
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(StandXWebSocketError("Order stream closed before a response was received"))
+        if self.on_close_callback:
+            await self._call(self.on_close_callback, stream_type, close_status_code, None)
+    
+    async def connect_market_stream(self):
+        """Connect to market data stream, authenticating with the JWT if one is set"""
+        if self.ws_market is not None and self.connected_market:
+            return
+        
+        self.ws_market = await self._open(self.MARKET_STREAM_URL)
+        self.connected_market = True
+        if self.jwt_token:
+            await self.authenticate_market()
+        
+        self._tasks["market"] = asyncio.create_task(
+            self._read_loop(self.ws_market, "market", self._on_message_market)
+        )
+        if self.on_open_callback:
+            await self._call(self.on_open_callback, "market")
+    
+    async def connect_order_stream(self):
+        """Connect to order response stream, authenticating with the JWT if one is set"""
+        if self.ws_order is not None and self.connected_order:
+            return
+        
+        self.ws_order = await self._open(self.ORDER_RESPONSE_URL)
+        self.connected_order = True
+        if self.jwt_token:
+            await self.authenticate_order()
+        
+        self._tasks["order"] = asyncio.create_task(
+            self._read_loop(self.ws_order, "order", self._on_message_order)
+        )
+        if self.on_open_callback:
+            await self._call(self.on_open_callback, "order")
+    
+    async def authenticate_market(self, streams: Optional[List[Dict]] = None):
+        """
+        Authenticate market stream with JWT
+        
+        Args:
+            streams: Optional list of channels to subscribe to immediately
+        """
+        if not self.jwt_token or not self.ws_market:
+            return
+        
+        auth = {"token": self.jwt_token}
+        if streams:
+            auth["streams"] = streams
+        await _send_text(self.ws_market, _json.dumps_bytes({"auth": auth}))
+    
+    async def authenticate_order(self):
+        """Authenticate order response stream with JWT"""
+        if not self.jwt_token or not self.ws_order:
+            return
+        
+        request_id = self.auth.next_request_id() if self.auth else str(uuid.uuid4())
+        auth_msg = {
+            "session_id": self.session_id,
+            "request_id": request_id,
+            "method": "auth:login",
+            "params": _json.dumps({"token": self.jwt_token})
+        }
+        
+        await _send_text(self.ws_order, _json.dumps_bytes(auth_msg))
+    
+    async def subscribe(
+        self,
+        channel: str,
+        symbol: Optional[str] = None
+    ):
+        """
+        Subscribe to a market stream channel
+        
+        Args:
+            channel: Channel name (price, depth_book, order, position, balance, trade)
+            symbol: Symbol for symbol-specific channels (optional)
+        """
+        if not self.ws_market or not self.connected_market:
+            raise StandXWebSocketError("Market stream not connected")
+        
+        await _send_text(self.ws_market, _subscribe_frame(channel, symbol or None))
+    
+    async def subscribe_many(self, subscriptions: List[Tuple[str, Optional[str]]]):
+        """
+        Subscribe to several market stream channels
+        
+        Args:
+            subscriptions: (channel, symbol) pairs; symbol may be None for
+                channels that are not symbol-specific
+        """
+        if not self.ws_market or not self.connected_market:
+            raise StandXWebSocketError("Market stream not connected")
+        
+        for channel, symbol in subscriptions:
+            await _send_text(self.ws_market, _subscribe_frame(channel, symbol or None))
+    
+    async def _send_signed(self, method: str, params: Dict[str, Any], track: bool = False):
+        """
+        Sign params with ed25519 and send them as an order stream request
+        
+        Args:
+            method: Request method (e.g. "order:new")
+            params: Request parameters
+            track: If True, register a Future completed by the matching response
+        
+        Returns:
+            Tuple of (request_id, Future or None)
+        """
+        if not self.ws_order or not self.connected_order:
+            raise StandXWebSocketError("Order stream not connected")
+        
+        if not self.auth:
+            raise StandXWebSocketError("ed25519_private_key required for signed order stream requests")
+        
+        request_id, frame = _signed_order_frame(self.auth, self.session_id, method, params)
+        
+        future = None
+        if track:
+            # Register before sending so a fast response cannot be missed
+            future = asyncio.get_running_loop().create_future()
+            self._pending[request_id] = future
+        
+        try:
+            await _send_text(self.ws_order, frame)
+        except Exception:
+            self._pending.pop(request_id, None)
+            raise
+        return request_id, future
+    
+    async def create_order_ws(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        qty: str,
+        time_in_force: str,
+        price: Optional[str] = None,
+        **kwargs
+    ) -> str:
+        """
+        Create order via WebSocket
+        
+        Args:
+            symbol: Trading pair
+            side: Order side (buy/sell)
+            order_type: Order type (limit/market)
+            qty: Order quantity
+            time_in_force: Time in force
+            price: Order price (for limit orders)
+            **kwargs: Additional order parameters
+        
+        Returns:
+            Request ID; the response arrives on the order stream's on_message
+        """
+        params = {
+            "symbol": symbol,
+            "side": side,
+            "order_type": order_type,
+            "qty": qty,
+            "time_in_force": time_in_force,
+            **kwargs
+        }
+        
+        if price:
+            params["price"] = price
+        
+        request_id, _ = await self._send_signed("order:new", params)
+        return request_id
+    
+    async def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        qty: str,
+        time_in_force: str,
+        price: Optional[str] = None,
+        timeout: float = 10,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Create order via WebSocket and wait for its response
+        
+        Args:
+            symbol: Trading pair
+            side: Order side (buy/sell)
+            order_type: Order type (limit/market)
+            qty: Order quantity
+            time_in_force: Time in force
+            price: Order price (for limit orders)
+            timeout: Seconds to wait for the response
+            **kwargs: Additional order parameters
+        
+        Returns:
+            Response frame from the order stream (code 0 on success)
+        
+        Raises:
+            StandXWebSocketError: If the stream is not connected or closes before responding
+            asyncio.TimeoutError: If no response arrives within timeout
+        """
+        params = {
+            "symbol": symbol,
+            "side": side,
+            "order_type": order_type,
+            "qty": qty,
+            "time_in_force": time_in_force,
+            **kwargs
+        }
+        
+        if price:
+            params["price"] = price
+        
+        request_id, future = await self._send_signed("order:new", params, track=True)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(request_id, None)
+    
+    async def cancel_order_ws(
+        self,
+        order_id: Optional[int] = None,
+        cl_ord_id: Optional[str] = None
+    ) -> str:
+        """
+        Cancel order via WebSocket
+        
+        Args:
+            order_id: Order ID
+            cl_ord_id: Client order ID
+        
+        Returns:
+            Request ID; the response arrives on the order stream's on_message
+        """
+        params = {}
+        if order_id:
+            params["order_id"] = order_id
+        if cl_ord_id:
+            params["cl_ord_id"] = cl_ord_id
+        
+        request_id, _ = await self._send_signed("order:cancel", params)
+        return request_id
+    
+    async def _disconnect(self, stream_type: str, ws: Optional["aiohttp.ClientWebSocketResponse"]):
+        """Close a stream and wait for its reader task to finish"""
+        if ws is not None:
+            await ws.close()
+        task = self._tasks.pop(stream_type, None)
+        if task is not None:
+            await task
+    
+    async def disconnect_market(self):
+        """Disconnect market stream"""
+        await self._disconnect("market", self.ws_market)
+        self.connected_market = False
+    
+    async def disconnect_order(self):
+        """Disconnect order stream"""
+        await self._disconnect("order", self.ws_order)
+        self.connected_order = False
+    
+    async def disconnect_all(self):
+        """Disconnect all streams"""
+        await self.disconnect_market()
+        await self.disconnect_order()
+    
+    async def close(self):
+        """Disconnect all streams and close the session if it was created by this client"""
+        await self.disconnect_all()
+        if self.session is not None and self._owns_session and not self.session.closed:
+            await self.session.close()
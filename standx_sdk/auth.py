@@ -1,11 +1,20 @@
 """Authentication and signature generation for StandX API"""
 
-import base64
-import uuid
+import binascii
+import itertools
+import secrets
 import time
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 from cryptography.hazmat.primitives.asymmetric import ed25519
 
+try:
+    import nacl.signing
+except ImportError:
+    nacl = None
+
+SIGN_VERSION = "v1"
+SIGN_VERSION_BYTES = SIGN_VERSION.encode('ascii')
+
 
 class StandXAuth:
     """Handles authentication and request signing for StandX API using ed25519"""
@@ -25,6 +34,23 @@ class StandXAuth:
             self._ed25519_private_key = ed25519.Ed25519PrivateKey.from_private_bytes(ed25519_private_key)
         
         self._ed25519_public_key = self._ed25519_private_key.public_key()
+        
+        # Request ids: random per-client prefix + counter, no urandom call per request
+        self._id_prefix = secrets.token_hex(8)
+        self._id_seq = itertools.count()
+        
+        # Sign through libsodium when PyNaCl is installed (faster for many orders/sec);
+        # ed25519 is deterministic, so both backends produce identical signatures
+        self._nacl_key = (
+            nacl.signing.SigningKey(self._ed25519_private_key.private_bytes_raw())
+            if nacl is not None else None
+        )
+        # Bind the signer once so each request makes a single call with no backend check
+        if self._nacl_key is not None:
+            nacl_sign = self._nacl_key.sign
+            self._sign = lambda message: nacl_sign(message).signature
+        else:
+            self._sign = self._ed25519_private_key.sign
     
     @property
     def ed25519_private_key(self) -> bytes:
@@ -36,10 +62,25 @@ class StandXAuth:
         """Get ed25519 public key bytes"""
         return self._ed25519_public_key.public_bytes_raw()
     
+    def next_request_id(self) -> str:
+        """
+        Get a unique request id for this client
+        
+        Ids keep the UUID layout used in the StandX API docs but are built from a
+        random per-client prefix and an increasing counter, so they never collide
+        within a session and sort in send order.
+        
+        Returns:
+            UUID-formatted request id string
+        """
+        h = f"{self._id_prefix}{next(self._id_seq):016x}"
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+    
     def generate_signature_headers(
         self,
-        body: str,
-        session_id: Optional[str] = None
+        body: Union[str, bytes],
+        session_id: Optional[str] = None,
+        timestamp: Optional[str] = None
     ) -> Dict[str, str]:
         """
         Generate signature headers for authenticated requests using ed25519
@@ -48,30 +89,33 @@ class StandXAuth:
         Message format: {version},{id},{timestamp},{payload}
         
         Args:
-            body: JSON stringified request body (payload)
+            body: JSON request body (payload). Pass the UTF-8 encoded bytes that
+                will be sent to avoid re-encoding; str is still accepted.
             session_id: Optional session ID for order tracking
+            timestamp: Millisecond timestamp string to sign with, e.g. one
+                shared by a batch of requests (default: current time)
             
         Returns:
             Dictionary of headers to include in the request
         """
-        version = "v1"
-        request_id = str(uuid.uuid4())  # Use UUID as requestId (per StandX API docs example)
-        timestamp = int(time.time() * 1000)
+        request_id = self.next_request_id()
+        if timestamp is None:
+            timestamp = str(time.time_ns() // 1_000_000)
         
-        # Build message to sign: "{version},{id},{timestamp},{payload}"
-        message = f"{version},{request_id},{timestamp},{body}"
+        if isinstance(body, str):
+            body = body.encode('utf-8')
         
-        # Sign message with ed25519 private key
-        message_bytes = message.encode('utf-8')
-        signature = self._ed25519_private_key.sign(message_bytes)
+        # Build message to sign as bytes: "{version},{id},{timestamp},{payload}"
+        message_bytes = b",".join((SIGN_VERSION_BYTES, request_id.encode('ascii'), timestamp.encode('ascii'), body))
         
-        # Base64 encode the signature
-        signature_b64 = base64.b64encode(signature).decode('utf-8')
+        # Sign message with ed25519 private key and base64 encode the signature;
+        # b2a_base64 is the C routine behind b64encode without its altchars handling
+        signature_b64 = binascii.b2a_base64(self._sign(message_bytes), newline=False).decode('ascii')
         
         headers = {
-            "x-request-sign-version": version,
+            "x-request-sign-version": SIGN_VERSION,
             "x-request-id": request_id,
-            "x-request-timestamp": str(timestamp),
+            "x-request-timestamp": timestamp,
             "x-request-signature": signature_b64,
             "Content-Type": "application/json",
         }
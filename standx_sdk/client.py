@@ -1,10 +1,18 @@
 """Main StandX API client"""
 
-import json
+import math
+import functools
+from decimal import Decimal
 import requests
-from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Union, Iterator, Tuple
 from .auth import StandXAuth
-from .exceptions import StandXAPIError, StandXAuthenticationError, StandXRequestError
+from .http2 import HTTP2Session, http2_available
+from .session import create_session
+from ._cache import TTLCache, ttl_cached
+from ._decode import decode_model, decode_model_list
+from . import _json
+from .exceptions import StandXAPIError, StandXRequestError, error_from_response
 from .types import (
     OrderSide,
     OrderType,
@@ -13,6 +21,7 @@ from .types import (
     Resolution,
 )
 from .models import (
+    NewOrderRequest,
     OrderResponse,
     StandardResponse,
     Order,
@@ -32,10 +41,14 @@ from .models import (
 )
 
 
+# Shared, never mutated: requests and aiohttp copy headers before sending
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 class StandXClient:
     """Main client for interacting with StandX API"""
     
     BASE_URL = "https://perps.standx.com"
+    REQUEST_TIMEOUT = (5, 30)  # (connect, read) seconds: fail fast on a dead connection
     
     def __init__(
         self,
@@ -44,7 +57,10 @@ class StandXClient:
         api_secret: Optional[str] = None,
         base_url: Optional[str] = None,
         session_id: Optional[str] = None,
-        ed25519_private_key: Optional[bytes] = None
+        ed25519_private_key: Optional[bytes] = None,
+        session: Optional[requests.Session] = None,
+        http2: bool = False,
+        cache_market_data: bool = False
     ):
         """
         Initialize StandX client
@@ -56,13 +72,131 @@ class StandXClient:
             base_url: Custom base URL (defaults to production)
             session_id: Session ID for order tracking via WebSocket
             ed25519_private_key: ed25519 private key bytes for body signature (auto-generated if None)
+            session: Shared requests.Session for connection reuse (optional,
+                defaults to a pooled session from create_session())
+            http2: If True and no session is given, use an HTTP/2 (httpx) session.
+                Falls back to requests.Session when httpx[http2] is not installed
+            cache_market_data: If True, cache symbol prices for 1s, funding rates for 5s
+                and symbol info / position config for 60s (see invalidate_cache())
         """
         self.jwt_token = jwt_token
         self.base_url = base_url or self.BASE_URL
         self.session_id = session_id
         # Use ed25519 for body signature (per StandX API docs)
         self.auth = StandXAuth(ed25519_private_key=ed25519_private_key)
+        # Reuse one session so keep-alive connections are shared across calls
+        self._owns_session = session is None
+        if session is None:
+            session = HTTP2Session() if http2 and http2_available() else create_session()
+        self.session = session
+        # Short-lived cache for rarely changing data, only used when enabled
+        self._cache = TTLCache() if cache_market_data else None
+        # symbol -> (tick_size, price_decimals, step_size, qty_decimals), filled on first use
+        self._grids: Dict[str, Tuple[Optional[float], int, Optional[float], int]] = {}
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def close(self):
+        """Close pooled connections if the session was created by this client"""
+        if self._owns_session:
+            self.session.close()
+    
+    @property
+    def base_url(self) -> str:
+        """API base URL"""
+        return self._base_url
+    
+    @base_url.setter
+    def base_url(self, url: str):
+        self._base_url = url
+        # endpoint -> full URL, joined on first use
+        self._urls: Dict[str, str] = {}
+    
+    @property
+    def jwt_token(self) -> Optional[str]:
+        """JWT access token sent with authenticated requests"""
+        return self._jwt_token
+    
+    @jwt_token.setter
+    def jwt_token(self, token: Optional[str]):
+        # Build the request headers once per token instead of once per request
+        self._jwt_token = token
+        self._jwt_headers = (
+            {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+            if token else _JSON_HEADERS
+        )
+    
+    def invalidate_cache(self, symbol: Optional[str] = None):
+        """
+        Drop cached market data so the next call fetches fresh values
+        
+        Args:
+            symbol: Only drop entries for this symbol (all entries if omitted)
+        """
+        if self._cache is None:
+            return
+        if symbol is None:
+            self._cache.invalidate()
+        else:
+            self._cache.invalidate(lambda key: symbol in key or ("symbol", symbol) in key)
+        
+    @staticmethod
+    def _parse_increment(increment: Optional[str]) -> Tuple[Optional[float], int]:
+        """Split an increment string such as "0.01" into (0.01, 2 decimals)"""
+        if not increment or float(increment) <= 0:
+            return None, 8
+        return float(increment), max(0, -Decimal(increment).normalize().as_tuple().exponent)
+    
+    def _grid(self, symbol: str) -> Tuple[Optional[float], int, Optional[float], int]:
+        """Get the cached price/quantity increments for a symbol, querying them once"""
+        grid = self._grids.get(symbol)
+        if grid is None:
+            info = self.query_symbol_info(symbol)
+            grid = self._parse_increment(info.tick_size) + self._parse_increment(info.step_size)
+            self._grids[symbol] = grid
+        return grid
+    
+    def format_price(self, symbol: str, price: float) -> str:
+        """
+        Round a price to the symbol's tick size and format it for an order
+        
+        The tick size is looked up once per symbol and cached on the client,
+        so later calls do no I/O. Prices off the exchange grid would be
+        rejected, costing a full round-trip to retry.
         
+        Args:
+            symbol: Trading pair
+            price: Price to format
+            
+        Returns:
+            Price string with the symbol's number of decimals
+        """
+        tick, decimals, _, _ = self._grid(symbol)
+        if tick is not None:
+            price = round(price / tick) * tick
+        return f"{price:.{decimals}f}"
+    
+    def format_qty(self, symbol: str, qty: float) -> str:
+        """
+        Round a quantity down to the symbol's step size and format it for an order
+        
+        Args:
+            symbol: Trading pair
+            qty: Quantity to format
+            
+        Returns:
+            Quantity string with the symbol's number of decimals
+        """
+        _, _, step, decimals = self._grid(symbol)
+        if step is not None:
+            # Small epsilon so values already on the grid are not floored one step down
+            qty = math.floor(qty / step + 1e-9) * step
+        return f"{qty:.{decimals}f}"
+    
     def _request(
         self,
         method: str,
@@ -70,8 +204,10 @@ class StandXClient:
         params: Optional[Dict] = None,
         data: Optional[Dict] = None,
         signed: bool = False,
-        use_jwt: bool = True
-    ) -> Dict[str, Any]:
+        use_jwt: bool = True,
+        model: Optional[type] = None,
+        single: bool = False
+    ) -> Any:
         """
         Make HTTP request to API
         
@@ -82,69 +218,53 @@ class StandXClient:
             data: Request body data
             signed: Whether to sign the request
             use_jwt: Whether to use JWT authentication
+            model: If set, the response is a list and is returned as a list of this model
+            single: With model, the response is one object returned as a model instance
             
         Returns:
-            API response data
+            API response data (model instance(s) when model is given)
             
         Raises:
             StandXAPIError: If request fails
         """
-        url = f"{self.base_url}{endpoint}"
-        headers = {"Content-Type": "application/json"}
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = self._base_url + endpoint
+        
+        # Serialize the body once, for unsigned requests too; signed requests sign exactly these bytes
+        body = _json.dumps_bytes(data) if data else None
         
         # Add authentication
         if signed and self.auth:
-            body = json.dumps(data) if data else "{}"
-            headers.update(self.auth.generate_signature_headers(body, self.session_id))
+            headers = self.auth.generate_signature_headers(body or b"{}", self.session_id)
             # Signed requests also need JWT token
-            if use_jwt and self.jwt_token:
-                headers["Authorization"] = f"Bearer {self.jwt_token}"
-        elif use_jwt and self.jwt_token:
-            headers["Authorization"] = f"Bearer {self.jwt_token}"
+            if use_jwt and self._jwt_token:
+                headers["Authorization"] = self._jwt_headers["Authorization"]
+        else:
+            headers = self._jwt_headers if use_jwt else _JSON_HEADERS
         
         # Make request
         try:
-            response = requests.request(
+            response = self.session.request(
                 method=method,
                 url=url,
                 params=params,
-                json=data if not signed else None,
-                data=json.dumps(data) if signed and data else None,
+                data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.REQUEST_TIMEOUT
             )
             
-            # Handle response
-            if response.status_code == 401:
-                error_msg = "Authentication failed"
-                try:
-                    error_data = response.json()
-                    error_msg = error_data.get("message", error_msg)
-                except:
-                    error_msg = response.text or error_msg
-                raise StandXAuthenticationError(error_msg, 401)
-            
-            # Get response text before raising for status (to capture error details)
-            response_text = response.text
-            
+            # Handle error responses (the body is parsed once, in error_from_response)
             if not response.ok:
-                try:
-                    error_data = response.json()
-                    error_msg = error_data.get("message", response_text)
-                    code = error_data.get("code", response.status_code)
-                    request_id = error_data.get("request_id")
-                    # Include full error data for debugging
-                    if response.status_code in [422, 400]:
-                        error_msg = f"{error_msg} | Full response: {json.dumps(error_data)}"
-                    raise StandXAPIError(error_msg, code, request_id)
-                except json.JSONDecodeError:
-                    # If not JSON, raise with text
-                    raise StandXRequestError(f"Request failed: {response.status_code} - {response_text}")
-                except StandXAPIError:
-                    raise  # Re-raise StandXAPIError
+                raise error_from_response(response.status_code, response.content)
+            
+            # Fast path: decode straight into model instances when msgspec is available
+            if model is not None:
+                items = decode_model(response.content, model) if single else decode_model_list(response.content, model)
+                if items is not None:
+                    return items
             
-            response.raise_for_status()
-            result = response.json()
+            result = _json.loads(response.content)
             
             # Check API-level errors (only if code field exists and is not 0)
             # Successful responses may not have a code field at all
@@ -155,30 +275,66 @@ class StandXClient:
                 raise StandXAPIError(message, code, request_id)
             
             # Handle response - can be dict with data field, or direct list/dict
-            if isinstance(result, dict):
-                return result.get("data", result)
-            else:
-                # Direct list or other type
-                return result
+            data = result.get("data", result) if isinstance(result, dict) else result
+            if model is not None and single:
+                return model.from_dict(data) if isinstance(data, dict) else model()
+            if model is not None:
+                return list(map(model.from_dict, data)) if isinstance(data, list) else []
+            return data
             
         except requests.exceptions.RequestException as e:
             raise StandXRequestError(f"Request failed: {str(e)}")
-        except json.JSONDecodeError:
+        except _json.JSONDecodeError:
             raise StandXRequestError("Invalid JSON response")
     
+    def warmup(self, symbols: Optional[List[str]] = None) -> bool:
+        """
+        Open pooled connections ahead of the first real requests
+        
+        Sends a cheap unauthenticated GET so the TCP+TLS handshake is already
+        done when the first order or query goes out. Prices for `symbols`
+        (and positions, when a JWT is set) are requested concurrently on
+        their own pooled connections; with cache_market_data=True the first
+        query_symbol_price() calls are then answered from the cache.
+        
+        Args:
+            symbols: Trading pairs whose prices to fetch as well (optional)
+        
+        Returns:
+            True if the server answered, False otherwise
+        """
+        calls = [self.get_server_time]
+        calls += [functools.partial(self.query_symbol_price, symbol) for symbol in symbols or ()]
+        if self.jwt_token:
+            calls.append(self.query_positions)
+        
+        def call(fn) -> bool:
+            # Best effort: any failure, including a response that does not
+            # decode, only means the connection was not warmed
+            try:
+                fn()
+                return True
+            except Exception:
+                return False
+        
+        if len(calls) == 1:
+            return call(calls[0])
+        with ThreadPoolExecutor(max_workers=min(4, len(calls))) as executor:
+            return list(executor.map(call, calls))[0]
+    
     # Trade Endpoints
     
     def create_order(
         self,
         symbol: str,
-        side: OrderSide,
-        order_type: OrderType,
+        side: Union[OrderSide, str],
+        order_type: Union[OrderType, str],
         qty: str,
-        time_in_force: TimeInForce,
+        time_in_force: Union[TimeInForce, str],
         price: Optional[str] = None,
         reduce_only: Optional[bool] = None,
         cl_ord_id: Optional[str] = None,
-        margin_mode: Optional[MarginMode] = None,
+        margin_mode: Optional[Union[MarginMode, str]] = None,
         leverage: Optional[int] = None
     ) -> OrderResponse:
         """
@@ -186,10 +342,10 @@ class StandXClient:
         
         Args:
             symbol: Trading pair (e.g., "BTC-USD")
-            side: Order side (buy/sell)
-            order_type: Order type (limit/market)
+            side: Order side (OrderSide or its string value, buy/sell)
+            order_type: Order type (OrderType or its string value, limit/market)
             qty: Order quantity (as string)
-            time_in_force: Time in force (gtc/ioc/alo)
+            time_in_force: Time in force (TimeInForce or its string value, gtc/ioc/alo)
             price: Order price (required for limit orders, as string)
             reduce_only: Only reduce position if true
             cl_ord_id: Client order ID (auto-generated if omitted)
@@ -199,12 +355,13 @@ class StandXClient:
         Returns:
             Order creation response
         """
+        # The enums subclass str and serialize as their values, so no .value lookups
         data = {
             "symbol": symbol,
-            "side": side.value,
-            "order_type": order_type.value,
+            "side": side,
+            "order_type": order_type,
             "qty": qty,
-            "time_in_force": time_in_force.value,
+            "time_in_force": time_in_force,
             "reduce_only": reduce_only if reduce_only is not None else False,  # Required field
         }
         
@@ -213,7 +370,7 @@ class StandXClient:
         if cl_ord_id:
             data["cl_ord_id"] = cl_ord_id
         if margin_mode:
-            data["margin_mode"] = margin_mode.value
+            data["margin_mode"] = margin_mode
         if leverage:
             data["leverage"] = leverage
         
@@ -228,6 +385,53 @@ class StandXClient:
             )
         return OrderResponse(code=0, message="success")
     
+    def create_orders(
+        self,
+        orders: List[Union[NewOrderRequest, Dict[str, Any]]],
+        max_workers: int = 10
+    ) -> List[OrderResponse]:
+        """
+        Create multiple orders
+        
+        The API has no batch order endpoint, so the orders are submitted
+        concurrently over the shared session. Total latency is roughly one
+        round-trip instead of one per order.
+        
+        Args:
+            orders: List of order requests (NewOrderRequest or dicts with the same fields)
+            max_workers: Maximum number of orders in flight at once
+            
+        Returns:
+            List of order creation responses, in the same order as `orders`.
+            A rejected order yields a response carrying the error code and message.
+        """
+        def submit(order: NewOrderRequest) -> OrderResponse:
+            if isinstance(order, dict):
+                order = NewOrderRequest(**order)
+            try:
+                return self.create_order(
+                    symbol=order.symbol,
+                    side=order.side,
+                    order_type=order.order_type,
+                    qty=order.qty,
+                    time_in_force=order.time_in_force,
+                    price=order.price,
+                    reduce_only=order.reduce_only,
+                    cl_ord_id=order.cl_ord_id,
+                    margin_mode=order.margin_mode,
+                    leverage=order.leverage
+                )
+            except StandXAPIError as e:
+                return OrderResponse(code=e.code or -1, message=e.message, request_id=e.request_id)
+        
+        if not orders:
+            return []
+        if len(orders) == 1:
+            return [submit(orders[0])]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(orders))) as executor:
+            return list(executor.map(submit, orders))
+    
     def cancel_order(
         self,
         order_id: Optional[int] = None,
@@ -310,6 +514,7 @@ class StandXClient:
         """
         data = {"symbol": symbol, "leverage": leverage}
         result = self._request("POST", "/api/change_leverage", data=data, signed=True)
+        self.invalidate_cache(symbol)
         if isinstance(result, dict):
             return StandardResponse(
                 code=result.get("code", 0),
@@ -321,7 +526,7 @@ class StandXClient:
     def change_margin_mode(
         self,
         symbol: str,
-        margin_mode: MarginMode
+        margin_mode: Union[MarginMode, str]
     ) -> StandardResponse:
         """
         Change margin mode
@@ -333,8 +538,9 @@ class StandXClient:
         Returns:
             Response data
         """
-        data = {"symbol": symbol, "margin_mode": margin_mode.value}
+        data = {"symbol": symbol, "margin_mode": margin_mode}
         result = self._request("POST", "/api/change_margin_mode", data=data, signed=True)
+        self.invalidate_cache(symbol)
         if isinstance(result, dict):
             return StandardResponse(
                 code=result.get("code", 0),
@@ -393,14 +599,9 @@ class StandXClient:
         Returns:
             Order object
         """
-        params = {"symbol": symbol}
-        if order_id:
-            params["order_id"] = order_id
-        if cl_ord_id:
-            params["cl_ord_id"] = cl_ord_id
+        params = {k: v for k, v in (("symbol", symbol), ("order_id", order_id), ("cl_ord_id", cl_ord_id)) if v is not None}
         
-        data = self._request("GET", "/api/query_order", params=params)
-        return Order.from_dict(data)
+        return self._request("GET", "/api/query_order", params=params, model=Order, single=True)
     
     def query_orders(
         self,
@@ -421,18 +622,9 @@ class StandXClient:
         Returns:
             List of Order objects
         """
-        params = {}
-        if symbol:
-            params["symbol"] = symbol
-        if status:
-            params["status"] = status
-        if limit:
-            params["limit"] = limit
-        if offset:
-            params["offset"] = offset
+        params = {k: v for k, v in (("symbol", symbol), ("status", status), ("limit", limit), ("offset", offset)) if v is not None}
         
-        data = self._request("GET", "/api/query_orders", params=params)
-        return [Order.from_dict(order) for order in data] if isinstance(data, list) else []
+        return self._request("GET", "/api/query_orders", params=params, model=Order)
     
     def query_open_orders(self, symbol: Optional[str] = None) -> List[Order]:
         """
@@ -444,12 +636,9 @@ class StandXClient:
         Returns:
             List of open Order objects
         """
-        params = {}
-        if symbol:
-            params["symbol"] = symbol
+        params = {"symbol": symbol} if symbol is not None else {}
         
-        data = self._request("GET", "/api/query_open_orders", params=params)
-        return [Order.from_dict(order) for order in data] if isinstance(data, list) else []
+        return self._request("GET", "/api/query_open_orders", params=params, model=Order)
     
     def query_trades(
         self,
@@ -468,17 +657,47 @@ class StandXClient:
         Returns:
             List of trade data
         """
-        params = {}
-        if symbol:
-            params["symbol"] = symbol
-        if limit:
-            params["limit"] = limit
-        if offset:
-            params["offset"] = offset
+        params = {k: v for k, v in (("symbol", symbol), ("limit", limit), ("offset", offset)) if v is not None}
+        
+        return self._request("GET", "/api/query_trades", params=params, model=Trade)
+    
+    def iter_trades(
+        self,
+        symbol: Optional[str] = None,
+        page_size: int = 200
+    ) -> Iterator[Trade]:
+        """
+        Iterate over the full trade history one page at a time
         
-        data = self._request("GET", "/api/query_trades", params=params)
-        return [Trade.from_dict(trade) for trade in data] if isinstance(data, list) else []
+        Pages are requested lazily as the caller consumes them, so memory
+        stays bounded by page_size and breaking out of the loop early skips
+        the remaining requests.
+        
+        Args:
+            symbol: Trading pair (optional)
+            page_size: Trades requested per page (the server may return fewer)
+            
+        Yields:
+            Trade objects
+        """
+        offset = 0
+        previous_ids = frozenset()
+        while True:
+            page = self.query_trades(symbol=symbol, limit=page_size, offset=offset)
+            # Stop only on an empty page: the server may cap limit below
+            # page_size, so a short page does not mean the history has ended
+            if not page:
+                break
+            # A server that ignores or clamps offset keeps returning the same
+            # trades; stop once a page brings no trade id beyond the previous one's
+            ids = frozenset(trade.id for trade in page if trade.id is not None)
+            if ids and ids <= previous_ids:
+                break
+            previous_ids = ids
+            yield from page
+            offset += len(page)
     
+    @ttl_cached(60)
     def query_position_config(self, symbol: str) -> PositionConfig:
         """
         Query position configuration
@@ -489,8 +708,7 @@ class StandXClient:
         Returns:
             Position configuration data
         """
-        data = self._request("GET", "/api/query_position_config", params={"symbol": symbol})
-        return PositionConfig.from_dict(data) if isinstance(data, dict) else PositionConfig()
+        return self._request("GET", "/api/query_position_config", params={"symbol": symbol}, model=PositionConfig, single=True)
     
     def query_positions(self, symbol: Optional[str] = None) -> List[Position]:
         """
@@ -502,12 +720,9 @@ class StandXClient:
         Returns:
             List of Position objects
         """
-        params = {}
-        if symbol:
-            params["symbol"] = symbol
+        params = {"symbol": symbol} if symbol is not None else {}
         
-        data = self._request("GET", "/api/query_positions", params=params)
-        return [Position.from_dict(pos) for pos in data] if isinstance(data, list) else []
+        return self._request("GET", "/api/query_positions", params=params, model=Position)
     
     def query_balances(self) -> List[Balance]:
         """
@@ -516,11 +731,11 @@ class StandXClient:
         Returns:
             List of Balance objects
         """
-        data = self._request("GET", "/api/query_user_balances")
-        return [Balance.from_dict(bal) for bal in data] if isinstance(data, list) else []
+        return self._request("GET", "/api/query_user_balances", model=Balance)
     
     # Public Endpoints
     
+    @ttl_cached(60)
     def query_symbol_info(self, symbol: Optional[str] = None) -> SymbolInfo:
         """
         Query symbol information
@@ -531,12 +746,9 @@ class StandXClient:
         Returns:
             Symbol information
         """
-        params = {}
-        if symbol:
-            params["symbol"] = symbol
+        params = {"symbol": symbol} if symbol is not None else {}
         
-        data = self._request("GET", "/api/query_symbol_info", params=params, use_jwt=False)
-        return SymbolInfo.from_dict(data) if isinstance(data, dict) else SymbolInfo()
+        return self._request("GET", "/api/query_symbol_info", params=params, use_jwt=False, model=SymbolInfo, single=True)
     
     def query_symbol_market(self, symbol: str) -> SymbolMarket:
         """
@@ -548,9 +760,9 @@ class StandXClient:
         Returns:
             Market data
         """
-        data = self._request("GET", "/api/query_symbol_market", params={"symbol": symbol}, use_jwt=False)
-        return SymbolMarket.from_dict(data) if isinstance(data, dict) else SymbolMarket()
+        return self._request("GET", "/api/query_symbol_market", params={"symbol": symbol}, use_jwt=False, model=SymbolMarket, single=True)
     
+    @ttl_cached(1)
     def query_symbol_price(self, symbol: str) -> SymbolPrice:
         """
         Query symbol price
@@ -561,8 +773,7 @@ class StandXClient:
         Returns:
             Price data
         """
-        data = self._request("GET", "/api/query_symbol_price", params={"symbol": symbol}, use_jwt=False)
-        return SymbolPrice.from_dict(data) if isinstance(data, dict) else SymbolPrice()
+        return self._request("GET", "/api/query_symbol_price", params={"symbol": symbol}, use_jwt=False, model=SymbolPrice, single=True)
     
     def query_depth_book(
         self,
@@ -579,12 +790,9 @@ class StandXClient:
         Returns:
             Order book data
         """
-        params = {"symbol": symbol}
-        if limit:
-            params["limit"] = limit
+        params = {"symbol": symbol, "limit": limit} if limit is not None else {"symbol": symbol}
         
-        data = self._request("GET", "/api/query_depth_book", params=params, use_jwt=False)
-        return DepthBook.from_dict(data) if isinstance(data, dict) else DepthBook()
+        return self._request("GET", "/api/query_depth_book", params=params, use_jwt=False, model=DepthBook, single=True)
     
     def query_recent_trades(
         self,
@@ -601,13 +809,11 @@ class StandXClient:
         Returns:
             List of recent trades
         """
-        params = {"symbol": symbol}
-        if limit:
-            params["limit"] = limit
+        params = {"symbol": symbol, "limit": limit} if limit is not None else {"symbol": symbol}
         
-        data = self._request("GET", "/api/query_recent_trades", params=params, use_jwt=False)
-        return [RecentTrade.from_dict(trade) for trade in data] if isinstance(data, list) else []
+        return self._request("GET", "/api/query_recent_trades", params=params, use_jwt=False, model=RecentTrade)
     
+    @ttl_cached(5)
     def query_funding_rates(self, symbol: Optional[str] = None) -> FundingRates:
         """
         Query funding rates
@@ -618,12 +824,9 @@ class StandXClient:
         Returns:
             Funding rate data
         """
-        params = {}
-        if symbol:
-            params["symbol"] = symbol
+        params = {"symbol": symbol} if symbol is not None else {}
         
-        data = self._request("GET", "/api/query_funding_rates", params=params, use_jwt=False)
-        return FundingRates.from_dict(data) if isinstance(data, dict) else FundingRates()
+        return self._request("GET", "/api/query_funding_rates", params=params, use_jwt=False, model=FundingRates, single=True)
     
     # Kline Endpoints
     
@@ -634,8 +837,7 @@ class StandXClient:
         Returns:
             Server time data
         """
-        data = self._request("GET", "/api/kline/time", use_jwt=False)
-        return ServerTime.from_dict(data) if isinstance(data, dict) else ServerTime()
+        return self._request("GET", "/api/kline/time", use_jwt=False, model=ServerTime, single=True)
     
     def get_kline_history(
         self,
@@ -660,17 +862,12 @@ class StandXClient:
         """
         params = {
             "symbol": symbol,
+            # Query strings use str(), which for a str-mixin Enum is "Resolution.X"
             "resolution": resolution.value
         }
-        if from_time:
-            params["from"] = from_time
-        if to_time:
-            params["to"] = to_time
-        if limit:
-            params["limit"] = limit
+        params.update((k, v) for k, v in (("from", from_time), ("to", to_time), ("limit", limit)) if v is not None)
         
-        data = self._request("GET", "/api/kline/history", params=params, use_jwt=False)
-        return [Kline.from_dict(kline) for kline in data] if isinstance(data, list) else []
+        return self._request("GET", "/api/kline/history", params=params, use_jwt=False, model=Kline)
     
     # Health Check
     
@@ -681,8 +878,7 @@ class StandXClient:
         Returns:
             Health status
         """
-        data = self._request("GET", "/api/health", use_jwt=False)
-        return Health.from_dict(data) if isinstance(data, dict) else Health()
+        return self._request("GET", "/api/health", use_jwt=False, model=Health, single=True)
     
     # Misc Endpoints
     
@@ -0,0 +1,38 @@
+"""Process-wide default StandXWalletClient
+
+Building a StandXWalletClient signs in with the wallet and opens a new
+connection pool. Code that needs a client in several places can share one
+instance per process through get_default_client() instead.
+"""
+
+import threading
+from typing import Optional
+from .wallet_client import StandXWalletClient
+
+_default_client: Optional[StandXWalletClient] = None
+_lock = threading.Lock()
+
+
+def get_default_client(**kwargs) -> StandXWalletClient:
+    """
+    Get the process-wide StandXWalletClient, creating it on first use
+
+    Args:
+        **kwargs: Arguments for StandXWalletClient, only used by the first call.
+            Without a private_key, STANDX_PRIVATE_KEY from the environment is used.
+
+    Returns:
+        Shared StandXWalletClient instance
+    """
+    global _default_client
+    with _lock:
+        if _default_client is None:
+            _default_client = StandXWalletClient(**kwargs)
+        return _default_client
+
+
+def reset_default_client():
+    """Drop the shared client so the next get_default_client() call builds a new one"""
+    global _default_client
+    with _lock:
+        _default_client = None
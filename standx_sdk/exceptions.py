@@ -1,5 +1,7 @@
 """Custom exceptions for StandX SDK"""
 
+from . import _json
+
 
 class StandXAPIError(Exception):
     """Base exception for all StandX API errors"""
@@ -31,14 +33,36 @@ class StandXWebSocketError(StandXAPIError):
     pass
 
 
-
-
-
-
-
-
-
-
-
-
-
+def error_from_response(status: int, raw: bytes) -> StandXAPIError:
+    """
+    Build the exception for an HTTP error response, parsing its body once
+    
+    Args:
+        status: HTTP status code (>= 400)
+        raw: Raw response body
+        
+    Returns:
+        StandXAuthenticationError for 401, StandXAPIError for JSON error bodies,
+        StandXRequestError otherwise
+    """
+    try:
+        error_data = _json.loads(raw)
+    except _json.JSONDecodeError:
+        error_data = None
+    if not isinstance(error_data, dict):
+        error_data = None
+    response_text = raw.decode('utf-8', errors='replace')
+    
+    if status == 401:
+        if error_data is not None:
+            return StandXAuthenticationError(error_data.get("message", "Authentication failed"), 401)
+        return StandXAuthenticationError(response_text or "Authentication failed", 401)
+    
+    if error_data is None:
+        return StandXRequestError(f"Request failed: {status} - {response_text}")
+    
+    error_msg = error_data.get("message", response_text)
+    # Include full error data for debugging
+    if status in (422, 400):
+        error_msg = f"{error_msg} | Full response: {_json.dumps(error_data)}"
+    return StandXAPIError(error_msg, error_data.get("code", status), error_data.get("request_id"))
@@ -0,0 +1,124 @@
+"""HTTP/2 transport for StandXClient
+
+HTTP2Session wraps an httpx.Client with HTTP/2 enabled behind the small part
+of the requests.Session interface that StandXClient uses, so concurrent calls
+to the same host are multiplexed over one TCP+TLS connection.
+
+Requires httpx with HTTP/2 support: pip install "httpx[http2]"
+"""
+
+from typing import Optional, Dict, Any, Tuple, Union
+import requests
+from . import _json
+
+try:
+    import httpx
+    import h2  # noqa: F401 - required by httpx for http2=True
+except ImportError:
+    httpx = None
+
+
+def http2_available() -> bool:
+    """Return True if httpx and h2 are installed"""
+    return httpx is not None
+
+
+class HTTP2Response:
+    """requests.Response-like view of an httpx.Response"""
+
+    def __init__(self, response):
+        """
+        Wrap an httpx response
+
+        Args:
+            response: httpx.Response
+        """
+        self._response = response
+        self.status_code = response.status_code
+        self.ok = response.is_success
+        self.content = response.content
+    
+    @property
+    def text(self) -> str:
+        """Response body decoded as text (only computed when accessed)"""
+        return self._response.text
+
+    def json(self) -> Any:
+        """Decode the response body as JSON (raises json.JSONDecodeError)"""
+        return _json.loads(self.content)
+
+    def raise_for_status(self):
+        """Raise requests.exceptions.HTTPError for 4xx/5xx responses"""
+        if not self.ok:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error for url: {self._response.url}")
+
+
+class HTTP2Session:
+    """Minimal requests.Session replacement backed by httpx over HTTP/2"""
+
+    def __init__(self, max_keepalive_connections: int = 20, keepalive_expiry: float = 60):
+        """
+        Initialize HTTP/2 session
+
+        Args:
+            max_keepalive_connections: Maximum idle connections kept in the pool
+            keepalive_expiry: Seconds an idle connection is kept open
+
+        Raises:
+            ImportError: If httpx[http2] is not installed
+        """
+        if httpx is None:
+            raise ImportError('HTTP2Session requires httpx with HTTP/2 support: pip install "httpx[http2]"')
+        self.client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            )
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        json: Optional[Any] = None,
+        data: Optional[Union[str, bytes]] = None,
+        headers: Optional[Dict] = None,
+        timeout: Optional[Union[float, Tuple[float, float]]] = None
+    ) -> HTTP2Response:
+        """
+        Send a request, mirroring requests.Session.request
+
+        Responses are transparently decompressed; httpx advertises gzip and
+        deflate (plus br when brotli is installed) by default. Network errors
+        are raised as requests exceptions so callers keep a single error
+        handling path for both transports.
+
+        Returns:
+            HTTP2Response
+        """
+        # requests-style (connect, read) tuples map to an httpx.Timeout
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+
+        try:
+            response = self.client.request(
+                method,
+                url,
+                params=params,
+                json=json,
+                content=data,
+                headers=headers,
+                timeout=timeout
+            )
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e))
+        except httpx.HTTPError as e:
+            raise requests.exceptions.ConnectionError(str(e))
+        return HTTP2Response(response)
+
+    def close(self):
+        """Close all pooled connections"""
+        self.client.close()
@@ -0,0 +1,148 @@
+"""On-disk cache for wallet-generated credentials
+
+A JWT issued by the wallet login flow is valid for days, but generating one
+costs a wallet signature plus two HTTP round-trips. This module persists the
+token together with the ed25519 key pair it was issued for, so later runs can
+reuse both until the token is close to expiry.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Optional, Tuple, Union
+from . import _json
+
+DEFAULT_CACHE_PATH = Path.home() / ".standx" / "jwt_cache.json"
+
+# Treat tokens expiring within this window as already expired
+REFRESH_MARGIN_SECONDS = 60
+
+# ...or within this fraction of their lifetime, whichever is longer
+REFRESH_MARGIN_FRACTION = 0.1
+
+
+def _cache_key(wallet_address: str, chain: str) -> str:
+    return f"{wallet_address.lower()}:{chain}"
+
+
+def _entry_credentials(entry: Optional[dict]) -> Optional[Tuple[str, bytes]]:
+    """Return (jwt_token, ed25519_private_key_bytes) for a cache entry that is not close to expiry"""
+    if not entry:
+        return None
+    try:
+        expires_at = float(entry.get("expires_at", 0))
+        lifetime = expires_at - float(entry.get("issued_at", expires_at))
+    except (TypeError, ValueError):
+        return None
+    margin = max(REFRESH_MARGIN_SECONDS, lifetime * REFRESH_MARGIN_FRACTION)
+    if expires_at - time.time() <= margin:
+        return None
+
+    try:
+        return entry["token"], bytes.fromhex(entry["ed25519_private_key"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _read_cache(path: Path) -> dict:
+    """Read the cache file, ignoring anything that is not a mapping of dict entries"""
+    try:
+        cache = _json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    return {key: entry for key, entry in cache.items() if isinstance(entry, dict)}
+
+
+def load_cached_jwt(
+    wallet_address: str,
+    chain: str,
+    path: Optional[Union[str, Path]] = None
+) -> Optional[Tuple[str, bytes]]:
+    """
+    Load a cached JWT token for a wallet
+
+    Args:
+        wallet_address: Wallet address
+        chain: Blockchain network
+        path: Cache file path (defaults to ~/.standx/jwt_cache.json)
+
+    Returns:
+        Tuple of (jwt_token, ed25519_private_key_bytes), or None if missing or expiring
+    """
+    cache = _read_cache(Path(path) if path else DEFAULT_CACHE_PATH)
+    return _entry_credentials(cache.get(_cache_key(wallet_address, chain)))
+
+
+def load_cached_jwt_for_key(
+    key_hash: str,
+    chain: str,
+    path: Optional[Union[str, Path]] = None
+) -> Optional[Tuple[str, str, bytes]]:
+    """
+    Load a cached JWT token by private key hash, without knowing the wallet address
+
+    Lets a client skip deriving the wallet address from the private key when
+    a still-valid token was saved for that key.
+
+    Args:
+        key_hash: SHA-256 hex digest of the wallet private key
+        chain: Blockchain network
+        path: Cache file path (defaults to ~/.standx/jwt_cache.json)
+
+    Returns:
+        Tuple of (wallet_address, jwt_token, ed25519_private_key_bytes), or None if missing or expiring
+    """
+    cache = _read_cache(Path(path) if path else DEFAULT_CACHE_PATH)
+    for entry in cache.values():
+        if entry.get("key_hash") == key_hash and entry.get("chain") == chain and entry.get("address"):
+            credentials = _entry_credentials(entry)
+            if credentials:
+                return (entry["address"],) + credentials
+    return None
+
+
+def save_cached_jwt(
+    wallet_address: str,
+    chain: str,
+    jwt_token: str,
+    ed25519_private_key_bytes: bytes,
+    expires_seconds: int,
+    path: Optional[Union[str, Path]] = None,
+    key_hash: Optional[str] = None
+):
+    """
+    Persist a JWT token and its ed25519 key for later runs
+
+    The cache file is created with 0600 permissions since it holds credentials.
+
+    Args:
+        wallet_address: Wallet address
+        chain: Blockchain network
+        jwt_token: JWT access token
+        ed25519_private_key_bytes: ed25519 private key the token was issued for
+        expires_seconds: Token lifetime in seconds
+        path: Cache file path (defaults to ~/.standx/jwt_cache.json)
+        key_hash: SHA-256 hex digest of the wallet private key, stored so the
+            entry can be found with load_cached_jwt_for_key()
+    """
+    path = Path(path) if path else DEFAULT_CACHE_PATH
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    cache = _read_cache(path)
+    now = time.time()
+    entry = {
+        "token": jwt_token,
+        "ed25519_private_key": ed25519_private_key_bytes.hex(),
+        "issued_at": now,
+        "expires_at": now + expires_seconds,
+    }
+    if key_hash:
+        entry.update(key_hash=key_hash, address=wallet_address, chain=chain)
+    cache[_cache_key(wallet_address, chain)] = entry
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(_json.dumps_bytes(cache))
+    os.chmod(path, 0o600)
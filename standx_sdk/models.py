@@ -1,12 +1,77 @@
 """Generated models from OpenAPI specification"""
 
+import sys
 from typing import Optional, List
 from dataclasses import dataclass
 from datetime import datetime
 
+# Models store their fields in __slots__ instead of a per-instance __dict__
+# where dataclasses support it (Python 3.10+)
+_dataclass = dataclass(slots=True) if sys.version_info >= (3, 10) else dataclass
+
+
+class NumericFieldsMixin:
+    """Float view of the numeric string fields of a model, parsed once per object
+    
+    Numeric fields stay as the exact strings returned by the API (so they can be
+    passed back in orders unchanged); num() converts a field on first access and
+    caches the result, so render loops can read it repeatedly for free.
+    """
+    
+    __slots__ = ("_num_cache",)
+    
+    def num(self, name: str) -> float:
+        """
+        Get a numeric field as float (None/empty becomes 0.0)
+        
+        Args:
+            name: Field name, e.g. "qty" or "entry_price"
+            
+        Returns:
+            Parsed float value
+        """
+        try:
+            cache = self._num_cache
+        except AttributeError:
+            cache = self._num_cache = {}
+        value = cache.get(name)
+        if value is None:
+            value = cache[name] = float(getattr(self, name) or 0)
+        return value
+
+
+def _api_model(cls):
+    """
+    Attach a from_dict() classmethod generated for the model's dataclass fields
+    
+    The generated function passes each field by keyword (data.get("name")), so
+    parsing a record involves no per-key filtering or introspection. Unknown
+    keys in the response are ignored and missing ones become None, which is
+    every response model's default.
+    
+    Args:
+        cls: Response model dataclass
+        
+    Returns:
+        The same class
+    """
+    args = ", ".join(f"{name}=get({name!r})" for name in cls.__dataclass_fields__)
+    source = (
+        "def from_dict(cls, data):\n"
+        f"    \"\"\"Create {cls.__name__} from API response\"\"\"\n"
+        "    get = data.get\n"
+        f"    return cls({args})\n"
+    )
+    namespace = {}
+    exec(source, namespace)
+    from_dict = namespace["from_dict"]
+    from_dict.__qualname__ = f"{cls.__qualname__}.from_dict"
+    cls.from_dict = classmethod(from_dict)
+    return cls
+
 
 # Request Models
-@dataclass
+@_dataclass
 class NewOrderRequest:
     symbol: str
     side: str
@@ -20,31 +85,31 @@ class NewOrderRequest:
     leverage: Optional[int] = None
 
 
-@dataclass
+@_dataclass
 class CancelOrderRequest:
     order_id: Optional[int] = None
     cl_ord_id: Optional[str] = None
 
 
-@dataclass
+@_dataclass
 class CancelOrdersRequest:
     order_id_list: Optional[List[int]] = None
     cl_ord_id_list: Optional[List[str]] = None
 
 
-@dataclass
+@_dataclass
 class ChangeLeverageRequest:
     symbol: str
     leverage: int
 
 
-@dataclass
+@_dataclass
 class ChangeMarginModeRequest:
     symbol: str
     margin_mode: str
 
 
-@dataclass
+@_dataclass
 class TransferMarginRequest:
     symbol: str
     amount_in: str
@@ -52,7 +117,7 @@ class TransferMarginRequest:
 
 
 # Response Models
-@dataclass
+@_dataclass
 class OrderResponse:
     code: int
     message: str
@@ -61,15 +126,16 @@ class OrderResponse:
     cl_ord_id: Optional[str] = None
 
 
-@dataclass
+@_dataclass
 class StandardResponse:
     code: int
     message: str
     request_id: Optional[str] = None
 
 
-@dataclass
-class Order:
+@_api_model
+@_dataclass
+class Order(NumericFieldsMixin):
     id: Optional[int] = None
     cl_ord_id: Optional[str] = None
     symbol: Optional[str] = None
@@ -95,15 +161,11 @@ class Order:
     remark: Optional[str] = None
     source: Optional[str] = None
     user: Optional[str] = None
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "Order":
-        """Create Order from API response"""
-        return cls(**{k: v for k, v in data.items() if hasattr(cls, k)})
 
 
-@dataclass
-class Trade:
+@_api_model
+@_dataclass
+class Trade(NumericFieldsMixin):
     id: Optional[int] = None
     symbol: Optional[str] = None
     side: Optional[str] = None
@@ -113,15 +175,11 @@ class Trade:
     created_at: Optional[str] = None
     order_id: Optional[int] = None
     user: Optional[str] = None
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "Trade":
-        """Create Trade from API response"""
-        return cls(**{k: v for k, v in data.items() if hasattr(cls, k)})
 
 
-@dataclass
-class Position:
+@_api_model
+@_dataclass
+class Position(NumericFieldsMixin):
     id: Optional[int] = None
     symbol: Optional[str] = None
     qty: Optional[str] = None
@@ -136,29 +194,21 @@ class Position:
     updated_at: Optional[str] = None
     margin_asset: Optional[str] = None
     user: Optional[str] = None
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "Position":
-        """Create Position from API response"""
-        return cls(**{k: v for k, v in data.items() if hasattr(cls, k)})
 
 
-@dataclass
+@_api_model
+@_dataclass
 class PositionConfig:
     symbol: Optional[str] = None
     leverage: Optional[int] = None
     margin_mode: Optional[str] = None
     max_leverage: Optional[int] = None
     min_leverage: Optional[int] = None
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "PositionConfig":
-        """Create PositionConfig from API response"""
-        return cls(**{k: v for k, v in data.items() if hasattr(cls, k)})
 
 
-@dataclass
-class Balance:
+@_api_model
+@_dataclass
+class Balance(NumericFieldsMixin):
     id: Optional[str] = None
     token: Optional[str] = None
     free: Optional[str] = None
@@ -178,13 +228,14 @@ class Balance:
     version: Optional[int] = None
     wallet_id: Optional[str] = None
     
-    @classmethod
-    def from_dict(cls, data: dict) -> "Balance":
-        """Create Balance from API response"""
-        return cls(**{k: v for k, v in data.items() if hasattr(cls, k)})
+    @property
+    def total_value(self) -> float:
+        """Total balance as float, falling back to free + locked when total is not reported"""
+        return self.num("total") or (self.num("free") + self.num("locked"))
 
 
-@dataclass
+@_api_model
+@_dataclass
 class SymbolInfo:
     symbol: Optional[str] = None
     base: Optional[str] = None
@@ -194,14 +245,10 @@ class SymbolInfo:
     max_qty: Optional[str] = None
     tick_size: Optional[str] = None
     step_size: Optional[str] = None
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "SymbolInfo":
-        """Create SymbolInfo from API response"""
-        return cls(**{k: v for k, v in data.items() if hasattr(cls, k)})
 
 
-@dataclass
+@_api_model
+@_dataclass
 class SymbolMarket:
     symbol: Optional[str] = None
     last_price: Optional[str] = None
@@ -213,14 +260,10 @@ class SymbolMarket:
     low_24h: Optional[str] = None
     change_24h: Optional[str] = None
     change_percent_24h: Optional[str] = None
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "SymbolMarket":
-        """Create SymbolMarket from API response"""
-        return cls(**{k: v for k, v in data.items() if hasattr(cls, k)})
 
 
-@dataclass
+@_api_model
+@_dataclass
 class SymbolPrice:
     symbol: Optional[str] = None
     base: Optional[str] = None
@@ -231,27 +274,19 @@ class SymbolPrice:
     mid_price: Optional[str] = None
     spread: Optional[List[str]] = None
     time: Optional[str] = None
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "SymbolPrice":
-        """Create SymbolPrice from API response"""
-        return cls(**{k: v for k, v in data.items() if hasattr(cls, k)})
 
 
-@dataclass
+@_api_model
+@_dataclass
 class DepthBook:
     symbol: Optional[str] = None
     asks: Optional[List[List[str]]] = None
     bids: Optional[List[List[str]]] = None
     timestamp: Optional[int] = None
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "DepthBook":
-        """Create DepthBook from API response"""
-        return cls(**{k: v for k, v in data.items() if hasattr(cls, k)})
 
 
-@dataclass
+@_api_model
+@_dataclass
 class RecentTrade:
     id: Optional[int] = None
     symbol: Optional[str] = None
@@ -260,38 +295,26 @@ class RecentTrade:
     price: Optional[str] = None
     timestamp: Optional[int] = None
     created_at: Optional[str] = None
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "RecentTrade":
-        """Create RecentTrade from API response"""
-        return cls(**{k: v for k, v in data.items() if hasattr(cls, k)})
 
 
-@dataclass
+@_api_model
+@_dataclass
 class FundingRates:
     symbol: Optional[str] = None
     funding_rate: Optional[str] = None
     next_funding_time: Optional[int] = None
     predicted_funding_rate: Optional[str] = None
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "FundingRates":
-        """Create FundingRates from API response"""
-        return cls(**{k: v for k, v in data.items() if hasattr(cls, k)})
 
 
-@dataclass
+@_api_model
+@_dataclass
 class ServerTime:
     server_time: Optional[int] = None
     timestamp: Optional[int] = None
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "ServerTime":
-        """Create ServerTime from API response"""
-        return cls(**{k: v for k, v in data.items() if hasattr(cls, k)})
 
 
-@dataclass
+@_api_model
+@_dataclass
 class Kline:
     time: Optional[int] = None
     open: Optional[str] = None
@@ -300,22 +323,13 @@ class Kline:
     close: Optional[str] = None
     volume: Optional[str] = None
     symbol: Optional[str] = None
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "Kline":
-        """Create Kline from API response"""
-        return cls(**{k: v for k, v in data.items() if hasattr(cls, k)})
 
 
-@dataclass
+@_api_model
+@_dataclass
 class Health:
     status: Optional[str] = None
     timestamp: Optional[int] = None
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "Health":
-        """Create Health from API response"""
-        return cls(**{k: v for k, v in data.items() if hasattr(cls, k)})
 
 
 
@@ -0,0 +1,45 @@
+"""Pooled HTTP session for the sync clients"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = 20,
+    retries: int = 3
+) -> requests.Session:
+    """
+    Create a keep-alive requests.Session with a pooled adapter
+
+    Every request made through the session reuses the pooled TCP+TLS
+    connections instead of opening a new one per call. Connection errors and
+    502/503/504 responses are retried with backoff; urllib3 only retries
+    idempotent methods, so order-placing POSTs are never sent twice.
+    Compressed responses are decoded transparently: gzip/deflate always, and
+    br/zstd when brotli/zstandard are installed (urllib3 then advertises them).
+
+    Args:
+        pool_connections: Number of host pools to cache
+        pool_maxsize: Maximum connections kept per host
+        retries: Total retry attempts per request
+
+    Returns:
+        requests.Session with the adapter mounted for https:// and http://
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False
+        )
+    )
+    session.mount("https://", adapter)
+    # Also pool plain-HTTP base URLs (e.g. a local gateway or test server)
+    session.mount("http://", adapter)
+    return session
@@ -4,16 +4,31 @@ This module provides functionality to generate JWT tokens from wallet private ke
 eliminating the need to manually obtain credentials from the platform.
 """
 
-import json
 import base64
-import base58
 import requests
-from typing import Optional, Dict, Any
-from eth_account import Account
-from eth_account.messages import encode_defunct
+from typing import Optional, Dict, Any, Union
 import hashlib
 from cryptography.hazmat.primitives.asymmetric import ed25519
-from cryptography.hazmat.primitives import serialization
+from . import _json
+
+try:
+    # Rust-backed drop-in replacement for base58.b58encode
+    import based58 as base58
+except ImportError:
+    import base58
+
+# Wallet addresses derived in this process, keyed by the SHA-256 of the
+# private key; only the public address is stored
+_wallet_address_cache: Dict[str, str] = {}
+
+# EIP-191 personal_sign prefix; the message length in decimal follows it
+_ETH_MESSAGE_PREFIX = b"\x19Ethereum Signed Message:\n"
+
+
+def _private_key_hash(private_key: str) -> tuple[str, str]:
+    """Return (key without 0x prefix, SHA-256 cache key) for a hex private key"""
+    key = private_key[2:] if private_key.startswith("0x") else private_key
+    return key, hashlib.sha256(key.lower().encode()).hexdigest()
 
 
 class StandXWalletAuth:
@@ -21,16 +36,48 @@ class StandXWalletAuth:
     
     AUTH_BASE_URL = "https://api.standx.com/v1/offchain"
     
-    def __init__(self, chain: str = "bsc"):
+    def __init__(self, chain: str = "bsc", session: Optional[requests.Session] = None):
         """
         Initialize wallet authentication
         
         Args:
             chain: Blockchain network ("bsc" or "solana")
+            session: requests.Session to send the sign-in requests on. If None, one is
+                created so prepare-signin and login share a keep-alive connection
         """
         self.chain = chain
         self.auth_base_url = self.AUTH_BASE_URL
+        self.session = session if session is not None else requests.Session()
         self._ed25519_private_key_bytes = None  # Will be set during JWT token generation
+        # (key hash, eth_keys PrivateKey) of the last key signed with; held by
+        # this instance only, so it is released together with it
+        self._signing_key: Optional[tuple] = None
+    
+    @staticmethod
+    def derive_wallet_address(private_key: str) -> str:
+        """
+        Derive the Ethereum/BSC wallet address for a private key
+        
+        Results are cached per process, so repeated client constructions
+        skip the secp256k1 public key derivation.
+        
+        Args:
+            private_key: Ethereum private key (hex string with or without 0x)
+            
+        Returns:
+            Checksummed wallet address
+        """
+        key, key_hash = _private_key_hash(private_key)
+        
+        wallet_address = _wallet_address_cache.get(key_hash)
+        if wallet_address is None:
+            # Imported on first use: eth_account takes ~0.5s to import and is only
+            # needed for wallet sign-in, not for market data or JWT-only clients.
+            # Only the address is kept; the account (and its key) is dropped here
+            from eth_account import Account
+            wallet_address = Account.from_key(key).address
+            _wallet_address_cache[key_hash] = wallet_address
+        return wallet_address
     
     def generate_request_id(self) -> tuple[str, bytes]:
         """
@@ -41,19 +88,13 @@ class StandXWalletAuth:
         """
         # Generate ed25519 key pair
         private_key = ed25519.Ed25519PrivateKey.generate()
-        public_key = private_key.public_key()
         
-        # Serialize public key
-        public_key_bytes = public_key.public_bytes(
-            encoding=serialization.Encoding.Raw,
-            format=serialization.PublicFormat.Raw
-        )
-        
-        # Get private key bytes
+        # Raw key bytes, without going through the generic serialization API
+        public_key_bytes = private_key.public_key().public_bytes_raw()
         private_key_bytes = private_key.private_bytes_raw()
         
-        # Encode to base58
-        request_id = base58.b58encode(public_key_bytes).decode('utf-8')
+        # Encode to base58 (the alphabet is ASCII, so skip the UTF-8 codec)
+        request_id = base58.b58encode(public_key_bytes).decode('ascii')
         return request_id, private_key_bytes
     
     def get_signature_data(
@@ -82,21 +123,30 @@ class StandXWalletAuth:
             "requestId": request_id
         }
         
-        response = requests.post(
+        response = self.session.post(
             url,
             params=params,
-            json=data,
+            data=_json.dumps_bytes(data),
             headers={"Content-Type": "application/json"}
         )
         
         response.raise_for_status()
-        result = response.json()
+        result = _json.loads(response.content)
         
         if not result.get("success"):
             raise Exception(f"Failed to get signature data: {result}")
         
         return result
     
+    def _get_signing_key(self, private_key: str):
+        """Get the eth_keys PrivateKey for a private key, building it once per instance and key"""
+        key, key_hash = _private_key_hash(private_key)
+        cached = self._signing_key
+        if cached is None or cached[0] != key_hash:
+            from eth_keys import keys as eth_keys
+            cached = self._signing_key = (key_hash, eth_keys.PrivateKey(bytes.fromhex(key)))
+        return cached[1]
+    
     def sign_message_ethereum(
         self,
         private_key: str,
@@ -112,45 +162,77 @@ class StandXWalletAuth:
         Returns:
             Signature hex string with 0x prefix (required by StandX API)
         """
-        # Remove 0x prefix if present
-        if private_key.startswith("0x"):
-            private_key = private_key[2:]
+        from eth_utils import keccak
         
-        # Create account from private key
-        account = Account.from_key(private_key)
+        # Reuse the signing key this instance built for the key earlier
+        signing_key = self._get_signing_key(private_key)
         
-        # Encode message
-        message_encoded = encode_defunct(text=message)
+        # Hash the EIP-191 encoded message directly (same digest as encode_defunct)
+        message_bytes = message.encode('utf-8')
+        digest = keccak(_ETH_MESSAGE_PREFIX + str(len(message_bytes)).encode('ascii') + message_bytes)
         
-        # Sign message
-        signed_message = account.sign_message(message_encoded)
+        # Sign message; r || s || v, with v moved to the 27/28 form wallets produce
+        signature = bytearray(signing_key.sign_msg_hash(digest).to_bytes())
+        signature[64] += 27
         
-        # Return signature with 0x prefix (required by StandX API)
-        return "0x" + signed_message.signature.hex()
+        # Return signature with 0x prefix (required by StandX API), formatted in one step
+        return f"0x{signature.hex()}"
     
     def sign_message_solana(
         self,
-        private_key: bytes,
+        private_key: Union[bytes, ed25519.Ed25519PrivateKey],
         message: str
     ) -> str:
         """
         Sign message with Solana private key
         
         Args:
-            private_key: Solana private key bytes (32 bytes)
+            private_key: Solana private key bytes (32 bytes), or an already parsed
+                Ed25519PrivateKey to skip re-parsing the key on every call
             message: Message to sign
             
         Returns:
             Base64-encoded signature
         """
-        # Create ed25519 key from private key
-        private_key_obj = ed25519.Ed25519PrivateKey.from_private_bytes(private_key)
+        # Create ed25519 key from private key bytes unless a key object was passed
+        if isinstance(private_key, ed25519.Ed25519PrivateKey):
+            private_key_obj = private_key
+        else:
+            private_key_obj = ed25519.Ed25519PrivateKey.from_private_bytes(private_key)
         
         # Sign message
         signature = private_key_obj.sign(message.encode('utf-8'))
         
         # Return base64-encoded signature
-        return base64.b64encode(signature).decode('utf-8')
+        return base64.b64encode(signature).decode('ascii')
+    
+    @staticmethod
+    def decode_signed_data(signed_data: str) -> Dict[str, Any]:
+        """
+        Decode the payload of the signedData JWT returned by prepare-signin
+        
+        The sign-in message is built by the server and carried in this payload,
+        so it is decoded as-is rather than formatted locally.
+        
+        Args:
+            signed_data: JWT string (header.payload.signature)
+            
+        Returns:
+            Decoded payload dictionary
+            
+        Raises:
+            Exception: If signedData is not a valid JWT
+        """
+        # The signature is not verified here, so a JWT library adds nothing
+        # over splitting the token and decoding its payload segment
+        parts = signed_data.split('.')
+        if len(parts) != 3:
+            raise Exception("Invalid signedData format")
+        
+        # Decode payload (base64url), adding padding if needed
+        payload_b64 = parts[1]
+        payload_b64 += '=' * (-len(payload_b64) % 4)
+        return _json.loads(base64.urlsafe_b64decode(payload_b64))
     
     def get_jwt_token(
         self,
@@ -186,27 +268,8 @@ class StandXWalletAuth:
         sig_data_response = self.get_signature_data(wallet_address, request_id)
         signed_data = sig_data_response["signedData"]
         
-        # Step 3: Parse signedData (JWT) to get message
-        # JWT format: header.payload.signature
-        # We need to decode the payload to get the message
-        try:
-            import jwt
-            # Decode without verification to get payload
-            payload = jwt.decode(signed_data, options={"verify_signature": False})
-            message = payload.get("message", "")
-        except ImportError:
-            # Fallback: manually parse JWT
-            parts = signed_data.split('.')
-            if len(parts) != 3:
-                raise Exception("Invalid signedData format")
-            
-            # Decode payload (base64url)
-            payload_b64 = parts[1]
-            # Add padding if needed
-            payload_b64 += '=' * (4 - len(payload_b64) % 4)
-            payload_json = base64.urlsafe_b64decode(payload_b64)
-            payload = json.loads(payload_json)
-            message = payload.get("message", "")
+        # Step 3: Parse signedData (JWT) to get the message to sign
+        message = self.decode_signed_data(signed_data).get("message", "")
         
         # Step 4: Sign the message
         if chain in ["bsc", "ethereum"]:
@@ -231,15 +294,15 @@ class StandXWalletAuth:
             "expiresSeconds": expires_seconds
         }
         
-        response = requests.post(
+        response = self.session.post(
             url,
             params=params,
-            json=data,
+            data=_json.dumps_bytes(data),
             headers={"Content-Type": "application/json"}
         )
         
         response.raise_for_status()
-        result = response.json()
+        result = _json.loads(response.content)
         
         # Check if we have a token in the response
         token = result.get("token") or result.get("accessToken") or result.get("jwt")
@@ -274,9 +337,7 @@ class StandXWalletAuth:
         
         # Derive address if not provided (for Ethereum/BSC)
         if not wallet_address and chain in ["bsc", "ethereum"]:
-            from eth_account import Account
-            account = Account.from_key(private_key)
-            wallet_address = account.address
+            wallet_address = StandXWalletAuth.derive_wallet_address(private_key)
         
         jwt_token = auth.get_jwt_token(wallet_address, private_key, chain)
         
@@ -1,9 +1,12 @@
 """Convenience client that generates credentials from wallet private key"""
 
-import hashlib
-from typing import Optional
+import threading
+import requests
+from typing import Optional, List, Union
 from .client import StandXClient
-from .wallet_auth import StandXWalletAuth
+from .wallet_auth import StandXWalletAuth, _private_key_hash
+from .jwt_cache import load_cached_jwt, load_cached_jwt_for_key, save_cached_jwt
+from ._bootstrap import load as load_env
 
 
 class StandXWalletClient(StandXClient):
@@ -15,64 +18,35 @@ class StandXWalletClient(StandXClient):
     """
     
     @staticmethod
-    def _generate_api_credentials_from_private_key(private_key: str, wallet_address: str) -> tuple[str, str]:
+    def _resolve_credentials(
+        private_key: Optional[str],
+        wallet_address: Optional[str],
+        chain: str,
+        expires_seconds: int,
+        cache_jwt: Optional[bool] = None,
+        session: Optional[requests.Session] = None
+    ) -> tuple[str, bytes, str, str]:
         """
-        Generate deterministic API credentials from private key
-        
-        Args:
-            private_key: Wallet private key (hex string)
-            wallet_address: Wallet address
-            
-        Returns:
-            Tuple of (api_key, api_secret)
-        """
-        # Remove 0x prefix if present
-        private_key_clean = private_key.replace("0x", "")
-        
-        # Generate API key from wallet address (deterministic)
-        api_key = wallet_address.lower()
-        
-        # Generate API secret from private key (deterministic)
-        # Use HMAC-SHA256 of a seed string with private key
-        seed = f"standx_api_secret_{wallet_address.lower()}"
-        api_secret = hashlib.sha256(f"{seed}{private_key_clean}".encode()).hexdigest()
-        
-        return api_key, api_secret
-    
-    def __init__(
-        self,
-        private_key: Optional[str] = None,
-        wallet_address: Optional[str] = None,
-        chain: str = "bsc",
-        api_key: Optional[str] = None,
-        api_secret: Optional[str] = None,
-        base_url: Optional[str] = None,
-        session_id: Optional[str] = None,
-        expires_seconds: int = 604800,
-        auto_generate_api_credentials: bool = True,
-        jwt_token: Optional[str] = None
-    ):
-        """
-        Initialize StandX client with wallet private key
+        Resolve wallet settings and generate JWT token and ed25519 key pair
         
         Args:
             private_key: Wallet private key (hex string). If None, will try to use from .env
             wallet_address: Wallet address (optional, will derive if not provided)
             chain: Blockchain network ("bsc" or "solana")
-            api_key: API key for trading endpoints (deprecated, not needed with ed25519)
-            api_secret: API secret for trading endpoints (deprecated, not needed with ed25519)
-            base_url: Custom base URL
-            session_id: Session ID for order tracking
-            expires_seconds: JWT token expiration time (default: 7 days) - only used if generating new token
-            auto_generate_api_credentials: If True, generate API credentials from private key if not provided
-            jwt_token: JWT token to use. If None, will generate from private_key or use from .env
+            expires_seconds: JWT token expiration time
+            cache_jwt: If True, reuse/persist the JWT token via the on-disk cache
+                (None: use the STANDX_CACHE_JWT environment variable)
+            session: requests.Session to run the wallet sign-in on (optional)
+            
+        Returns:
+            Tuple of (jwt_token, ed25519_private_key_bytes, wallet_address, chain)
         """
         import os
-        try:
-            from dotenv import load_dotenv
-            load_dotenv()
-        except ImportError:
-            pass
+        load_env()
+        
+        # Token cache can be switched on for every client from the environment
+        if cache_jwt is None:
+            cache_jwt = os.getenv("STANDX_CACHE_JWT", "").lower() in ("1", "true", "yes")
         
         # Get private key from parameter or environment
         if not private_key:
@@ -84,18 +58,33 @@ class StandXWalletClient(StandXClient):
         if chain == "bsc" and os.getenv("STANDX_CHAIN"):
             chain = os.getenv("STANDX_CHAIN")
         
-        # Derive wallet address first (needed for JWT generation or verification)
         if not wallet_address:
             wallet_address = os.getenv("STANDX_WALLET_ADDRESS")
+        
+        # A token cached for this private key also records its wallet address,
+        # so a cache hit skips the address derivation as well
+        _, key_hash = _private_key_hash(private_key)
+        if cache_jwt and not wallet_address:
+            cached = load_cached_jwt_for_key(key_hash, chain)
+            if cached:
+                wallet_address, jwt_token, ed25519_private_key_bytes = cached
+                return jwt_token, ed25519_private_key_bytes, wallet_address, chain
+        
+        # Derive wallet address first (needed for JWT generation or verification)
         if not wallet_address and chain in ["bsc", "ethereum"]:
-            from eth_account import Account
-            account = Account.from_key(private_key)
-            wallet_address = account.address
+            wallet_address = StandXWalletAuth.derive_wallet_address(private_key)
         
-        # Always generate JWT token from private key to ensure it's valid and fresh
+        # Reuse a cached token (and its ed25519 key) from a previous run if still valid
+        if cache_jwt and wallet_address:
+            cached = load_cached_jwt(wallet_address, chain)
+            if cached:
+                jwt_token, ed25519_private_key_bytes = cached
+                return jwt_token, ed25519_private_key_bytes, wallet_address, chain
+        
+        # Generate JWT token from private key to ensure it's valid and fresh
         # This ensures we have the matching ed25519 key pair for body signature
         # Per StandX API docs: ed25519 key pair is temporary and generated per session
-        auth = StandXWalletAuth(chain=chain)
+        auth = StandXWalletAuth(chain=chain, session=session)
         
         # Get JWT token (this also generates and stores ed25519 key pair)
         jwt_token_to_use = auth.get_jwt_token(
@@ -115,6 +104,63 @@ class StandXWalletClient(StandXClient):
             temp_key = ed25519.Ed25519PrivateKey.generate()
             ed25519_private_key_bytes = temp_key.private_bytes_raw()
         
+        if cache_jwt and wallet_address:
+            save_cached_jwt(
+                wallet_address, chain, jwt_token_to_use, ed25519_private_key_bytes, expires_seconds,
+                key_hash=key_hash
+            )
+        
+        return jwt_token_to_use, ed25519_private_key_bytes, wallet_address, chain
+    
+    def __init__(
+        self,
+        private_key: Optional[str] = None,
+        wallet_address: Optional[str] = None,
+        chain: str = "bsc",
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session_id: Optional[str] = None,
+        expires_seconds: int = 604800,
+        auto_generate_api_credentials: bool = True,
+        jwt_token: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        cache_jwt: Optional[bool] = None,
+        http2: bool = False,
+        warmup: Union[bool, List[str]] = False,
+        cache_market_data: bool = False
+    ):
+        """
+        Initialize StandX client with wallet private key
+        
+        Args:
+            private_key: Wallet private key (hex string). If None, will try to use from .env
+            wallet_address: Wallet address (optional, will derive if not provided)
+            chain: Blockchain network ("bsc" or "solana")
+            api_key: API key for trading endpoints (deprecated, not needed with ed25519)
+            api_secret: API secret for trading endpoints (deprecated, not needed with ed25519)
+            base_url: Custom base URL
+            session_id: Session ID for order tracking
+            expires_seconds: JWT token expiration time (default: 7 days) - only used if generating new token
+            auto_generate_api_credentials: If True, generate API credentials from private key if not provided
+            jwt_token: JWT token to use. If None, will generate from private_key or use from .env
+            session: Shared requests.Session for connection reuse (optional)
+            cache_jwt: If True, reuse a still-valid JWT from ~/.standx/jwt_cache.json across runs.
+                If None, enabled when STANDX_CACHE_JWT is set to 1/true/yes
+            http2: If True and no session is given, use an HTTP/2 (httpx) session
+            warmup: If True, open API connections in a background thread right after
+                construction (see warmup()). A list of symbols also prefetches their prices
+            cache_market_data: If True, briefly cache prices, funding rates, symbol info and position config
+        """
+        jwt_token_to_use, ed25519_private_key_bytes, wallet_address, chain = self._resolve_credentials(
+            private_key=private_key,
+            wallet_address=wallet_address,
+            chain=chain,
+            expires_seconds=expires_seconds,
+            cache_jwt=cache_jwt,
+            session=session if isinstance(session, requests.Session) else None
+        )
+        
         # Initialize parent client with JWT and ed25519 auth
         super().__init__(
             jwt_token=jwt_token_to_use,
@@ -122,12 +168,20 @@ class StandXWalletClient(StandXClient):
             api_secret=None,  # Not needed - using ed25519
             base_url=base_url,
             session_id=session_id,
-            ed25519_private_key=ed25519_private_key_bytes
+            ed25519_private_key=ed25519_private_key_bytes,
+            session=session,
+            http2=http2,
+            cache_market_data=cache_market_data
         )
         
         self.wallet_address = wallet_address
         self.chain = chain
         self._auto_generated_credentials = auto_generate_api_credentials and (not api_key or not api_secret)
+        
+        if warmup:
+            # Runs in the background so construction does not wait on the network
+            symbols = None if warmup is True else list(warmup)
+            threading.Thread(target=self.warmup, args=(symbols,), name="standx-warmup", daemon=True).start()
 
 
 
@@ -1,13 +1,162 @@
 """WebSocket client for StandX API"""
 
-import json
+import functools
 import uuid
+import queue
+import socket
+import sys
 import threading
 import time
-from typing import Optional, Dict, Any, Callable, List
+import warnings
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Optional, Dict, Any, Callable, List, Tuple, Union
 import websocket
 from .auth import StandXAuth
+from ._decode import decode_order_response
+from . import _json
 from .exceptions import StandXWebSocketError
+from .models import OrderResponse
+
+# Text frames are handed to the JSON parser as raw bytes: the parser rejects
+# invalid UTF-8 itself, so websocket-client's pure-Python validation pass
+# (run on every frame unless wsaccel is installed) is skipped.
+# Outgoing frames, including the heartbeat reply, are sent as UTF-8 bytes,
+# which websocket-client passes through unchanged with the text opcode.
+# websocket-client never negotiates permessage-deflate, so frames are not
+# compressed in either direction.
+_RUN_OPTIONS = {"skip_utf8_validation": True}
+
+
+# Socket option that holds back partial TCP segments until it is cleared:
+# TCP_CORK on Linux, TCP_NOPUSH on FreeBSD. macOS has TCP_NOPUSH too, but
+# clearing it there does not flush what is already buffered, which would
+# hold back order frames until the next write, so it is not used there.
+_TCP_HOLD = getattr(socket, "TCP_CORK", None) or (
+    getattr(socket, "TCP_NOPUSH", None) if sys.platform != "darwin" else None
+)
+
+
+def _set_tcp_hold(ws_app, enabled: bool):
+    """Hold (or release and flush) outgoing TCP segments of a WebSocketApp, where supported"""
+    sock = getattr(getattr(ws_app, "sock", None), "sock", None)
+    if _TCP_HOLD is None or sock is None:
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, _TCP_HOLD, int(enabled))
+    except OSError:
+        pass
+
+
+# Returned by _parse_market() for frames that are not valid JSON
+_INVALID = object()
+
+# Heartbeat frames, as a JSON string or bare word, in either payload type
+_PING_FRAMES = frozenset(('"ping"', 'ping', b'"ping"', b'ping'))
+_MAX_PING_LEN = max(map(len, _PING_FRAMES))
+
+
+@functools.lru_cache(maxsize=256)
+def _subscribe_frame(channel: str, symbol: Optional[str]) -> bytes:
+    """Serialized subscribe frame, built once per (channel, symbol) and reused on resubscribe"""
+    subscribe = {"channel": channel}
+    if symbol:
+        subscribe["symbol"] = symbol
+    return _json.dumps_bytes({"subscribe": subscribe})
+
+
+def extract_channel(raw: Union[bytes, str]) -> Optional[str]:
+    """
+    Get the "channel" value of a raw market stream frame without parsing it
+    
+    Scans for the first "channel" key, which is enough to route frames from
+    on_message_raw; parse the frame fully for anything beyond that.
+    
+    Args:
+        raw: Frame payload as received
+        
+    Returns:
+        Channel name, or None if the frame has no string "channel" value
+    """
+    if isinstance(raw, str):
+        key, quote, colon, blank = '"channel"', '"', ':', ' \t\r\n'
+    else:
+        key, quote, colon, blank = b'"channel"', b'"', b':', b' \t\r\n'
+    start = raw.find(key)
+    if start < 0:
+        return None
+    start += len(key)
+    open_quote = raw.find(quote, start)
+    # Only the colon and whitespace may sit between the key and its string value
+    if open_quote < 0 or raw[start:open_quote].strip(blank) != colon:
+        return None
+    end = raw.find(quote, open_quote + 1)
+    if end < 0:
+        return None
+    channel = raw[open_quote + 1:end]
+    return channel if isinstance(channel, str) else channel.decode('utf-8', errors='replace')
+
+
+def _frame_text(message) -> str:
+    """Frame payload as text, for error messages"""
+    return message.decode('utf-8', errors='replace') if isinstance(message, bytes) else message
+
+
+def _depth_book(frame: Dict) -> Tuple[Dict, Optional[str]]:
+    """
+    Locate the book and symbol of a depth_book frame
+    
+    The book may sit in the frame itself or in its "data" payload, and the
+    symbol in either place.
+    
+    Args:
+        frame: Parsed depth_book frame
+        
+    Returns:
+        Tuple of (book dict, symbol or None if the frame names none)
+    """
+    book = frame.get("data")
+    if not isinstance(book, dict) or not book:
+        book = frame
+    symbol = book.get("symbol") or frame.get("symbol")
+    return book, symbol if isinstance(symbol, str) else None
+
+
+def _signed_order_frame(
+    auth: StandXAuth,
+    session_id: str,
+    method: str,
+    params: Dict[str, Any],
+    timestamp: Optional[str] = None
+) -> Tuple[str, bytes]:
+    """
+    Build a signed order stream request frame
+    
+    Args:
+        auth: Signer holding the ed25519 key bound to the JWT
+        session_id: Session ID of the order stream
+        method: Request method (e.g. "order:new")
+        params: Request parameters
+        timestamp: Millisecond timestamp to sign with (default: current time)
+        
+    Returns:
+        Tuple of (request_id, frame bytes)
+    """
+    # Sign the exact bytes that are sent, without a second encode
+    params_bytes = _json.dumps_bytes(params)
+    headers = auth.generate_signature_headers(params_bytes, timestamp=timestamp)
+    request_id = headers["x-request-id"]
+    
+    # The envelope has fixed keys, and the header values (sign version, request
+    # id, digits, base64) and methods are JSON-safe as they are, so it is
+    # formatted directly; only the session id and the params string are escaped
+    frame = (
+        f'{{"session_id":{_json.dumps(session_id)},"request_id":"{request_id}","method":"{method}",'
+        f'"header":{{"x-request-sign-version":"{headers["x-request-sign-version"]}",'
+        f'"x-request-id":"{request_id}","x-request-timestamp":"{headers["x-request-timestamp"]}",'
+        f'"x-request-signature":"{headers["x-request-signature"]}"}},'
+        f'"params":{_json.dumps(params_bytes.decode("utf-8"))}}}'
+    )
+    return request_id, frame.encode('utf-8')
 
 
 class StandXWebSocket:
@@ -15,6 +164,7 @@ class StandXWebSocket:
     
     MARKET_STREAM_URL = "wss://perps.standx.com/ws-stream/v1"
     ORDER_RESPONSE_URL = "wss://perps.standx.com/ws-api/v1"
+    DISPATCH_BATCH_SIZE = 100  # Max frames drained per dispatch pass
     
     def __init__(
         self,
@@ -24,29 +174,62 @@ class StandXWebSocket:
         session_id: Optional[str] = None,
         on_message: Optional[Callable] = None,
         on_error: Optional[Callable] = None,
-        on_close: Optional[Callable] = None
+        on_close: Optional[Callable] = None,
+        on_open: Optional[Callable] = None,
+        threaded_dispatch: bool = False,
+        track_books: bool = False,
+        ed25519_private_key: Optional[bytes] = None,
+        on_message_raw: Optional[Callable] = None,
+        order_response_models: bool = False
     ):
         """
         Initialize WebSocket client
         
         Args:
             jwt_token: JWT token for authentication
-            api_key: API key for order response stream
-            api_secret: API secret for order response stream
+            api_key: API key (deprecated and unused; passing it emits a DeprecationWarning)
+            api_secret: API secret (deprecated and unused; passing it emits a DeprecationWarning)
             session_id: Session ID (must match HTTP client session_id)
             on_message: Callback for received messages
             on_error: Callback for errors
             on_close: Callback for connection close
+            on_open: Callback for connection open, called with the stream type
+                ("market" or "order") once the stream is connected and authenticated
+            threaded_dispatch: If True, received frames are queued and on_message runs on a
+                separate worker thread, so slow callbacks never block the socket. Market frames
+                are also parsed on that thread, leaving the receive thread to drain the socket.
+                Bursts of depth_book updates are conflated to the latest frame per symbol.
+            track_books: If True, keep the latest depth_book snapshot per subscribed symbol
+                in memory so get_book() answers without a REST round-trip
+            ed25519_private_key: ed25519 private key bytes bound to the JWT, used to sign
+                orders sent over the order stream (e.g. client.auth.ed25519_private_key)
+            on_message_raw: Callback for unparsed market stream frames (bytes), called on the
+                receive thread. When it is the only consumer (no on_message, no track_books)
+                frames are not parsed at all; use extract_channel() to route them cheaply
+            order_response_models: If True and msgspec is installed, order stream responses
+                ({code, message, request_id, ...}) are decoded straight into OrderResponse
+                models for on_message and place_order(); other frames are still dicts
         """
+        if api_key is not None or api_secret is not None:
+            warnings.warn(
+                "api_key/api_secret are not used by StandXWebSocket; streams authenticate with "
+                "jwt_token and orders are signed with ed25519_private_key",
+                DeprecationWarning,
+                stacklevel=2
+            )
         self.jwt_token = jwt_token
         self.session_id = session_id or str(uuid.uuid4())
         self.api_key = api_key
         self.api_secret = api_secret
-        self.auth = StandXAuth(api_key, api_secret) if api_key and api_secret else None
+        # Same ed25519 body signature as the REST client
+        self.auth = StandXAuth(ed25519_private_key=ed25519_private_key) if ed25519_private_key else None
         
         self.on_message_callback = on_message
+        self.on_message_raw_callback = on_message_raw
+        self._order_response_models = order_response_models
         self.on_error_callback = on_error
         self.on_close_callback = on_close
+        self.on_open_callback = on_open
         
         self.ws_market: Optional[websocket.WebSocketApp] = None
         self.ws_order: Optional[websocket.WebSocketApp] = None
@@ -55,22 +238,190 @@ class StandXWebSocket:
         
         self._last_ping_time = 0
         self._ping_interval = 10  # seconds
+        self._ping_timeout = 5  # seconds without a pong before the connection is dropped
+        self._reconnect_delay = 5  # seconds before a dropped stream is reconnected
+        
+        # stream_type -> thread running that stream's reconnect loop, and the
+        # event that ends it (set by disconnect_*())
+        self._threads: Dict[str, threading.Thread] = {}
+        self._stopped: Dict[str, threading.Event] = {"market": threading.Event(), "order": threading.Event()}
+        self._connect_lock = threading.Lock()
+        
+        # Subscribe frames sent on the market stream, replayed when it reconnects
+        self._subscriptions: Dict[bytes, None] = {}
+        
+        # request_id -> Future for order stream requests awaiting their response
+        self._pending: Dict[str, Future] = {}
+        
+        # stream_type -> outbound queue of (request_id or None, frame) tuples, drained
+        # by that stream's sender thread (started on its first send)
+        self._out: Dict[str, queue.SimpleQueue] = {}
+        self._out_lock = threading.Lock()
+        
+        # (jwt_token, serialized frame) reused by every market stream (re)authentication
+        self._market_auth_frame: Optional[Tuple[str, bytes]] = None
+        
+        # Latest (bids, asks) per symbol from depth_book frames (track_books only)
+        self._books: Optional[Dict[str, Tuple[List[List[str]], List[List[str]]]]] = {} if track_books else None
+        
+        # Receive queue drained by the dispatch worker (threaded_dispatch only):
+        # (stream_type, payload, raw) with raw market frames parsed by the worker
+        self._rx: Optional[queue.SimpleQueue] = None
+        if threaded_dispatch:
+            self._rx = queue.SimpleQueue()
+            threading.Thread(target=self._dispatch_loop, daemon=True).start()
+    
+    def _dispatch_loop(self):
+        """Parse queued market frames and deliver frames to on_message, conflating depth_book bursts"""
+        while True:
+            queued = [self._rx.get()]
+            while len(queued) < self.DISPATCH_BATCH_SIZE:
+                try:
+                    queued.append(self._rx.get_nowait())
+                except queue.Empty:
+                    break
+            
+            # Raw market frames are parsed here rather than on the receive thread
+            batch = []
+            for stream_type, data, raw in queued:
+                if raw:
+                    # A malformed frame (e.g. a bad book level) must not end the worker
+                    try:
+                        data = self._parse_market(data)
+                    except Exception as e:
+                        self._report_error(f"Market frame could not be processed: {e}")
+                        continue
+                    if data is _INVALID:
+                        continue
+                batch.append((stream_type, data))
+            if not self.on_message_callback:
+                continue
+            
+            # Keep only the newest depth_book frame per symbol within the batch;
+            # frames whose symbol cannot be resolved are never conflated
+            latest_depth = {}
+            superseded = set()
+            for i, (stream_type, data) in enumerate(batch):
+                if isinstance(data, dict) and data.get("channel") == "depth_book":
+                    symbol = _depth_book(data)[1]
+                    if symbol is not None:
+                        if symbol in latest_depth:
+                            superseded.add(latest_depth[symbol])
+                        latest_depth[symbol] = i
+            
+            for i, (stream_type, data) in enumerate(batch):
+                if i in superseded:
+                    continue
+                try:
+                    self.on_message_callback(data, stream_type)
+                except Exception as e:
+                    self._report_error(f"on_message callback failed: {e}")
+    
+    def _report_error(self, error: str):
+        """Hand an error to on_error from the dispatch worker, which must survive a failing callback"""
+        if self.on_error_callback:
+            try:
+                self.on_error_callback(error)
+            except Exception:
+                pass
+    
+    def _dispatch(self, data: Any, stream_type: str):
+        """Hand a parsed frame to on_message, directly or via the dispatch worker"""
+        if not self.on_message_callback:
+            return
+        if self._rx is not None:
+            self._rx.put_nowait((stream_type, data, False))
+        else:
+            self.on_message_callback(data, stream_type)
+    
+    def _update_book(self, frame: Dict):
+        """Store the order book carried by a depth_book frame, best levels first"""
+        book, symbol = _depth_book(frame)
+        if not symbol:
+            return
+        bids = sorted(book.get("bids") or [], key=lambda level: float(level[0]), reverse=True)
+        asks = sorted(book.get("asks") or [], key=lambda level: float(level[0]))
+        # Swap in a new tuple so readers on other threads never see a half-updated book
+        self._books[symbol] = (bids, asks)
+    
+    def get_book(
+        self,
+        symbol: str,
+        depth: Optional[int] = None
+    ) -> Optional[Tuple[List[List[str]], List[List[str]]]]:
+        """
+        Get the latest order book received for a symbol
+        
+        Requires track_books=True and a depth_book subscription for the symbol.
+        Each depth_book frame carries the full book, so the stored copy is
+        always complete and no REST snapshot is needed after a reconnect.
+        
+        Args:
+            symbol: Trading pair
+            depth: Number of levels per side (all levels if None)
+            
+        Returns:
+            Tuple of (bids, asks) as [price, qty] string pairs, best first,
+            or None if no depth_book frame has been received for the symbol yet
+            
+        Raises:
+            StandXWebSocketError: If book tracking is not enabled
+        """
+        if self._books is None:
+            raise StandXWebSocketError("Order book tracking not enabled (pass track_books=True)")
+        book = self._books.get(symbol)
+        if book is None or depth is None:
+            return book
+        bids, asks = book
+        return bids[:depth], asks[:depth]
     
     def _on_message_market(self, ws, message):
         """Handle market stream messages"""
-        try:
-            data = json.loads(message)
-            
-            # Handle ping/pong
-            if isinstance(data, str) and data == "ping":
-                ws.send("pong")
+        # Answer heartbeats before any parsing; the length check keeps large
+        # frames from being hashed for the lookup
+        if len(message) <= _MAX_PING_LEN and message in _PING_FRAMES:
+            ws.send(b"pong")
+            return
+        
+        # Each callback attribute is read once per frame; the common path then
+        # calls on_message directly instead of going through _dispatch()
+        on_message = self.on_message_callback
+        on_message_raw = self.on_message_raw_callback
+        if on_message_raw:
+            on_message_raw(message)
+            if not on_message and self._books is None:
                 return
+        
+        rx = self._rx
+        if rx is not None:
+            # With threaded dispatch the receive thread only queues the raw frame
+            rx.put_nowait(("market", message, True))
+            return
+        
+        data = self._parse_market(message)
+        if on_message and data is not _INVALID:
+            on_message(data, "market")
+    
+    def _parse_market(self, message) -> Any:
+        """
+        Parse a market frame and update the tracked order book it carries
+        
+        Args:
+            message: Raw frame payload
             
-            if self.on_message_callback:
-                self.on_message_callback(data, "market")
-        except json.JSONDecodeError:
+        Returns:
+            Parsed frame, or _INVALID (reported through on_error) if it is not JSON
+        """
+        try:
+            data = _json.loads(message)
+        except ValueError:  # JSONDecodeError, or UnicodeDecodeError from the stdlib parser
             if self.on_error_callback:
-                self.on_error_callback(f"Invalid JSON: {message}")
+                self.on_error_callback(f"Invalid JSON: {_frame_text(message)}")
+            return _INVALID
+        
+        if self._books is not None and isinstance(data, dict) and data.get("channel") == "depth_book":
+            self._update_book(data)
+        return data
     
     def _on_error_market(self, ws, error):
         """Handle market stream errors"""
@@ -85,22 +436,50 @@ class StandXWebSocket:
     
     def _on_open_market(self, ws):
         """Handle market stream open"""
+        if self._stopped["market"].is_set():
+            # Disconnected while this connection was being established
+            ws.close()
+            return
         self.connected_market = True
         
         # Authenticate if JWT token provided
         if self.jwt_token:
             self.authenticate_market()
+        
+        # After a reconnect, restore the subscriptions of the dropped connection
+        subscriptions = list(self._subscriptions)
+        if subscriptions:
+            self._queue_frames("market", tuple((None, frame) for frame in subscriptions))
+        
+        if self.on_open_callback:
+            self.on_open_callback("market")
     
     def _on_message_order(self, ws, message):
         """Handle order response stream messages"""
+        if self._order_response_models:
+            response = decode_order_response(message)
+            if response is not None:
+                self._complete_pending(response.request_id, response)
+                self._dispatch(response, "order")
+                return
+        
         try:
-            data = json.loads(message)
+            data = _json.loads(message)
             
-            if self.on_message_callback:
-                self.on_message_callback(data, "order")
-        except json.JSONDecodeError:
+            if isinstance(data, dict):
+                self._complete_pending(data.get("request_id"), data)
+            
+            self._dispatch(data, "order")
+        except _json.JSONDecodeError:
             if self.on_error_callback:
-                self.on_error_callback(f"Invalid JSON: {message}")
+                self.on_error_callback(f"Invalid JSON: {_frame_text(message)}")
+    
+    def _complete_pending(self, request_id: Optional[str], response: Any):
+        """Complete the Future of a place_order() call waiting on this response"""
+        if self._pending:
+            future = self._pending.pop(request_id, None)
+            if future is not None:
+                future.set_result(response)
     
     def _on_error_order(self, ws, error):
         """Handle order response stream errors"""
@@ -110,50 +489,115 @@ class StandXWebSocket:
     def _on_close_order(self, ws, close_status_code, close_msg):
         """Handle order response stream close"""
         self.connected_order = False
+        self._fail_pending("Order stream closed before a response was received")
         if self.on_close_callback:
             self.on_close_callback("order", close_status_code, close_msg)
     
+    def _fail_pending(self, message: str):
+        """Fail requests that can no longer be answered"""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(StandXWebSocketError(message))
+    
     def _on_open_order(self, ws):
         """Handle order response stream open"""
+        if self._stopped["order"].is_set():
+            # Disconnected while this connection was being established
+            ws.close()
+            return
         self.connected_order = True
         
         # Authenticate if JWT token provided
         if self.jwt_token:
             self.authenticate_order()
+        
+        if self.on_open_callback:
+            self.on_open_callback("order")
+    
+    def _run_options(self) -> Dict[str, Any]:
+        """Keyword arguments for WebSocketApp.run_forever()"""
+        # Protocol-level keepalive pings detect a dead connection within
+        # ping_interval + ping_timeout instead of waiting on TCP timeouts
+        return {**_RUN_OPTIONS, "ping_interval": self._ping_interval, "ping_timeout": self._ping_timeout}
+    
+    def _run_stream(self, stream_type: str, ws_app: websocket.WebSocketApp, stopped: threading.Event):
+        """Run a stream until it is disconnected, reconnecting after each drop"""
+        # run_forever() is used without its own reconnect option: that option
+        # fires neither on_error nor on_close on a drop, which would leave the
+        # connected flags set and pending requests waiting. Here every drop
+        # goes through on_close before the next attempt.
+        while not stopped.is_set():
+            ws_app.run_forever(**self._run_options())
+            if stopped.wait(self._reconnect_delay):
+                break
+    
+    def _start_stream(self, stream_type: str, ws_app: websocket.WebSocketApp):
+        """Start a stream's thread, unless it is already running and not being disconnected"""
+        with self._connect_lock:
+            stopped = self._stopped[stream_type]
+            thread = self._threads.get(stream_type)
+            if thread is not None and thread.is_alive():
+                if not stopped.is_set():
+                    return
+                # Still shutting down after a disconnect: websocket-client notices the
+                # closed socket within one ping_timeout, so wait for that before restarting
+                thread.join(self._ping_timeout + 5)
+                if thread.is_alive():
+                    raise StandXWebSocketError(f"{stream_type.capitalize()} stream is still shutting down")
+            stopped.clear()
+            thread = threading.Thread(target=self._run_stream, args=(stream_type, ws_app, stopped), daemon=True)
+            self._threads[stream_type] = thread
+            thread.start()
+    
+    def _stop_stream(self, stream_type: str, ws_app: websocket.WebSocketApp):
+        """Stop a stream's reconnect loop and close it; its thread exits shortly after"""
+        self._stopped[stream_type].set()
+        ws_app.close()
     
     def connect_market_stream(self):
-        """Connect to market data stream"""
-        if self.ws_market and self.connected_market:
-            return
+        """
+        Connect to market data stream
         
-        self.ws_market = websocket.WebSocketApp(
-            self.MARKET_STREAM_URL,
-            on_message=self._on_message_market,
-            on_error=self._on_error_market,
-            on_close=self._on_close_market,
-            on_open=self._on_open_market
-        )
+        The stream runs on one thread until disconnect_market(). After a drop,
+        on_error and on_close fire, and the stream reconnects after 5 seconds,
+        re-authenticating and restoring its subscriptions (on_open fires again).
+        Calling this again while the stream runs is a no-op.
         
-        # Run in separate thread
-        thread = threading.Thread(target=self.ws_market.run_forever, daemon=True)
-        thread.start()
+        Raises:
+            StandXWebSocketError: If a previous disconnect has not finished yet
+        """
+        if self.ws_market is None:
+            self.ws_market = websocket.WebSocketApp(
+                self.MARKET_STREAM_URL,
+                on_message=self._on_message_market,
+                on_error=self._on_error_market,
+                on_close=self._on_close_market,
+                on_open=self._on_open_market
+            )
+        self._start_stream("market", self.ws_market)
     
     def connect_order_stream(self):
-        """Connect to order response stream"""
-        if self.ws_order and self.connected_order:
-            return
+        """
+        Connect to order response stream
         
-        self.ws_order = websocket.WebSocketApp(
-            self.ORDER_RESPONSE_URL,
-            on_message=self._on_message_order,
-            on_error=self._on_error_order,
-            on_close=self._on_close_order,
-            on_open=self._on_open_order
-        )
+        The stream runs on one thread until disconnect_order(). After a drop,
+        on_error and on_close fire (pending place_order() calls fail), and the
+        stream reconnects after 5 seconds and re-authenticates (on_open fires
+        again). Calling this again while the stream runs is a no-op.
         
-        # Run in separate thread
-        thread = threading.Thread(target=self.ws_order.run_forever, daemon=True)
-        thread.start()
+        Raises:
+            StandXWebSocketError: If a previous disconnect has not finished yet
+        """
+        if self.ws_order is None:
+            self.ws_order = websocket.WebSocketApp(
+                self.ORDER_RESPONSE_URL,
+                on_message=self._on_message_order,
+                on_error=self._on_error_order,
+                on_close=self._on_close_order,
+                on_open=self._on_open_order
+            )
+        self._start_stream("order", self.ws_order)
     
     def authenticate_market(self, streams: Optional[List[Dict]] = None):
         """
@@ -165,31 +609,31 @@ class StandXWebSocket:
         if not self.jwt_token or not self.ws_market:
             return
         
-        auth_msg = {
-            "auth": {
-                "token": self.jwt_token
-            }
-        }
-        
         if streams:
-            auth_msg["auth"]["streams"] = streams
+            self.ws_market.send(_json.dumps_bytes({"auth": {"token": self.jwt_token, "streams": streams}}))
+            return
         
-        self.ws_market.send(json.dumps(auth_msg))
+        # The plain auth frame only depends on the token; serialize it once per token
+        cached = self._market_auth_frame
+        if cached is None or cached[0] != self.jwt_token:
+            cached = self._market_auth_frame = (self.jwt_token, _json.dumps_bytes({"auth": {"token": self.jwt_token}}))
+        self.ws_market.send(cached[1])
     
     def authenticate_order(self):
         """Authenticate order response stream with JWT"""
         if not self.jwt_token or not self.ws_order:
             return
         
-        request_id = str(uuid.uuid4())
+        # Same counter-based ids as signed requests when a key is configured
+        request_id = self.auth.next_request_id() if self.auth else str(uuid.uuid4())
         auth_msg = {
             "session_id": self.session_id,
             "request_id": request_id,
             "method": "auth:login",
-            "params": json.dumps({"token": self.jwt_token})
+            "params": _json.dumps({"token": self.jwt_token})
         }
         
-        self.ws_order.send(json.dumps(auth_msg))
+        self.ws_order.send(_json.dumps_bytes(auth_msg))
     
     def subscribe(
         self,
@@ -199,23 +643,151 @@ class StandXWebSocket:
         """
         Subscribe to a market stream channel
         
+        The frame is queued for the market sender thread, which writes each
+        burst of queued subscriptions in one go, so a watchlist update made of
+        many subscribe() calls does not cost one socket write per call.
+        Send failures are reported through on_error.
+        
         Args:
             channel: Channel name (price, depth_book, order, position, balance, trade)
             symbol: Symbol for symbol-specific channels (optional)
         """
+        self._check_market_stream()
+        frame = _subscribe_frame(channel, symbol or None)
+        self._subscriptions[frame] = None
+        self._queue_frames("market", ((None, frame),))
+    
+    def subscribe_many(self, subscriptions: List[Tuple[str, Optional[str]]]):
+        """
+        Subscribe to several market stream channels in one burst
+        
+        The stream accepts one channel per subscribe message, so the frames
+        are written back to back while the socket holds partial TCP segments
+        and leave in as few packets as possible.
+        
+        Args:
+            subscriptions: (channel, symbol) pairs; symbol may be None for
+                channels that are not symbol-specific
+        """
+        self._check_market_stream()
+        frames = [_subscribe_frame(channel, symbol or None) for channel, symbol in subscriptions]
+        self._subscriptions.update(dict.fromkeys(frames))
+        self._queue_frames("market", tuple((None, frame) for frame in frames))
+    
+    def _check_market_stream(self):
+        """Raise unless the market stream is connected"""
         if not self.ws_market or not self.connected_market:
             raise StandXWebSocketError("Market stream not connected")
+    
+    def _queue_frames(self, stream_type: str, items: Tuple[Tuple[Optional[str], bytes], ...]):
+        """
+        Queue frames for a stream's sender thread, starting it on first use
         
-        subscribe_msg = {
-            "subscribe": {
-                "channel": channel
-            }
-        }
+        Callers return as soon as the frames are queued; a stalled socket only
+        holds up the sender thread.
+        
+        Args:
+            stream_type: "market" or "order"
+            items: (request_id or None, frame) tuples, sent together and in order
+        """
+        out = self._out.get(stream_type)
+        if out is None:
+            with self._out_lock:
+                out = self._out.get(stream_type)
+                if out is None:
+                    out = self._out[stream_type] = queue.SimpleQueue()
+                    threading.Thread(target=self._sender_loop, args=(stream_type, out), daemon=True).start()
+        out.put_nowait(items)
+    
+    def _sender_loop(self, stream_type: str, out: queue.SimpleQueue):
+        """Send queued frames of a stream, merging everything queued so far into one corked burst"""
+        while True:
+            items = list(out.get())
+            while True:
+                try:
+                    items.extend(out.get_nowait())
+                except queue.Empty:
+                    break
+            # A frame queued twice within a burst (e.g. a repeated subscribe) is sent once
+            items = list(dict.fromkeys(items))
+            
+            if stream_type == "market":
+                ws, connected = self.ws_market, self.connected_market
+            else:
+                ws, connected = self.ws_order, self.connected_order
+            if ws is None or not connected:
+                self._send_failed(stream_type, items, "not connected")
+                continue
+            
+            # A lone frame (typically one order) goes out at once; only a
+            # burst is worth holding back partial segments for
+            hold = len(items) > 1
+            sent = 0
+            if hold:
+                _set_tcp_hold(ws, True)
+            try:
+                for _, frame in items:
+                    ws.send(frame)
+                    sent += 1
+            except Exception as e:
+                self._send_failed(stream_type, items[sent:], e)
+            finally:
+                if hold:
+                    _set_tcp_hold(ws, False)
+    
+    def _send_failed(self, stream_type: str, items: List[Tuple[Optional[str], bytes]], error: Any):
+        """Report frames that could not be sent and fail the requests waiting on them"""
+        for request_id, _ in items:
+            future = self._pending.pop(request_id, None) if request_id is not None else None
+            if future is not None and not future.done():
+                future.set_exception(StandXWebSocketError(f"Order stream send failed: {error}"))
+        if self.on_error_callback:
+            self.on_error_callback(f"{stream_type.capitalize()} stream error: {len(items)} frame(s) not sent: {error}")
+    
+    def _send_signed(self, method: str, params: Dict[str, Any], track: bool = False):
+        """
+        Sign params with ed25519 and queue them as an order stream request
+        
+        The frame is written by the order sender thread, so the caller never
+        blocks on a congested socket. Send failures are reported through
+        on_error and fail the tracked Future.
+        
+        Args:
+            method: Request method (e.g. "order:new")
+            params: Request parameters
+            track: If True, register a Future completed by the matching response
+            
+        Returns:
+            Tuple of (request_id, Future or None)
+        """
+        self._check_signed_stream()
+        request_id, frame = self._signed_frame(method, params)
+        
+        future = None
+        if track:
+            # Register before sending so a fast response cannot be missed
+            future = Future()
+            self._pending[request_id] = future
         
-        if symbol:
-            subscribe_msg["subscribe"]["symbol"] = symbol
+        self._queue_frames("order", ((request_id, frame),))
+        return request_id, future
+    
+    def _check_signed_stream(self):
+        """Raise unless signed requests can be sent on the order stream"""
+        if not self.ws_order or not self.connected_order:
+            raise StandXWebSocketError("Order stream not connected")
         
-        self.ws_market.send(json.dumps(subscribe_msg))
+        if not self.auth:
+            raise StandXWebSocketError("ed25519_private_key required for signed order stream requests")
+    
+    def _signed_frame(
+        self,
+        method: str,
+        params: Dict[str, Any],
+        timestamp: Optional[str] = None
+    ) -> Tuple[str, bytes]:
+        """Build a signed order stream request frame (see _signed_order_frame)"""
+        return _signed_order_frame(self.auth, self.session_id, method, params, timestamp)
     
     def create_order_ws(
         self,
@@ -238,14 +810,62 @@ class StandXWebSocket:
             time_in_force: Time in force
             price: Order price (for limit orders)
             **kwargs: Additional order parameters
+            
+        Returns:
+            Request ID; the response arrives on the order stream's on_message
+            (send failures are reported through on_error)
         """
-        if not self.ws_order or not self.connected_order:
-            raise StandXWebSocketError("Order stream not connected")
+        params = {
+            "symbol": symbol,
+            "side": side,
+            "order_type": order_type,
+            "qty": qty,
+            "time_in_force": time_in_force,
+            **kwargs
+        }
         
-        if not self.auth:
-            raise StandXWebSocketError("API credentials required for order creation")
+        if price:
+            params["price"] = price
         
-        request_id = str(uuid.uuid4())
+        request_id, _ = self._send_signed("order:new", params)
+        return request_id
+    
+    def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        qty: str,
+        time_in_force: str,
+        price: Optional[str] = None,
+        timeout: float = 10,
+        **kwargs
+    ) -> Union[Dict[str, Any], OrderResponse]:
+        """
+        Create order via WebSocket and wait for its response
+        
+        The order goes over the already authenticated order stream, so it
+        skips the per-request HTTP framing of create_order() and the reply
+        is matched by request_id instead of polling.
+        
+        Args:
+            symbol: Trading pair
+            side: Order side (buy/sell)
+            order_type: Order type (limit/market)
+            qty: Order quantity
+            time_in_force: Time in force
+            price: Order price (for limit orders)
+            timeout: Seconds to wait for the response
+            **kwargs: Additional order parameters
+            
+        Returns:
+            Response frame from the order stream (code 0 on success); an OrderResponse
+            with order_response_models=True and msgspec installed, else a dict
+            
+        Raises:
+            StandXWebSocketError: If the stream is not connected or closes before responding
+            TimeoutError: If no response arrives within timeout
+        """
         params = {
             "symbol": symbol,
             "side": side,
@@ -258,35 +878,42 @@ class StandXWebSocket:
         if price:
             params["price"] = price
         
-        params_str = json.dumps(params)
-        timestamp = str(int(time.time() * 1000))
-        
-        # Generate signature
-        import hmac
-        import hashlib
-        import base64
-        message = params_str + timestamp
-        sig = hmac.new(
-            self.auth.api_secret.encode('utf-8'),
-            message.encode('utf-8'),
-            hashlib.sha256
-        ).digest()
-        signature_b64 = base64.b64encode(sig).decode('utf-8')
-        
-        order_msg = {
-            "session_id": self.session_id,
-            "request_id": request_id,
-            "method": "order:new",
-            "header": {
-                "x-request-id": request_id,
-                "x-request-timestamp": timestamp,
-                "x-request-signature": signature_b64
-            },
-            "params": params_str
-        }
+        request_id, future = self._send_signed("order:new", params, track=True)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            # concurrent.futures.TimeoutError is only the builtin from Python 3.11 on
+            raise TimeoutError(f"No response to order {request_id} within {timeout}s") from None
+        finally:
+            self._pending.pop(request_id, None)
+    
+    def create_orders_ws(self, orders: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create several orders via WebSocket in one burst
         
-        self.ws_order.send(json.dumps(order_msg))
-        return request_id
+        All frames are signed first and then written back to back by the order
+        sender thread while the socket holds partial TCP segments (TCP_CORK on Linux, TCP_NOPUSH on
+        FreeBSD), so a burst leaves in as few packets as possible instead of
+        one per order.
+        
+        Args:
+            orders: Order parameter dicts, each with the keys accepted by
+                create_order_ws() (symbol, side, order_type, qty, time_in_force,
+                price, ...)
+            
+        Returns:
+            Request IDs in the order given; responses arrive on the order stream's on_message
+        """
+        self._check_signed_stream()
+        # One timestamp for the whole burst; the exchange only checks its freshness
+        timestamp = str(time.time_ns() // 1_000_000)
+        frames = [
+            self._signed_frame("order:new", {k: v for k, v in order.items() if v is not None}, timestamp)
+            for order in orders
+        ]
+        
+        self._queue_frames("order", tuple(frames))
+        return [request_id for request_id, _ in frames]
     
     def cancel_order_ws(
         self,
@@ -299,60 +926,31 @@ class StandXWebSocket:
         Args:
             order_id: Order ID
             cl_ord_id: Client order ID
+            
+        Returns:
+            Request ID; the response arrives on the order stream's on_message
+            (send failures are reported through on_error)
         """
-        if not self.ws_order or not self.connected_order:
-            raise StandXWebSocketError("Order stream not connected")
-        
-        if not self.auth:
-            raise StandXWebSocketError("API credentials required")
-        
-        request_id = str(uuid.uuid4())
         params = {}
         if order_id:
             params["order_id"] = order_id
         if cl_ord_id:
             params["cl_ord_id"] = cl_ord_id
         
-        params_str = json.dumps(params)
-        timestamp = str(int(time.time() * 1000))
-        
-        # Generate signature
-        import hmac
-        import hashlib
-        import base64
-        message = params_str + timestamp
-        sig = hmac.new(
-            self.auth.api_secret.encode('utf-8'),
-            message.encode('utf-8'),
-            hashlib.sha256
-        ).digest()
-        signature_b64 = base64.b64encode(sig).decode('utf-8')
-        
-        cancel_msg = {
-            "session_id": self.session_id,
-            "request_id": request_id,
-            "method": "order:cancel",
-            "header": {
-                "x-request-id": request_id,
-                "x-request-timestamp": timestamp,
-                "x-request-signature": signature_b64
-            },
-            "params": params_str
-        }
-        
-        self.ws_order.send(json.dumps(cancel_msg))
+        request_id, _ = self._send_signed("order:cancel", params)
         return request_id
     
     def disconnect_market(self):
-        """Disconnect market stream"""
+        """Disconnect market stream, stopping automatic reconnects"""
         if self.ws_market:
-            self.ws_market.close()
+            self._stop_stream("market", self.ws_market)
             self.connected_market = False
+            self._subscriptions.clear()
     
     def disconnect_order(self):
-        """Disconnect order stream"""
+        """Disconnect order stream, stopping automatic reconnects"""
         if self.ws_order:
-            self.ws_order.close()
+            self._stop_stream("order", self.ws_order)
             self.connected_order = False
     
     def disconnect_all(self):